@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+
+r"""
+usage: bench.py [-h] [--size SIZE] [--repeat N] [--only WORD] [--history PATH]
+
+time each Pipe Verb of XShVerb, and the Classic Shell Pipe comparable to it
+
+options:
+  -h, --help      show this help message and exit
+  --size SIZE     Bytes of each Corpus, such as 1M or 1M,100M,1G (default: 1M)
+  --repeat N      run each Pipe N times, and keep the fastest (default: 3)
+  --only WORD     run only the Cases whose Name contains this Word (default: run all)
+  --history PATH  add one Line of Json per Run here (default: __pycache__/bench.jsonl)
+
+quirks:
+  makes the same Corpora every time, and keeps them in __pycache__/bench/ to reuse
+  makes Corpora of log-like, word-like, numeric, and wide-Unicode Lines, and Json Lines for |jq
+  times every Verb of FUNC_BY_VERB that works as a Pipe Filter, and skips the Interactive Verbs
+  shows how much faster or slower each Case ran than it did in the last Run of the History
+  times the Zip App too, when built by:  make pyz
+  runs each Pipe in a Temp Dir, to drop the __pycache__/ Copies of the Output that XShVerb leaves
+  shows a Pipe as failed, not timed, when it exits nonzero, such as 1 for a Python Traceback
+  lets only diff and grep exit 1, for Diffs found or No Lines found
+  exits 2, unless Stderr is a Terminal, as XShVerb needs
+
+examples:
+  make bench
+  bin/bench.py --only sort
+  bin/bench.py --size 1M,100M,1G --repeat 1
+"""
+
+# code reviewed by People, Black, Flake8, MyPy-Strict, & PyLance-Standard
+
+
+from __future__ import annotations  # backports new datatype syntaxes into old Pythons
+
+import argparse
+import ast
+import dataclasses
+import datetime as dt
+import json
+import os
+import pathlib
+import random
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+if not __debug__:
+    raise NotImplementedError([__debug__])  # refuses to run without live Asserts
+
+
+#
+# Name a few things
+#
+
+
+BinPath = pathlib.Path(__file__).resolve().parent  # the Folder of bin/pq, bin/xshverb.py, etc
+
+CorporaPathname = "__pycache__/bench"  # keeps the Corpora, to reuse
+HistoryPathname = "__pycache__/bench.jsonl"  # keeps one Line of Json per Run
+PyzPathname = "__pycache__/xshverb.pyz"  # keeps the Zip App of bin/pyz.py
+
+PassingReturncodes = (0, 128 + signal.SIGPIPE)  # Head quit early
+DiffGrepReturncodes = (0, 1, 128 + signal.SIGPIPE)  # Diffs found, No Lines found, Head quit early
+
+
+@dataclasses.dataclass
+class BenchCase:
+    """Name a Pipe of XShVerb, and the Classic Shell Pipe comparable to it"""
+
+    name: str  # 'sort -nr'
+    xshline: str  # 's -nr'  # runs as Args of bin/pq, with Stdin from the Corpus
+    shline: str  # 'LC_ALL=C sort -nr'  # empty when nothing Classic compares
+    kinds: tuple[str, ...] = ("log", "words", "numbers", "wide")
+    returncodes: tuple[int, ...] = PassingReturncodes  # not 1, which an uncaught Exception exits
+
+
+BenchCases = [
+    BenchCase("awk", "a 1 -1", "awk '{ print $1, $NF }'"),
+    BenchCase("cat", "c", "cat -"),
+    BenchCase("column", "column", "column -t"),
+    BenchCase("column --sample", "column --sample 1000", "column -t"),
+    BenchCase("counter", "u", "awk '{d[$0]++}END{for(k in d){print d[k],k}}'"),
+    BenchCase("dedent", "dedent", ""),
+    BenchCase("dent", "dent", "sed 's,^,    ,'"),
+    BenchCase(
+        "diff",
+        "d {corpus} {edited}",
+        "diff -brpu {corpus} {edited}",
+        returncodes=DiffGrepReturncodes,
+    ),
+    BenchCase("expand", "expand", "expand"),
+    BenchCase("grep", "g e", "grep -F -i -e e", returncodes=DiffGrepReturncodes),
+    BenchCase("head", "h", "head -10"),
+    BenchCase("ht", "ht", "sed -n -e '1,3p;$p'"),
+    BenchCase("jq", "j --lines", "python3 -m json.tool --json-lines", kinds=("jsonl",)),
+    BenchCase("jq PATH", "j .name", "jq .name", kinds=("jsonl",)),
+    BenchCase("lower", "lower", "tr A-Z a-z"),
+    BenchCase("lstrip", "lstrip", "sed 's,^  *,,'"),
+    BenchCase("nl", "n", "nl -v0"),
+    BenchCase("reverse", "r", "tac"),
+    BenchCase("rstrip", "rstrip", "sed 's,  *$,,'"),
+    BenchCase("set", "set", "sed 's,.,&\\n,g' |LC_ALL=C sort |uniq |xargs |sed 's, ,,g'"),
+    BenchCase("sort", "s", "LC_ALL=C sort"),
+    BenchCase("sort -nr", "s -nr", "LC_ALL=C sort -nr", kinds=("numbers",)),
+    BenchCase("split", "i", "tr ' \\t' '\\n' |grep ."),
+    BenchCase("startup", "--version", "python3 -c pass", kinds=("log",)),
+    BenchCase("strip", "o", "sed 's,^  *,,' |sed 's,  *$,,'"),
+    BenchCase("tail", "t", "tail -10"),
+    BenchCase("title", "title", ""),
+    BenchCase("upper", "upper", "tr a-z A-Z"),
+    BenchCase("wcl", "w", "wc -l"),
+    BenchCase("xargs", "x", "xargs"),
+    BenchCase("xshverb", "", ""),
+    BenchCase(
+        "i u s -nr h",
+        "i u s -nr h",
+        "tr ' \\t' '\\n' |grep . |LC_ALL=C sort |uniq -c |LC_ALL=C sort -nr |head",
+    ),
+    BenchCase("a 1 u s -nr h", "a 1 u s -nr h", "awk '{print $1}' |sort |uniq -c |sort -nr |head"),
+]
+
+SkippedVerbs = dict(
+    dot="edits Web Addresses found in the Os Copy/Paste Buffer",
+    dt="times other Shell Commands",
+    emacs="calls up an Interactive Editor",
+    less="calls up an Interactive Pager",
+    python="calls up the Interactive Python Repl",
+    turtling="calls up an Interactive Game",
+    urllib="splits one Web Address",
+    vi="calls up an Interactive Editor",
+    watch="runs till ⌃C, to show each Change",
+)
+
+
+#
+# Run from the Shell Command Line
+#
+
+
+def main() -> None:
+    """Run from the Shell Command Line"""
+
+    ns = parse_bench_args()
+
+    bench_verbs_check()
+
+    sizes = list(size_parse(_) for _ in ns.size.split(","))
+    cases = list(_ for _ in BenchCases if (not ns.only) or (ns.only in _.name))
+
+    # Time each Case against each Corpus
+
+    history_path = pathlib.Path(ns.history)
+    was_by_key = history_read_last(history_path)
+
+    results: list[dict[str, object]] = list()
+    for size in sizes:
+        for case in cases:
+            for kind in case.kinds:
+                corpus_path = corpus_make_if(kind, size=size)
+                result = bench_case(case, corpus_path=corpus_path, repeat=ns.repeat)
+                result.update(kind=kind, size=size)
+                results.append(result)
+
+                key = f"{case.name} {kind} {size}"
+                print(bench_result_format(result, was=was_by_key.get(key)), flush=True)
+
+    # Add one Line of Json to the History
+
+    run: dict[str, object] = dict(when=dt.datetime.now().astimezone().isoformat())
+    run.update(commit=git_describe(), python=sys.version.split()[0], platform=sys.platform)
+    run["results"] = results
+
+    history_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
+    with history_path.open("a") as appender:
+        appender.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def parse_bench_args() -> argparse.Namespace:
+    """Take in the Shell Command-Line Args"""
+
+    doc = __doc__
+    assert doc, (doc,)
+
+    lines = doc.strip().splitlines()
+    description = lines[2]
+    epilog = doc[doc.index("quirks:") :]
+
+    parser = argparse.ArgumentParser(
+        prog="bench.py",
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    size_help = "Bytes of each Corpus, such as 1M or 1M,100M,1G (default: 1M)"
+    repeat_help = "run each Pipe N times, and keep the fastest (default: 3)"
+    only_help = "run only the Cases whose Name contains this Word (default: run all)"
+    history_help = f"add one Line of Json per Run here (default: {HistoryPathname})"
+
+    parser.add_argument("--size", metavar="SIZE", default="1M", help=size_help)
+    parser.add_argument("--repeat", metavar="N", type=int, default=3, help=repeat_help)
+    parser.add_argument("--only", metavar="WORD", default="", help=only_help)
+    parser.add_argument("--history", metavar="PATH", default=HistoryPathname, help=history_help)
+
+    ns = parser.parse_args()
+    if ns.repeat < 1:
+        parser.error("--repeat needs N >= 1")
+    if not sys.stderr.isatty():
+        parser.error("needs Stderr to be a Terminal, as XShVerb does")  # exits 2
+
+    return ns
+
+
+def bench_verbs_check() -> None:
+    """Require a Case, or a Reason to skip, for each Verb of FUNC_BY_VERB"""
+
+    source = (BinPath / "xshverb.py").read_text()
+    module = ast.parse(source)
+
+    verbs: list[str] = list()
+    for node in module.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            names = list(_.id for _ in node.targets if isinstance(_, ast.Name))
+            if names == ["FUNC_BY_VERB"]:
+                verbs.extend(str(_.arg) for _ in node.value.keywords)
+
+    assert verbs, ("FUNC_BY_VERB not found",)
+
+    case_names = set(_.name for _ in BenchCases)
+    missing = list(_ for _ in verbs if (_ not in case_names) and (_ not in SkippedVerbs))
+    assert not missing, (missing,)
+
+
+#
+# Make the same Corpora every time
+#
+
+
+def size_parse(text: str) -> int:
+    """Convert '100M' to 100 * 1024 * 1024"""
+
+    suffixes = " KMGT"
+
+    upper = text.strip().upper()
+    suffix = upper[-1:] if upper[-1:] in suffixes[1:] else ""
+    digits = upper[: len(upper) - len(suffix)]
+
+    count = int(digits) << (10 * suffixes.index(suffix or " "))
+
+    return count
+
+
+def corpus_make_if(kind: str, size: int) -> pathlib.Path:
+    """Make a Corpus of about SIZE Bytes of one Kind of Lines, else find it made already"""
+
+    path = pathlib.Path(CorporaPathname) / f"{kind}-{size}.txt"
+    edited_path = path.with_suffix(".edited.txt")
+    if path.exists() and edited_path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(f"{kind}-{size}")  # makes the same Corpus every time
+    line_func = CorpusLineFuncByKind[kind]
+
+    # Write Lines till the Corpus grows as large as asked, and edit every 1000th Line
+
+    count = 0
+    with path.open("w") as writer:
+        with edited_path.open("w") as edited_writer:
+            index = 0
+            while count < size:
+                line = line_func(rng, index)
+                writer.write(line + "\n")
+                edited_writer.write((line + " edited" if (index % 1000 == 999) else line) + "\n")
+                count += len(line.encode()) + 1
+                index += 1
+
+    return path
+
+
+Words = (
+    "the of and to in is it you that he was for on are with as his they be at one have this"
+    " from or had by hot word but what some we can out other were all there when up use your"
+    " how said an each she which do their time if will way about many then them write would"
+).split()
+
+WideWords = "日本語 中文 한국어 Ελληνικά Русский עברית العربية ★ ✓ 😀 🐍 café naïve Über".split()
+
+
+def corpus_log_line(rng: random.Random, index: int) -> str:
+    """Make a Line much like a Web Server Log"""
+
+    t = dt.datetime(2025, 6, 1) + dt.timedelta(milliseconds=137 * index)
+    level = rng.choices(["INFO", "WARN", "ERROR"], weights=[90, 8, 2])[0]
+    method = rng.choice(["GET", "GET", "GET", "POST", "PUT", "DELETE"])
+    status = rng.choices([200, 201, 304, 404, 500], weights=[80, 5, 10, 4, 1])[0]
+
+    line = f"{t:%Y-%m-%d %H:%M:%S.%f} {level:5} pid={rng.randrange(1000, 9999)}"
+    line += f" {method} /api/{rng.choice(Words)}/{rng.randrange(10000)} {status}"
+    line += f" {rng.randrange(1, 2000)}ms"
+
+    return line
+
+
+def corpus_words_line(rng: random.Random, index: int) -> str:
+    """Make a Line of Words, with the most common Words chosen most often"""
+
+    weights = list(1 / (_ + 1) for _ in range(len(Words)))  # a Zipf-ish Law
+    words = rng.choices(Words, weights=weights, k=rng.randrange(1, 16))
+
+    return " ".join(words)
+
+
+def corpus_numbers_line(rng: random.Random, index: int) -> str:
+    """Make a Line that starts with an Int or a Float, or else not with a Number"""
+
+    choice = rng.randrange(10)
+    if choice < 5:
+        return f"{rng.randrange(-100000, 100000)} {rng.choice(Words)}"
+    if choice < 9:
+        return f"{rng.uniform(-1e6, 1e6):.6g} {rng.choice(Words)}"
+
+    return rng.choice(Words)
+
+
+def corpus_wide_line(rng: random.Random, index: int) -> str:
+    """Make a Line of Wide Unicode Chars, with Blanks between, and Blanks to strip"""
+
+    words = rng.choices(WideWords, k=rng.randrange(1, 12))
+    line = " ".join(words)
+
+    return (" " * rng.randrange(4)) + line + (" " * rng.randrange(2))
+
+
+def corpus_jsonl_line(rng: random.Random, index: int) -> str:
+    """Make a Line of Json, much like a Record of an Api Dump"""
+
+    tags = rng.choices(Words, k=rng.randrange(4))
+    record = dict(id=index, name=rng.choice(Words), score=rng.random(), tags=tags)
+
+    return json.dumps(record)
+
+
+CorpusLineFuncByKind = dict(
+    log=corpus_log_line,
+    words=corpus_words_line,
+    numbers=corpus_numbers_line,
+    wide=corpus_wide_line,
+    jsonl=corpus_jsonl_line,
+)
+
+
+#
+# Time each Case
+#
+
+
+def bench_case(case: BenchCase, corpus_path: pathlib.Path, repeat: int) -> dict[str, object]:
+    """Time the XShVerb Pipe and the Classic Pipe, and keep the fastest of N Runs of each"""
+
+    corpus = os.fspath(corpus_path.resolve())
+    edited = os.fspath(corpus_path.with_suffix(".edited.txt").resolve())
+
+    xshline = os.fspath(BinPath / "pq") + " " + case.xshline
+    xshline = xshline.replace("{corpus}", corpus).replace("{edited}", edited)
+    shline = case.shline.replace("{corpus}", corpus).replace("{edited}", edited)
+
+    returncodes = case.returncodes
+
+    result: dict[str, object] = dict(name=case.name)
+    result["xshverb"] = shline_time(xshline, corpus_path, repeat=repeat, returncodes=returncodes)
+    result["classic"] = shline_time(shline, corpus_path, repeat=repeat, returncodes=returncodes)
+
+    pyz_path = pathlib.Path(PyzPathname)
+    if pyz_path.exists():
+        pyzline = os.fspath(pyz_path.resolve()) + " " + case.xshline
+        pyzline = pyzline.replace("{corpus}", corpus).replace("{edited}", edited)
+        result["pyz"] = shline_time(pyzline, corpus_path, repeat=repeat, returncodes=returncodes)
+
+    return result
+
+
+def shline_time(
+    shline: str, corpus_path: pathlib.Path, repeat: int, returncodes: tuple[int, ...]
+) -> dict[str, float] | None:
+    """Run a Shell Pipe N times, and keep the Wall & CPU Seconds of the fastest Run"""
+
+    if not shline:
+        return None
+
+    best: dict[str, float] | None = None
+    for _ in range(repeat):
+        # Land the __pycache__/ Copies of the Output in a Temp Dir, and delete them after each Run
+
+        with tempfile.TemporaryDirectory(dir=corpus_path.parent) as cwd:
+            with corpus_path.open("rb") as reader:
+                ru0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+                t0 = time.perf_counter()
+
+                argv = ["bash", "-c", "set -o pipefail; " + shline]
+                run = subprocess.run(argv, stdin=reader, stdout=subprocess.DEVNULL, cwd=cwd)
+
+                t1 = time.perf_counter()
+                ru1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        cpu = (ru1.ru_utime - ru0.ru_utime) + (ru1.ru_stime - ru0.ru_stime)
+        failed = run.returncode not in returncodes
+        seconds = dict(wall=round(t1 - t0, 6), cpu=round(cpu, 6), returncode=run.returncode)
+        seconds["failed"] = failed
+        if failed:
+            return seconds  # doesn't run again, after failing once
+
+        if (best is None) or (seconds["wall"] < best["wall"]):
+            best = seconds
+
+    return best  # notes a nonzero Exit, such as 'diff -brpu' exits 1 when Files differ
+
+
+def seconds_failed(seconds: object) -> bool:
+    """Say if a Pipe failed, such as with 1 for a Python Traceback, rather than got timed"""
+
+    if not isinstance(seconds, dict):
+        return False
+
+    failed = bool(seconds.get("failed", False))  # False for the History from before 'failed'
+
+    return failed
+
+
+def bench_result_format(result: dict[str, object], was: dict[str, object] | None) -> str:
+    """Form one Line of Results"""
+
+    xsh = result["xshverb"]
+    classic = result["classic"]
+    assert isinstance(xsh, dict), (xsh,)
+
+    name = f"{result['name']} <{result['kind']}-{result['size']}>"
+    if seconds_failed(xsh):
+        chars = f"{name:40}  {'failed':>9} "
+    else:
+        chars = f"{name:40}  {xsh['wall']:9.3f}s"
+
+    if seconds_failed(classic):
+        chars += f"  {'failed':>9}  classic  {'':7}"
+    elif isinstance(classic, dict) and not seconds_failed(xsh):
+        ratio = xsh["wall"] / classic["wall"] if classic["wall"] else 0.0
+        chars += f"  {classic['wall']:9.3f}s classic  {ratio:6.1f}x"
+    elif isinstance(classic, dict):
+        chars += f"  {classic['wall']:9.3f}s classic  {'':7}"
+    else:
+        chars += f"  {'':10} classic  {'':7}"
+
+    pyz = result.get("pyz")
+    if seconds_failed(pyz):
+        chars += f"  {'failed':>9}  pyz"
+    elif isinstance(pyz, dict):
+        chars += f"  {pyz['wall']:9.3f}s pyz"
+
+    if (was is not None) and not seconds_failed(xsh):
+        was_xsh = was["xshverb"]
+        assert isinstance(was_xsh, dict), (was_xsh,)
+        if was_xsh["wall"] and not seconds_failed(was_xsh):
+            change = xsh["wall"] / was_xsh["wall"]
+            chars += f"  {change:5.2f}x of last Run"
+
+    return chars
+
+
+#
+# Keep a History
+#
+
+
+def history_read_last(history_path: pathlib.Path) -> dict[str, dict[str, object]]:
+    """Read the Results of the last Run, else nothing"""
+
+    if not history_path.exists():
+        return dict()
+
+    lines = history_path.read_text().splitlines()
+    if not lines:
+        return dict()
+
+    run = json.loads(lines[-1])
+
+    was_by_key: dict[str, dict[str, object]] = dict()
+    for result in run["results"]:
+        key = f"{result['name']} {result['kind']} {result['size']}"
+        was_by_key[key] = result
+
+    return was_by_key
+
+
+def git_describe() -> str:
+    """Say which Git Commit we're timing, and if Files changed since"""
+
+    argv = ["git", "describe", "--always", "--dirty"]
+    run = subprocess.run(argv, cwd=BinPath, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    describe = run.stdout.decode().strip()
+
+    return describe
+
+
+#
+# Run from the Shell Command Line, if not imported
+#
+
+
+if __name__ == "__main__":
+    main()
+
+
+# 3456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+r"""
+usage: pyz.py [-h] [--output PATH]
+
+bundle bin/xshverb.py into one Zip App of precompiled Bytecode, to start up faster
+
+options:
+  -h, --help     show this help message and exit
+  --output PATH  write the Zip App here (default: __pycache__/xshverb.pyz)
+
+quirks:
+  compiles once here, so each Run loads Bytecode, not parsing and compiling all the Source again
+  works the same in every Folder, because Python never caches the Bytecode of a Main Script
+  keeps the Source beside the Bytecode, for Tracebacks and for:  pq --version
+  keeps the Asserts, and doesn't optimize as if -O, because XShVerb refuses to run without them
+  falls back to compiling the Source, when run by a Python other than the Python that built it
+  runs as the Verb named by its Symlink, such as bin/pq or bin/a, just like bin/xshverb.py does
+
+examples:
+  make pyz
+  bin/pyz.py --output ~/bin/xshverb.pyz && ln -sf xshverb.pyz ~/bin/pq
+  bin/bench.py --only startup
+"""
+
+# code reviewed by People, Black, Flake8, MyPy-Strict, & PyLance-Standard
+
+
+from __future__ import annotations  # backports new datatype syntaxes into old Pythons
+
+import argparse
+import os
+import pathlib
+import py_compile
+import sys
+import tempfile
+import time
+import zipfile
+
+if not __debug__:
+    raise NotImplementedError([__debug__])  # refuses to run without live Asserts
+
+
+#
+# Name a few things
+#
+
+
+BinPath = pathlib.Path(__file__).resolve().parent  # the Folder of bin/pq, bin/xshverb.py, etc
+
+PyzPathname = "__pycache__/xshverb.pyz"  # keeps the Zip App, out of Git
+
+
+#
+# Run from the Shell Command Line
+#
+
+
+def main() -> None:
+    """Run from the Shell Command Line"""
+
+    ns = parse_pyz_args()
+
+    source_path = BinPath / "xshverb.py"
+    output_path = pathlib.Path(ns.output).expanduser()
+
+    t0 = time.perf_counter()
+    pyz_build(source_path, output_path=output_path)
+    t1 = time.perf_counter()
+
+    size = output_path.stat().st_size
+    version = sys.version.split()[0]
+    print(f"{output_path}  # {size:_} Bytes built in {t1 - t0:.3f}s by Python {version}")
+
+
+def parse_pyz_args() -> argparse.Namespace:
+    """Take in the Shell Command-Line Args"""
+
+    doc = __doc__
+    assert doc, (doc,)
+
+    lines = doc.strip().splitlines()
+    description = lines[2]
+    epilog = doc[doc.index("quirks:") :]
+
+    parser = argparse.ArgumentParser(
+        prog="pyz.py",
+        description=description,
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    output_help = f"write the Zip App here (default: {PyzPathname})"
+    parser.add_argument("--output", metavar="PATH", default=PyzPathname, help=output_help)
+
+    ns = parser.parse_args()
+
+    return ns
+
+
+#
+# Build the Zip App
+#
+
+
+def pyz_build(source_path: pathlib.Path, output_path: pathlib.Path) -> None:
+    """Write a Shebang, then a Zip of the Bytecode and the Source, as an Executable File"""
+
+    source_bytes = source_path.read_bytes()
+    date_time = time.localtime(source_path.stat().st_mtime)[:6]
+
+    # Compile as if Zip Import had compiled the Source, but never check the Bytecode vs the Source
+
+    dfile = os.fspath(output_path.resolve() / "__main__.py")  # names the Source in Tracebacks
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfile = os.path.join(tmpdir, "__main__.pyc")
+        py_compile.compile(
+            os.fspath(source_path),
+            cfile=cfile,
+            dfile=dfile,
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        pyc_bytes = pathlib.Path(cfile).read_bytes()
+
+    # Store the Members, not Deflate them, so that each Run skips inflating them
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + "~")
+
+    with tmp_path.open("wb") as writer:
+        writer.write(b"#!/usr/bin/env python3\n")
+        with zipfile.ZipFile(writer, mode="w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr(zipfile.ZipInfo("__main__.pyc", date_time=date_time), data=pyc_bytes)
+            zf.writestr(zipfile.ZipInfo("__main__.py", date_time=date_time), data=source_bytes)
+
+    tmp_path.chmod(0o755)
+    tmp_path.replace(output_path)  # replaces the Zip App all at once, never half-written
+
+    # Zip Import chooses __main__.pyc over __main__.py, when the Magic of the Bytecode fits
+
+
+#
+# Run from the Shell Command Line, if not imported
+#
+
+
+if __name__ == "__main__":
+    main()
+
+
+# 3456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789 123456789
+
+
+# posted as:  https://github.com/pelavarre/xshverb/blob/main/bin/pyz.py
+# copied from:  git clone https://github.com/pelavarre/xshverb.git
@@ -16,6 +16,11 @@ quirks:
   defaults to dedent the Lines, strip trailing Blanks from each Line, and end with 1 Line-Break
   docs the [-h] and [-V] options only here, not again and again for every different Hint
   often replaces or creates a ./xshverb.pbpaste File, and also __pycache__/$pid-xshverb.pbpaste
+  profiles each Shell Pump into __pycache__/, when XSHVERB_PROFILE=cprofile or =tracemalloc
+  shows time, bytes, lines, and memory of each Shell Pump, when XSHVERB_PROFILE=stats
+  writes Chrome Trace-Event Json of each Span of work, when XSHVERB_TRACE=PATH.json
+  spills to Disk, or fails fast, rather than hold more than XSHVERB_MEM_BUDGET=SIZE, like 512M
+  caps its Address Space near 2x that Budget, but not when it runs other Processes, as at dt or x
   more doc at https://github.com/pelavarre/xshverb
 
 most common Python words:
@@ -45,7 +50,7 @@ examples:
 """
 
 # todo: --py to show the Python chosen, --py=... to supply your own Python
-# todo: make a place for:  column -t, fmt --ruler, tee, tee -a, etc
+# todo: make a place for:  fmt --ruler, tee, tee -a, etc
 
 
 # code reviewed by People, Black, Flake8, MyPy-Strict, & PyLance-Standard
@@ -55,40 +60,66 @@ from __future__ import annotations
 
 import __main__
 import argparse
+import ast
 import atexit
+import bisect
+import builtins
+import bz2
+import cProfile
 import code
 import collections.abc
+import concurrent.futures
+import contextlib
 import copy
+import csv
+import ctypes
+import ctypes.util
 import dataclasses
 import datetime as dt
 import decimal
 import difflib
+import functools
+import glob
+import gzip
 import hashlib
+import heapq
 import importlib
 import io
+import itertools
 import json
 import logging
+import lzma
 import math
+import operator
 import os
 import pathlib
 import pdb
 import random
 import re
+import resource
 import select
+import selectors
 import shlex
 import shutil
 import signal
 import socket
+import stat
+import statistics
 import string
 import subprocess
 import sys
+import tempfile
 import termios
 import textwrap
+import time
+import tracemalloc
 import tty
 import types
 import typing
 import unicodedata
 import urllib.parse
+import zipimport
+import zlib
 
 if sys.version_info >= (3, 9):
     import zoneinfo  # new since Oct/2020 Python 3.9
@@ -122,16 +153,30 @@ _3_10_ARGPARSE = (3, 10)  # Oct/2021 Python 3.10  # oldest trusted to run ArgPar
 FullBlock = unicodedata.lookup("Full Block")  # '█'
 
 
-GatewayVerbs = ("d", "dot", "dt", "e", "g", "k", "v")  # these eat args despite str_is_identifier_ish
+GatewayVerbs = ("d", "dot", "dt", "e", "g", "k", "v", "watch")  # these eat identifier-ish args
+ChildProcessVerbs = ("diff", "dt", "emacs", "less", "vi", "watch", "xargs")  # these run Processes
 
 
 AppPathname = "__pycache__/p.pbpaste"  # traces the last Pipe
 
+BatchSize = 0x400  # joins this many Lines at a time, when streaming
+BlockSize = 0x10000  # reads or writes this many Bytes at a time, when streaming
+
 OsCopyPasteClipboardBuffer = bool(shutil.which("pbpaste") and shutil.which("pbcopy"))
 # OsCopyPasteClipboardBuffer = False  # tests as if Clipboard not found
 
 OsGetPid = os.getpid()  # traces each Pipe separately, till Os recycles Pid's
 
+ProfileEnvName = "XSHVERB_PROFILE"  # asks to profile each Shell Pump
+ProfileKinds = ("cprofile", "stats", "tracemalloc")
+
+MemBudgetEnvName = "XSHVERB_MEM_BUDGET"  # asks to hold less Memory, such as 512M or 2G
+
+TraceEnvName = "XSHVERB_TRACE"  # asks to write Chrome Trace-Event Json to a Path
+TracePathname = os.environ.get(TraceEnvName, "")
+TraceEvents: list[dict[str, object]] = list()  # grows only when XSHVERB_TRACE is set
+TraceT0 = time.perf_counter()
+
 PidPathname = f"__pycache__/{OsGetPid}.pbpaste"
 
 ScreenWriteLogPathname = "__pycache__/s.screen"  # yes, a ScreenLog  # yes, a Screen Log
@@ -186,6 +231,14 @@ def excepthook(
         with_stderr.write("KeyboardInterrupt\n")
         sys.exit(130)  # 0x80 + signal.SIGINT
 
+    # Quit now for visible cause, if MemoryError while a Memory Budget is set
+
+    if (exc_type is MemoryError) and alt.mem_budget:
+        mem_budget_text = os.environ.get(MemBudgetEnvName, "")
+        what = "allocating Memory"
+        with_stderr.write(f"xshverb: {what} would cross {MemBudgetEnvName}={mem_budget_text}\n")
+        sys.exit(1)  # exits 1 for Memory Budget crossed
+
     # Print the Traceback, etc
 
     with_exc_hook(exc_type, exc_value, exc_traceback)
@@ -239,35 +292,300 @@ def try_main() -> None:
     basename = os.path.basename(argv[0])
 
     args = ["--"] + [basename] + argv[1:]
-    if basename == "xshverb.py":
+    if basename in ("xshverb.py", "xshverb.pyz"):
         if not argv[1:]:
             args = list()  # asks to print Closing
 
-    ns = parser.parse_args_if(args)  # often prints help & exits zero
+    if TracePathname:
+        atexit.register(trace_events_dump)
+
+    with trace_span("parse_args", argv=argv):
+        ns = parser.parse_args_if(args)  # often prints help & exits zero
 
-    shpumps = argv_to_shell_pumps(argv=ns.hints)  # often prints help & exits zero
-    assert shpumps, (shpumps, ns.hints)
+        shpumps = argv_to_shell_pumps(argv=ns.hints)  # often prints help & exits zero
+        assert shpumps, (shpumps, ns.hints)
+
+        out_gz_shell_pumps_take_if(shpumps)
+        files_shell_pumps_take_if(shpumps)  # exits 2 when no Files match
+
+    profile = os.environ.get(ProfileEnvName, "")
+    if profile and (profile not in ProfileKinds):
+        eprint(f"xshverb: {ProfileEnvName}={profile!r} is not one of {', '.join(ProfileKinds)}")
+        sys.exit(2)  # exits 2 for Bad Env
+
+    mem_budget_take_env_if(shpumps)  # exits 2 for Bad Env
+
+    summaries: list[str] = list()
+    if profile:
+        atexit.register(lambda: eprint("\n".join(summaries)) if summaries else None)
+
+    tally_rows: list[ShellPumpTallies] = list()
+    if profile == "stats":
+        atexit.register(lambda: eprint("\n".join(tally_rows_format(tally_rows))))
 
     alt.stdout = ShellFile()  # adds or replaces
+    if profile == "stats":
+        alt.stdout.tallies = collections.Counter()
     for index, shpump in enumerate(shpumps):
         alt.index = index
         alt.rindex = index - len(shpumps)
 
         alt.stdin = alt.stdout
         alt.stdout = ShellFile()  # adds or replaces
+        if profile == "stats":
+            alt.stdout.tallies = collections.Counter()
 
         assert not alt.stdout.filled, (alt.stdout.filled, index)
 
         argv = shpump.argv
-        shpump.func(argv)  # two positional args, zero keyword args
+        name = f"{index}-{shpump.verb}"
+        with trace_span(shpump.func.__name__, argv=argv) as span:
+            if not profile:
+                shpump.func(argv)  # two positional args, zero keyword args
+            elif profile == "stats":
+                func_call_tallied(lambda: shpump.func(argv), name, tally_rows=tally_rows)
+            else:
+                func_call_profiled(
+                    lambda: shpump.func(argv), name, kind=profile, summaries=summaries
+                )
+
+            span["bytes_out"] = len(alt.stdout.iobytes)
+            span["lazy"] = alt.stdout.iolines is not None
 
         assert alt.stdout.filled, (alt.stdout.filled, index, argv)
 
-    alt.stdout.drain_if()
+    name = f"{len(shpumps)}-drain"
+    with trace_span("drain_if"):
+        if not profile:
+            alt.stdout.drain_if()
+        elif profile == "stats":
+            alt.stdin = alt.stdout
+            func_call_tallied(alt.stdout.drain_if, name, tally_rows=tally_rows)
+        else:
+            func_call_profiled(alt.stdout.drain_if, name, kind=profile, summaries=summaries)
+
+    if alt.returncode:
+        sys.exit(alt.returncode)  # exits nonzero after draining, such as when |x failed
+
+    # profiles the Lines read lazily, such as by 'i u s', inside the Shell Pump that drains them
 
     # todo: add code to make how truthy ns.version works more simple
 
 
+def func_call_profiled(
+    func: collections.abc.Callable[[], None], name: str, kind: str, summaries: list[str]
+) -> None:
+    """Call the Func, but profile it into __pycache__/ and add a Summary Line"""
+
+    pathname = f"__pycache__/{OsGetPid}-{name}.{kind}"
+    summary = f"{name}  {kind}  {pathname}"
+
+    t0 = time.perf_counter()
+
+    # Write the Profile Stats of the CPU Time spent, as a PStats File
+
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(func)
+        finally:
+            t1 = time.perf_counter()
+            profiler.dump_stats(pathname)  # for:  python3 -m pstats __pycache__/*.cprofile
+            summaries.append(f"{dt_seconds_strftime(t1 - t0)}  {summary}")
+
+        return
+
+    # Else write the Source Lines that allocated the most Memory still held, as a Text File
+
+    assert kind == "tracemalloc", (kind,)
+
+    tracemalloc.start()
+    try:
+        func()
+    finally:
+        t1 = time.perf_counter()
+
+        snapshot = tracemalloc.take_snapshot()
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = snapshot.statistics("lineno")
+        lines = list(str(_) for _ in stats[:25])
+        pathlib.Path(pathname).write_text("\n".join(lines) + "\n")
+
+        peak_chars = dt_bytes_strftime(peak)
+        summaries.append(f"{dt_seconds_strftime(t1 - t0)}  peak {peak_chars}  {summary}")
+
+
+@contextlib.contextmanager
+def trace_span(
+    name: str, tid: int = 1, **kwargs: object
+) -> collections.abc.Iterator[dict[str, object]]:
+    """Time a Span of work as a Chrome Trace Event, when XSHVERB_TRACE is set"""
+
+    args = dict(kwargs)  # the Caller may add more Args, such as Byte Counts
+
+    if not TracePathname:
+        yield args
+        return
+
+    t0 = time.perf_counter()
+    try:
+        yield args
+    finally:
+        t1 = time.perf_counter()
+
+        ts = (t0 - TraceT0) * 1e6  # Microseconds
+        dur = (t1 - t0) * 1e6
+        event = dict(name=name, cat="xshverb", ph="X", ts=ts, dur=dur, pid=OsGetPid, tid=tid)
+        event["args"] = args
+        TraceEvents.append(event)
+
+
+def trace_events_dump() -> None:
+    """Write the Chrome Trace-Event Json, for such as https://ui.perfetto.dev"""
+
+    metadata = dict(name="process_name", ph="M", pid=OsGetPid, tid=1)
+    basename = os.path.basename(sys.argv[0])  # such as 'pq' or 's', to name the Verb
+    metadata["args"] = dict(name=" ".join([basename] + sys.argv[1:]))
+
+    events = [metadata] + TraceEvents
+    text = json.dumps(dict(traceEvents=events), default=str, ensure_ascii=False)
+
+    pathlib.Path(TracePathname).write_text(text + "\n")
+
+    # writes each Span as a Complete ("X") Event, nested by Time, not by Parent Ids
+    # writes the Spans of streaming Reads on a second Thread Id, because they overlap the rest
+
+
+def mem_budget_take_env_if(shpumps: list[ShellPump]) -> None:
+    """Take the XSHVERB_MEM_BUDGET=SIZE from the Env, if present, else exit 2"""
+
+    mem_budget_text = os.environ.get(MemBudgetEnvName, "")
+    if not mem_budget_text:
+        return
+
+    try:
+        alt.mem_budget = mem_budget_parse(mem_budget_text)
+    except ValueError:
+        eprint(f"xshverb: {MemBudgetEnvName}={mem_budget_text!r} is not a Size, like 512M")
+        sys.exit(2)  # exits 2 for Bad Env
+
+    if OsCopyPasteClipboardBuffer:  # runs 'pbpaste' and 'pbcopy'
+        return
+    if any((_.verb in ChildProcessVerbs) for _ in shpumps):
+        return
+
+    mem_budget_limit_address_space(alt.mem_budget)
+
+    # caps no Children, because they inherit the Cap, no matter how far outside the Budget they are
+
+
+def mem_budget_parse(text: str) -> int:
+    """Convert '512M' to 512 * 1024 * 1024, else raise ValueError"""
+
+    m = re.fullmatch(r"([0-9]+)([KMGT]?)(i?B)?", text.strip(), flags=re.IGNORECASE)
+    if not m:
+        raise ValueError(text)
+
+    scale = 1 << (10 * " KMGT".index(m.group(2).upper() or " "))
+    count = int(m.group(1)) * scale
+    if not count:
+        raise ValueError(text)
+
+    return count
+
+
+def mem_budget_limit_address_space(mem_budget: int) -> None:
+    """Cap the Virtual Memory of this Process and its Children, as a Backstop to the Budget"""
+
+    arenas = (os.cpu_count() or 1) * (64 << 20)  # as when each Thread reserves a Malloc Arena
+    limit = 2 * mem_budget + (256 << 20) + arenas  # leaves room for Python itself, and for Threads
+
+    (soft, hard) = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    if (soft == resource.RLIM_INFINITY) or (limit < soft):
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        except (OSError, ValueError):
+            pass  # such as macOS often refusing to cap the Address Space
+
+    # raises MemoryError, rather than waking the OOM Killer, when the Budget is far overrun
+
+
+def mem_budget_exit_if(size: int, what: str) -> None:
+    """Fail fast with a clear message, when a Size crosses the Memory Budget"""
+
+    mem_budget = alt.mem_budget
+    if mem_budget and (size > mem_budget):
+        mem_budget_text = os.environ.get(MemBudgetEnvName, "")
+        eprint(f"xshverb: {what} would cross {MemBudgetEnvName}={mem_budget_text}")
+        sys.exit(1)  # exits 1 for Memory Budget crossed
+
+
+@dataclasses.dataclass
+class ShellPumpTallies:
+    """Count what one Shell Pump took and gave"""
+
+    name: str  # '0-split'
+
+    wall: float = 0.0  # Seconds, by Time.Perf_Counter
+    cpu: float = 0.0  # Seconds, by Time.Process_Time
+    maxrss: int = 0  # Bytes more of Max RSS, by Resource.GetRUsage(RUSAGE_SELF)
+
+    ins: collections.Counter[str] | None = None  # Bytes & Lines read, counted only as read
+    outs: collections.Counter[str] | None = None  # Bytes & Lines written, counted only as read
+
+
+def func_call_tallied(
+    func: collections.abc.Callable[[], None], name: str, tally_rows: list[ShellPumpTallies]
+) -> None:
+    """Call the Func, but count its Time & Memory, and point to the Tallies of its Files"""
+
+    maxrss_scale = 1 if (sys.platform == "darwin") else 1024  # Bytes at macOS, else KiB
+
+    row = ShellPumpTallies(name, ins=alt.stdin.tallies, outs=alt.stdout.tallies)
+    tally_rows.append(row)
+
+    maxrss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    c0 = time.process_time()
+    try:
+        func()
+    finally:
+        row.wall = time.perf_counter() - t0
+        row.cpu = time.process_time() - c0
+        maxrss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        row.maxrss = (maxrss1 - maxrss0) * maxrss_scale
+
+
+def tally_rows_format(tally_rows: list[ShellPumpTallies]) -> list[str]:
+    """Form a Table of what each Shell Pump took and gave"""
+
+    rows = [["", "wall", "cpu", "bytes in", "lines in", "bytes out", "lines out", "+maxrss"]]
+    for tr in tally_rows:
+        ins = tr.ins if (tr.ins is not None) else collections.Counter()
+        outs = tr.outs if (tr.outs is not None) else collections.Counter()
+
+        row = [tr.name, dt_seconds_strftime(tr.wall), dt_seconds_strftime(tr.cpu)]
+        row.extend([str(ins["bytes"]), str(ins["lines"])])
+        row.extend([str(outs["bytes"]), str(outs["lines"])])
+        row.append(dt_bytes_strftime(tr.maxrss))
+        rows.append(row)
+
+    widths = list(max(len(_) for _ in column) for column in zip(*rows))
+
+    lines = list()
+    for row in rows:
+        line = "  ".join([row[0].ljust(widths[0])] + [_.rjust(w) for _, w in zip(row, widths)][1:])
+        lines.append(line)
+
+    return lines
+
+    # counts the Lines read lazily, such as by 'i u s', inside the Shell Pump that drains them
+
+
 @dataclasses.dataclass  # (order=False, frozen=False)
 class ShellPipe:
     """Pump Bytes through a pipe of Shell Pumps"""
@@ -283,6 +601,12 @@ class ShellPipe:
         self.sys_stdin_isatty = sys.stdin.isatty()  # was Stdin left undirected
         self.sys_stdout_isatty = sys.stdout.isatty()  # was Stdout left undirected
 
+        self.mem_budget = 0  # how many Bytes to hold at most, else 0 for no limit
+
+        self.returncode = 0  # how to exit after draining, such as when a Command of |x failed
+
+        self.out_gz = False  # compresses the Drain to a Pipe or File, and the Shadow Copies
+
 
 def argv_to_shell_pumps(argv: list[str]) -> list[ShellPump]:
     """Parse Args, else show Version or Help and exit"""
@@ -385,7 +709,7 @@ class ShellPump:  # much like a Shell Pipe Filter when coded as a Linux Process
         assert __main__.__doc__, (__main__.__doc__,)
 
         doc = doc_by_verb[verb]
-        if vb == "xshverb.py":
+        if vb in ("xshverb.py", "xshverb.pyz"):
             doc = __main__.__doc__
 
         # Find the Func
@@ -418,7 +742,11 @@ class ShellPump:  # much like a Shell Pipe Filter when coded as a Linux Process
             # Accept an Identifier as the Shell Verb
 
             if not argv:
-                if str_is_identifier_ish(hint):
+                if str_is_python_name_ish(hint) and (hint not in VERB_BY_VB.keys()):
+                    if hint not in FUNC_BY_VERB.keys():
+                        argv.append("pq")  # such as a Chain of Python Names to call
+
+                elif str_is_identifier_ish(hint):
                     assert len(words) == 1, (len(words), words, hint)
 
                 # Accept a Shell-Quote'd Verb with its baggage of Options and Args
@@ -426,10 +754,12 @@ class ShellPump:  # much like a Shell Pipe Filter when coded as a Linux Process
                 elif len(words) > 1:
                     splits = shlex.split(hint)
                     assert splits, (splits, hint)
-                    if str_is_identifier_ish(splits[0]):
+                    if (splits[0] in VERB_BY_VB.keys()) or (splits[0] in FUNC_BY_VERB.keys()):
                         argv = splits
                         break
 
+                    argv.append("pq")  # such as a Python Expression of 'line'
+
                 # Fall back to have Pq make sense of anything else, and maybe more that follows
 
                 else:
@@ -440,11 +770,14 @@ class ShellPump:  # much like a Shell Pipe Filter when coded as a Linux Process
 
             # Take all the remaining Hints as Args, after a Gateway Verb into a Namespacre
 
-            assert GatewayVerbs == ("d", "dot", "dt", "e", "g", "k", "v")
+            assert GatewayVerbs == ("d", "dot", "dt", "e", "g", "k", "v", "watch")
 
             if argv[0] in GatewayVerbs:
                 continue
 
+            if (argv[0] in ("x", "xargs")) and ("--" in argv[1:]):
+                continue  # takes all the Hints after '--' as the Words of a Command
+
             # Insert a Break between Shell Pipe Filters,
             # rather than accepting a first Positional Argument,
             # when not Shell-Quote'd in with the Verb
@@ -452,6 +785,14 @@ class ShellPump:  # much like a Shell Pipe Filter when coded as a Linux Process
             if hints:
                 next_hint = hints[0]
 
+                if (argv[0] == "pq") and (argv[-1] in ("-e", "--files")):
+                    continue  # takes the next Hint as the Value of the Option
+
+                if (argv[0] == "pq") and str_is_python_name_ish(next_hint):
+                    names = list(_ for _ in argv[1:] if not (_.startswith("-") or _.isdigit()))
+                    if all(str_is_python_name_ish(_) for _ in names):
+                        continue  # takes the next Python Name into the Chain
+
                 if str_is_identifier_ish(next_hint):  # not any '-' or '--' option, nor '(.)' etc etc
                     break
 
@@ -525,10 +866,13 @@ class ShellFile:
     """Pump Bytes in and out"""  # 'Store and forward'
 
     iobytes: bytes = b""
+    iolines: collections.abc.Iterator[str] | None = None  # Lines not yet pumped into .iobytes
 
     filled: bool = False
     drained: bool = False
 
+    tallies: collections.Counter[str] | None = None  # counts the Bytes & Lines, if asked
+
     #
     # Pump Bytes in from Nowhere and out to Nowhere
     #
@@ -582,6 +926,48 @@ class ShellFile:
 
         # maybe empty  # maybe enclosed in Blanks
 
+    def read_iterlines(self) -> collections.abc.Iterator[str]:
+        """Read Lines lazily, as if by .read_splitlines, but from Chunks of Chars"""
+
+        chunks = self.read_iterchunks()
+        ilines = chunks_iter_splitlines(chunks)
+
+        return ilines
+
+        # reads only once, and leaves no Bytes behind to read again
+
+    def read_iterchunks(self) -> collections.abc.Iterator[str]:
+        """Read Chars lazily, as if by .read_text, but one Chunk at a time"""
+
+        assert not self.drained, (self.drained,)
+
+        # Read Lines not yet pumped into Bytes
+
+        if self.iolines is not None:
+            iolines = self.iolines
+            self.iolines = None
+
+            self.tprint("read_iterchunks from iolines")
+            return lines_iter_join_chunks(iolines)
+
+        # Read Stdin one Chunk at a time
+
+        if not self.filled:
+            if not sys.stdin.isatty():
+                self.filled = True
+
+                self.tprint("read_iterchunks from stdin")
+                ichunks = self.trace_iterchunks_if(stdin_iter_chunks(blocksize=BlockSize))
+                return self.tally_iterchunks_if(ichunks)
+
+        # Else read all the Chars at once
+
+        itext = self.read_text()
+
+        return iter([itext])
+
+        # reads only once, and leaves no Bytes behind to read again
+
     def fill_if(self) -> None:
         """Read Bytes from Stdin, else from Os Copy/Paste Buffer, at most once"""
 
@@ -590,24 +976,34 @@ class ShellFile:
 
         assert not self.drained, (self.drained,)
         if self.filled:
+            self.join_iolines_if()
             return
 
         # Fill from somewhere, always
 
-        if not sys.stdin.isatty():
-            self.tprint("fill_from_stdin")
-            self.fill_from_stdin()
-        elif OsCopyPasteClipboardBuffer:
-            self.tprint("fill_from_clipboard")
-            self.fill_from_clipboard()
-        elif app_path.exists():
-            self.tprint("fill from", app_path)
-            self.filled = True
-            self.iobytes = app_path.read_bytes()
-        else:
-            self.tprint("fill from Jabberwocky")
-            self.filled = True
-            self.iobytes = Jabberwocky.encode()  # fills from Source, if need be
+        with trace_span("fill_if") as span:
+            if not sys.stdin.isatty():
+                self.tprint("fill_from_stdin")
+                span["source"] = "stdin"
+                self.fill_from_stdin()
+            elif OsCopyPasteClipboardBuffer:
+                self.tprint("fill_from_clipboard")
+                span["source"] = "clipboard"
+                self.fill_from_clipboard()
+            elif app_path.exists():
+                self.tprint("fill from", app_path)
+                span["source"] = os.fspath(app_path)
+                self.filled = True
+                self.iobytes = bytes_decompress_if(app_path.read_bytes())
+                self.tally_bytes_if(self.iobytes)
+            else:
+                self.tprint("fill from Jabberwocky")
+                span["source"] = "Jabberwocky"
+                self.filled = True
+                self.iobytes = Jabberwocky.encode()  # fills from Source, if need be
+                self.tally_bytes_if(self.iobytes)
+
+            span["bytes"] = len(self.iobytes)
 
         # .errors .returncode .shell .stdin unlike:  iobytes = os.popen(shline).read().encode()
 
@@ -617,10 +1013,85 @@ class ShellFile:
         assert (not self.filled) and (not self.drained), (self.filled, self.drained)
         self.filled = True
 
-        path = pathlib.Path("/dev/stdin")  # todo: solve for Windows too
-        read_bytes = path.read_bytes()  # maybe not UTF-8 Encoded
+        if not alt.mem_budget:
+            with stdin_open_decompressed() as reader:
+                read_bytes = reader.read()  # maybe not UTF-8 Encoded
+        else:
+            read_bytes = self.read_stdin_in_budget()
 
         self.iobytes = read_bytes  # replaces
+        self.tally_bytes_if(read_bytes)
+
+    def read_stdin_in_budget(self) -> bytes:
+        """Read Bytes from Stdin, one Block at a time, but fail fast if over Memory Budget"""
+
+        blocks = list()
+        size = 0
+
+        with stdin_open_decompressed() as reader:
+            while True:
+                block = reader.read(BlockSize)
+                if not block:
+                    break
+
+                size += len(block)
+                mem_budget_exit_if(size, what="reading all of Stdin")
+                blocks.append(block)
+
+        read_bytes = b"".join(blocks)
+
+        return read_bytes
+
+    def read_seekable(self) -> typing.BinaryIO:
+        """Read Bytes as a seekable File, else spill them into a Temp File first"""
+
+        assert not self.drained, (self.drained,)
+
+        # Read the Stdin File itself, if seekable
+
+        if not self.filled:
+            if not sys.stdin.isatty():
+                self.filled = True
+
+                fd = sys.stdin.fileno()
+                st = os.fstat(fd)
+                reader = open(fd, "rb", closefd=False)
+                if stat.S_ISREG(st.st_mode) and not binary_file_is_compressed(reader):
+                    self.tprint("read_seekable from stdin")
+                    with trace_span("fill_if", source="stdin", bytes=st.st_size):
+                        self.tally_bytes_if(b"", size=st.st_size)
+                    return reader
+
+                self.tprint("read_seekable by spill from stdin")
+                with trace_span("fill_if", source="stdin", spill=True) as span:
+                    spill = tempfile.TemporaryFile()
+                    with binary_file_decompress_if(reader) as ireader:
+                        shutil.copyfileobj(ireader, spill, BlockSize)
+                    span["bytes"] = spill.tell()
+                self.tally_bytes_if(b"", size=spill.tell())
+                spill.seek(0)
+
+                return spill
+
+        # Spill Lines not yet pumped into Bytes, else wrap the Bytes as a File
+
+        if self.iolines is not None:
+            iolines = self.iolines
+            self.iolines = None
+
+            self.tprint("read_seekable by spill from iolines")
+            spill = tempfile.TemporaryFile()
+            for chunk in lines_iter_encode_chunks(iolines):
+                spill.write(chunk)
+            spill.seek(0)
+
+            return spill
+
+        iobytes = self.read_bytes()
+
+        return io.BytesIO(iobytes)
+
+        # the Caller may close the File, but need not
 
     def fill_from_clipboard(self) -> None:
         """Read Bytes from Clipboard"""
@@ -642,6 +1113,7 @@ class ShellFile:
         stdout_bytes = run.stdout
 
         self.iobytes = stdout_bytes  # replaces
+        self.tally_bytes_if(stdout_bytes)
 
     #
     # Pump Bytes out
@@ -658,6 +1130,35 @@ class ShellFile:
 
         encode = join_plus.encode(errors="surrogateescape")
         self.iobytes = encode  # replaces
+        self.tally_bytes_if(encode)
+
+    def write_iterlines(self, lines: collections.abc.Iterable[str]) -> None:
+        """Write Lines lazily, and close the last Line, but don't pump them into Bytes yet"""
+
+        assert (not self.filled) and (not self.drained), (self.filled, self.drained)
+        self.filled = True
+
+        self.iolines = self.tally_iterlines_if(iter(lines))  # replaces
+
+        # pumps like .write_splitlines, but only as the Lines get read or drained
+
+    def join_iolines_if(self) -> None:
+        """Pump the lazily written Lines into Bytes, at most once"""
+
+        iolines = self.iolines
+        if iolines is None:
+            return
+
+        self.iolines = None
+
+        chunks = list()
+        size = 0
+        for chunk in lines_iter_encode_chunks(iolines):
+            size += len(chunk)
+            mem_budget_exit_if(size, what="holding all the Lines")
+            chunks.append(chunk)
+
+        self.iobytes = b"".join(chunks)  # replaces
 
     def write_text(self, text: str) -> None:
         """Write Chars into Bytes, and don't drain them yet"""
@@ -667,6 +1168,7 @@ class ShellFile:
 
         encode = text.encode(errors="surrogateescape")
         self.iobytes = encode  # replaces
+        self.tally_bytes_if(encode)
 
         # may write zero Chars  # may write Chars enclosed in Blanks
 
@@ -680,12 +1182,94 @@ class ShellFile:
         self.filled = True
 
         self.iobytes = data  # replaces
+        self.tally_bytes_if(data)
 
         # may write zero Bytes  # may write enclosed in Blanks  # might not end with Line-Break
 
         # standard .write forces the Def to count the Chars
         # standard .writelines forces the Caller to choose each Line-Break
 
+    #
+    # Count the Bytes & Lines pumped through, if asked
+    #
+
+    def tally_bytes_if(self, data: bytes, size: int = 0) -> None:
+        """Count the Bytes & Lines, if asked, or count only a Size of Bytes"""
+
+        tallies = self.tallies
+        if tallies is None:
+            return
+
+        tallies["bytes"] += len(data) + size
+        tallies["lines"] += data.count(b"\n") + int(bool(data) and not data.endswith(b"\n"))
+
+    def trace_iterchunks_if(
+        self, chunks: collections.abc.Iterator[str]
+    ) -> collections.abc.Iterator[str]:
+        """Time the streaming of Chunks from Stdin as a Fill Span, if asked"""
+
+        if not TracePathname:
+            return chunks
+
+        def iter_traced_chunks() -> collections.abc.Iterator[str]:
+            with trace_span("fill_if", tid=2, source="stdin", stream=True) as span:
+                size = 0
+                for chunk in chunks:
+                    size += len(chunk.encode(errors="surrogateescape"))
+                    yield chunk
+
+                span["bytes"] = size
+
+        return iter_traced_chunks()
+
+    def tally_iterchunks_if(
+        self, chunks: collections.abc.Iterator[str]
+    ) -> collections.abc.Iterator[str]:
+        """Count the Bytes & Lines of each Chunk as it gets read, if asked"""
+
+        tallies = self.tallies
+        if tallies is None:
+            return chunks
+
+        def iter_tallied_chunks() -> collections.abc.Iterator[str]:
+            assert tallies is not None, (tallies,)
+
+            last = ""
+            for chunk in chunks:
+                tallies["bytes"] += len(chunk.encode(errors="surrogateescape"))
+                tallies["lines"] += chunk.count("\n")
+                last = chunk[-1:] or last
+                yield chunk
+
+            tallies["lines"] += int(bool(last) and (last != "\n"))
+
+        return iter_tallied_chunks()
+
+    def tally_iterlines_if(
+        self, lines: collections.abc.Iterator[str]
+    ) -> collections.abc.Iterator[str]:
+        """Count the Bytes & Lines of each Line as it gets read, if asked"""
+
+        tallies = self.tallies
+        if tallies is None:
+            return lines
+
+        def iter_tallied_lines() -> collections.abc.Iterator[str]:
+            assert tallies is not None, (tallies,)
+
+            for line in lines:
+                tallies["bytes"] += len(line.encode(errors="surrogateescape")) + 1
+                tallies["lines"] += 1
+                yield line
+
+        return iter_tallied_lines()
+
+        # counts the Line-Break that closes each Line, as .write_splitlines does
+
+    #
+    # Drain Bytes out
+    #
+
     def drain_if(self) -> None:
         """Write Bytes to Stdout, else to the Os Copy/Paste Buffer, else nowhere, at most once"""
 
@@ -698,7 +1282,20 @@ class ShellFile:
     def drain(self) -> pathlib.Path:
         """Write Bytes to Stdout, else to the Os Copy/Paste Buffer, else nowhere"""
 
+        # Stream the lazily written Lines, if possible
+
+        if (self.iolines is not None) and (not sys.stdout.isatty()):
+            self.tprint("drain_iolines_to_stdout")
+            with trace_span("drain_iolines_to_stdout") as span:
+                app_path = self.drain_iolines_to_stdout()
+                span["bytes"] = app_path.stat().st_size
+
+            return app_path
+
+        self.join_iolines_if()
         iobytes = self.iobytes
+        if alt.out_gz:
+            iobytes = b"".join(chunks_iter_gzip([iobytes]))
 
         # Write Bytes to Pid Path and App Path
 
@@ -707,11 +1304,14 @@ class ShellFile:
         # Drain if possible
 
         if not sys.stdout.isatty():
+            self.iobytes = iobytes  # replaces, with Gzip'ped Bytes if --out-gz
             self.tprint("drain_to_stdout")
-            self.drain_to_stdout()
+            with trace_span("drain_to_stdout", bytes=len(iobytes)):
+                self.drain_to_stdout()
         elif OsCopyPasteClipboardBuffer:
             self.tprint("drain_to_clipboard")  # , iobytes)
-            self.drain_to_clipboard()
+            with trace_span("drain_to_clipboard", bytes=len(iobytes)):
+                self.drain_to_clipboard()
         else:
             self.tprint("drain to nowhere")
             self.drained = True
@@ -728,20 +1328,62 @@ class ShellFile:
         # Retain one File of Output per XShVerb Process Id
 
         self.tprint("write shadow copy to", pid_path)
-        pid_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
-        pid_path.write_bytes(iobytes)
+        with trace_span("write_to_path_etc", path=os.fspath(pid_path), bytes=len(iobytes)):
+            pid_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
+            pid_path.write_bytes(iobytes)
 
         # Push a File into the next XShVerb Process  # todo: same Date/Time Stamp as Pid Path
 
         self.tprint("write shadow copy to", app_path)
-        app_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
-        app_path.write_bytes(iobytes)  # traces Date/ Time/ Bytes of PbCopy
+        with trace_span("write_to_path_etc", path=os.fspath(app_path), bytes=len(iobytes)):
+            app_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
+            app_path.write_bytes(iobytes)  # traces Date/ Time/ Bytes of PbCopy
+
+        return app_path
+
+    def drain_iolines_to_stdout(self) -> pathlib.Path:
+        """Write lazily written Lines to Stdout, and to Pid Path and App Path, and return App Path"""
+
+        iolines = self.iolines
+        assert iolines is not None, (iolines,)
+
+        assert self.filled and (not self.drained), (self.filled, self.drained)
+        self.drained = True
+        self.iolines = None
+
+        assert AppPathname == "__pycache__/p.pbpaste"
+        app_path = pathlib.Path(AppPathname)
+        pid_path = pathlib.Path(PidPathname)  # adds next revision of Paste Buffer
+
+        # Write each Chunk to Stdout and to the Pid Path, then copy the Pid Path to the App Path
+
+        self.tprint("stream shadow copy to", pid_path)
+        pid_path.parent.mkdir(exist_ok=True)  # implicit .parents=False
+
+        ochunks = lines_iter_encode_chunks(iolines)
+        if alt.out_gz:
+            ochunks = chunks_iter_gzip(ochunks)
+
+        fd = sys.stdout.fileno()
+        with pid_path.open("wb") as shadow:
+            for chunk in ochunks:
+                shadow.write(chunk)
+                try:
+                    os.write(fd, chunk)
+                except BrokenPipeError:
+                    sys.exit(141)  # 0x80 + signal.SIGPIPE
+
+        self.tprint("write shadow copy to", app_path)
+        shutil.copyfile(pid_path, app_path)
 
         return app_path
 
+        # holds about one Chunk in memory, not all the Bytes
+
     def drain_to_stdout(self) -> None:
         """Write Bytes to Stdout"""
 
+        self.join_iolines_if()
         iobytes = self.iobytes
 
         assert self.filled and (not self.drained), (self.filled, self.drained)
@@ -762,6 +1404,7 @@ class ShellFile:
     def drain_to_clipboard(self) -> None:
         """Write Bytes to Clipboard"""
 
+        self.join_iolines_if()
         iobytes = self.iobytes
 
         assert self.filled and (not self.drained), (self.filled, self.drained)
@@ -817,7 +1460,7 @@ def do_pass(argv: list[str]) -> None:
 
 AWK_DOC = r"""
 
-    usage: a|awk [-F ISEP] [-vOFS OSEP] [NUMBER ...]
+    usage: a|awk [-F ISEP] [-vOFS OSEP] [--tsv] [--csv] [NUMBER ...]
 
     pick one or more columns of words, and drop the rest
 
@@ -827,9 +1470,12 @@ AWK_DOC = r"""
     options:
       -F, --isep ISEP     input word separator (default: Blanks)
       -vOFS, --osep OSEP  output word separator (default: Double Space)
+      --tsv               split and join at Tabs, as if -F$'\t' -vOFS=$'\t'
+      --csv               split and join Comma-Separated Values, quoting Words as needed
 
     comparable to:
       |awk -vOFS='  ' '{ print $1, $5, $(NF+1-1) }'  # |a 1 5 -1
+      |cut -f1,5  # |a --tsv 1 5
 
     like to classic Awk:
       applies Python Str Split Rules to separate the Words
@@ -844,6 +1490,9 @@ AWK_DOC = r"""
       doesn't accept Gnu Awk --field-separator=ISEP nor --assign OFS=OSEP
       doesn't write out trailing Output Seps when trailing Columns missing or empty
 
+    quirks:
+      takes --csv as splitting each Line apart, so doesn't take Line-Break's inside "" Quotes
+
     examples:
       alias a= && unalias a && function a() { ls -l |pbcopy && bin/a "$@" && pbpaste; }
       a  # implicitly drops all but the last Column
@@ -853,10 +1502,12 @@ AWK_DOC = r"""
       echo $PATH |a -F:  # show only the last Dir in the Shell Path
       echo $PATH |a -F: -vOFS=$'\n' 0  # show 1 Dir per Line, as if |tr : '\n'
       echo 'a1 a2\tb1 b2\tc1 c2' |a -F$'\t' -vOFS=$'\t' 3 1  # Tabs in and Tabs out
+      echo 'a1 a2\tb1 b2\tc1 c2' |a --tsv 3 1  # same deal, but more briefly
+      echo 'a,"b1,b2",c' |a --csv -1 2  # Commas in and Commas out
 
 """
 
-_STALE_AWK_DOC = """
+_STALE_AWK_DOC = r"""
 
     positional arguments:
       NUMBER                the Number of a Column to copy out, or 0 to copy them all (default: -1)
@@ -865,15 +1516,14 @@ _STALE_AWK_DOC = """
       -F ISEP, --isep ISEP  input word separator (default: Blanks)
       -vOFS OSEP, --osep OSEP
                             output word separator (default: Double Space)
+      --tsv                 split and join at Tabs, as if -F$'\t' -vOFS=$'\t'
+      --csv                 split and join Comma-Separated Values, quoting Words as needed
 
     comparable to:
 
 """
 
 
-# todo: |awk --tsv to abbreviate |awk -F$'\t' -vOFS=$'\t'
-
-
 def do_awk(argv: list[str]) -> None:
     """Pick some columns of words, and drop the rest"""
 
@@ -895,19 +1545,29 @@ def do_awk(argv: list[str]) -> None:
     number_help = "the Number of a Column to copy out, or 0 to copy them all (default: -1)"
     isep_help = "input word separator (default: Blanks)"
     osep_help = "output word separator (default: Double Space)"
+    tsv_help = "split and join at Tabs, as if -F$'\\t' -vOFS=$'\\t'"
+    csv_help = "split and join Comma-Separated Values, quoting Words as needed"
 
     parser = ArgDocParser(doc, add_help=False)
     parser.add_argument(dest="numbers", metavar="NUMBER", nargs="*", help=number_help)
     parser.add_argument("-F", "--isep", metavar="ISEP", help=isep_help)
     parser.add_argument("-vOFS", "--osep", metavar="OSEP", help=osep_help)
+    parser.add_argument("--tsv", action="store_true", help=tsv_help)
+    parser.add_argument("--csv", action="store_true", help=csv_help)
 
     # Take up Shell Args
 
     args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
     ns = parser.parse_args_if(args)  # often prints help & exits zero
 
-    isep = None if (ns.isep is None) else ns.isep
-    osep = "  " if (ns.osep is None) else ns.osep
+    if ns.csv and (ns.tsv or (ns.isep is not None) or (ns.osep is not None)):
+        parser.parser.print_usage()
+        eprint("|awk: --csv: can't be mixed with --tsv, -F, nor -vOFS")
+        sys.exit(2)  # exits 2 for bad Args
+
+    tab = "\t"
+    isep = (tab if ns.tsv else None) if (ns.isep is None) else ns.isep
+    osep = (tab if ns.tsv else "  ") if (ns.osep is None) else ns.osep
 
     numbers = list(int(_, base=0) for _ in ns.numbers)  # rejects Floats
     if not numbers:
@@ -915,33 +1575,112 @@ def do_awk(argv: list[str]) -> None:
 
     # Pick one or more Columns of Words, and drop the rest
 
-    olines = list()
-    ilines = alt.stdin.read_splitlines()
+    pick = awk_compile_pick(numbers)  # compiles the Column Numbers once, not once per Line
+
+    ilines = alt.stdin.read_iterlines()
+    if ns.csv:
+        olines = awk_iter_csv_lines(ilines, pick=pick)
+    else:
+        olines = awk_iter_lines(ilines, isep=isep, osep=osep, pick=pick)
+
+    alt.stdout.write_iterlines(olines)
+
+
+def awk_compile_pick(
+    numbers: list[int],
+) -> collections.abc.Callable[[list[str]], list[str]]:
+    """Compile the Column Numbers into a Func that picks Words out of the Words of a Line"""
+
+    assert numbers, (numbers,)
+
+    if 0 in numbers:
+        return lambda iwords: awk_pad_pick(iwords, numbers=numbers)
+
+    # Pick by Index when the Line has Words enough, else pad with Empty Words
+
+    indices = list(((_ - 1) if (_ >= 1) else _) for _ in numbers)
+    need = max(abs(_) for _ in numbers)
+
+    getter = operator.itemgetter(*indices)
+
+    if len(indices) == 1:
+        index = indices[-1]
+
+        def pick_one(iwords: list[str]) -> list[str]:
+            if len(iwords) >= need:
+                return [iwords[index]]
+            return awk_pad_pick(iwords, numbers=numbers)
+
+        return pick_one
+
+    def pick(iwords: list[str]) -> list[str]:
+        if len(iwords) >= need:
+            return list(getter(iwords))
+        return awk_pad_pick(iwords, numbers=numbers)
+
+    return pick
+
+
+def awk_pad_pick(iwords: list[str], numbers: list[int]) -> list[str]:
+    """Pick Words out of the Words of a Line, else pick Empty Words"""
+
+    max_number = len(iwords)
+    min_number = -max_number
+
+    owords = list()
+    for number in numbers:
+        if not number:
+            owords.extend(iwords)
+        elif number >= 1:
+            oword = iwords[number - 1] if (number <= max_number) else ""
+            owords.append(oword)
+        else:
+            oword = iwords[number] if (number >= min_number) else ""
+            owords.append(oword)
+
+    return owords
+
+
+def awk_iter_lines(
+    ilines: collections.abc.Iterable[str],
+    isep: str | None,
+    osep: str,
+    pick: collections.abc.Callable[[list[str]], list[str]],
+) -> collections.abc.Iterator[str]:
+    """Pick Words out of each Line, and join them"""
 
     for iline in ilines:
-        iwords = iline.split() if (isep is None) else iline.split(isep)
-
-        max_number = len(iwords)
-        min_number = -max_number
-
-        owords = list()
-        for number in numbers:
-            if not number:
-                owords.extend(iwords)
-            elif number >= 1:
-                oword = iwords[number - 1] if (number <= max_number) else ""
-                owords.append(oword)
-            else:
-                oword = iwords[number] if (number >= min_number) else ""
-                owords.append(oword)
+        iwords = iline.split(isep)
 
+        owords = pick(iwords)
         while owords and not owords[-1]:
             owords.pop()
 
         ojoin = osep.join(owords)
-        olines.append(ojoin)
+        yield ojoin
 
-    alt.stdout.write_splitlines(olines)
+
+def awk_iter_csv_lines(
+    ilines: collections.abc.Iterable[str],
+    pick: collections.abc.Callable[[list[str]], list[str]],
+) -> collections.abc.Iterator[str]:
+    """Pick Words out of each Line of Comma-Separated Values, and join them likewise"""
+
+    sink = io.StringIO()
+    writer = csv.writer(sink, lineterminator="")
+
+    for iwords in csv.reader(ilines):
+
+        owords = pick(iwords)
+        while owords and not owords[-1]:
+            owords.pop()
+
+        sink.seek(0)
+        sink.truncate()
+        writer.writerow(owords)
+
+        ojoin = sink.getvalue()
+        yield ojoin
 
 
 #
@@ -1030,7 +1769,211 @@ def do_cat(argv: list[str]) -> None:
 
 
 #
-# Count or drop duplicate Lines, no sort required
+# Align the Words of each Line into Columns
+#
+
+
+COLUMN_DOC = r"""
+
+    usage: column [-t] [--sample N]
+
+    align the Words of each Line into Columns, as wide as they show in the Terminal
+
+    options:
+      -t, --table  align as a Table, the only way we align (default: True)
+      --sample N   size the Columns from the first N Lines, and then stream the rest
+
+    comparable to:
+      |column -t
+
+    quirks:
+      counts East Asian Wide and Fullwidth Chars as 2 Columns, and Combining Marks as 0
+      reads twice, spilling a Pipe into a Temp File, to hold one Line in Memory, not all the Lines
+      streams the Lines after the Sample, widening no Column, so may misalign some Lines after it
+      keeps the Empty Lines, and places 2 Spaces between the Columns
+
+    examples:
+      ls -l |column -t  c  # aligns the Columns of Ls
+      cat syslog |column --sample 1000  # aligns quickly by the first 1000 Lines
+
+"""
+
+
+def do_column(argv: list[str]) -> None:
+    """Align the Words of each Line into Columns, as wide as they show in the Terminal"""
+
+    # Form Shell Args Parser
+
+    doc = COLUMN_DOC
+    table_help = "align as a Table, the only way we align (default: True)"
+    sample_help = "size the Columns from the first N Lines, and then stream the rest"
+
+    parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument("-t", "--table", action="count", help=table_help)
+    parser.add_argument("--sample", metavar="N", type=int, help=sample_help)
+
+    # Take up Shell Args
+
+    args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
+    ns = parser.parse_args_if(args)  # often prints help & exits zero
+
+    if (ns.sample is not None) and (ns.sample < 1):
+        parser.parser.print_usage()
+        eprint(f"column: --sample {ns.sample}: needs N >= 1")
+        sys.exit(2)  # exits 2 for bad Args
+
+    # Size the Columns from a Sample of Lines, and then stream all the Lines
+
+    if ns.sample is not None:
+        ilines = alt.stdin.read_iterlines()
+        sample = list(itertools.islice(ilines, ns.sample))
+
+        widths = lines_column_widths(sample)
+        olines = lines_iter_columns(itertools.chain(sample, ilines), widths=widths)
+        alt.stdout.write_iterlines(olines)
+
+        return
+
+    # Else size the Columns from all the Lines, and then read them all again
+
+    ifile = alt.stdin.read_seekable()  # may spill a Pipe into a Temp File
+    start = ifile.tell()
+
+    chunks = binary_file_iter_chunks(ifile, blocksize=BlockSize)
+    widths = lines_column_widths(chunks_iter_splitlines(chunks))
+
+    ifile.seek(start)
+    chunks = binary_file_iter_chunks(ifile, blocksize=BlockSize)
+    olines = lines_iter_columns(chunks_iter_splitlines(chunks), widths=widths)
+    alt.stdout.write_iterlines(olines)  # holds about one Block in memory, not all the Lines
+
+
+def lines_column_widths(lines: collections.abc.Iterable[str]) -> list[int]:
+    """Find how wide each Column of Words shows in the Terminal"""
+
+    batchsize = BatchSize
+
+    widths: list[int] = list()
+
+    it = iter(lines)
+    while True:
+        batch = list(itertools.islice(it, batchsize))
+        if not batch:
+            break
+
+        splits = list(map(str.split, batch))
+        join = "".join(batch)
+
+        # Find the Widths Line by Line, when very many Columns
+
+        if max(map(len, splits)) > 0x100:
+            for split in splits:
+                split_widths = map(str_display_width, split)
+                widths = list(map(max, itertools.zip_longest(widths, split_widths, fillvalue=0)))
+
+            continue
+
+        # Else find the Widths of the Batch Column by Column
+
+        columns = itertools.zip_longest(*splits, fillvalue="")
+        if join.isascii():
+            batch_widths = list(max(map(len, _)) for _ in columns)
+        else:
+            tables = itertools.repeat(display_width_translate_table)
+            batch_widths = list(max(map(len, map(str.translate, _, tables))) for _ in columns)
+
+        widths = list(map(max, itertools.zip_longest(widths, batch_widths, fillvalue=0)))
+
+    return widths
+
+
+def lines_iter_columns(
+    lines: collections.abc.Iterable[str], widths: list[int]
+) -> collections.abc.Iterator[str]:
+    """Pad each Word but the last, out to the Width of its Column, and join with 2 Spaces"""
+
+    tables = itertools.repeat(display_width_translate_table)
+    format_by_count: dict[int, str] = dict()  # such as '%-7s  %-5s  %s' for 3 Words
+
+    for line in lines:
+        words = line.split()
+        if not words:
+            yield ""
+            continue
+
+        count = len(words)
+        if count > len(widths):
+            widths = widths + (count - len(widths)) * [0]
+
+        # Pad the Words of a Line by one Printf-Style Format, when Len counts their Width
+
+        if line.isascii():
+            if count not in format_by_count.keys():
+                formats = list(f"%-{_}s" for _ in widths[: count - 1]) + ["%s"]
+                format_by_count[count] = "  ".join(formats)
+
+            yield format_by_count[count] % tuple(words)
+
+            continue
+
+        # Else pad Wide Chars less, and Combining Marks more
+
+        lens = map(len, words)
+        display_widths = map(len, map(str.translate, words, tables))
+        ljust_widths = map(operator.sub, widths, map(operator.sub, display_widths, lens))
+        padded = list(map(str.ljust, words[:-1], ljust_widths))
+
+        yield "  ".join(padded + words[-1:])
+
+        # pads no Word past the Width of its Column, when the Column was sized by a Sample
+
+
+class DisplayWidthTranslateTable(typing.Dict[int, str]):
+    """Translate each Char to Width * Char, so that Len counts the Width of a Translated Str"""
+
+    def __missing__(self, key: int) -> str:
+        """Learn the Width of a Char once, when first met"""
+
+        char = chr(key)
+        value = char_display_width(char) * char
+        self[key] = value
+
+        return value
+
+        # Str.Translate calls this for each Char not yet in the Table
+
+
+display_width_translate_table = DisplayWidthTranslateTable()
+
+
+def str_display_width(text: str) -> int:
+    """Count the Terminal Columns of a Str, as 2 for East Asian Wide, and 0 for Combining Marks"""
+
+    if text.isascii():
+        return len(text)
+
+    width = len(text.translate(display_width_translate_table))
+
+    return width
+
+
+def char_display_width(char: str) -> int:
+    """Count the Terminal Columns of a Char, as 2 for East Asian Wide, and 0 for Combining Marks"""
+
+    if unicodedata.combining(char):
+        return 0
+    if unicodedata.category(char) in ("Cf", "Me", "Mn"):  # Format, Enclosing, Nonspacing
+        return 0
+    if unicodedata.east_asian_width(char) in ("F", "W"):  # Fullwidth, Wide
+        return 2
+
+    return 1
+
+    # 1 for East Asian Ambiguous 'A', like a Western Terminal, not 2 like an East Asian Terminal
+
+
+#
+# Count or drop duplicate Lines, no sort required
 #
 
 
@@ -1076,8 +2019,17 @@ def do_counter(argv: list[str]) -> None:
 
     # Count or drop duplicate Lines, no sort required
 
-    ilines = alt.stdin.read_splitlines()
-    counter = collections.Counter(ilines)
+    ilines = alt.stdin.read_iterlines()
+    if not alt.mem_budget:
+        counter = collections.Counter(ilines)  # counts each Line as it arrives
+    else:
+        counter = collections.Counter()
+        size = 0
+        for iline in ilines:
+            if iline not in counter:
+                size += sys.getsizeof(iline) + 100  # guesses the Dict Entry costs 100 Bytes
+                mem_budget_exit_if(size, what="counting the distinct Lines")
+            counter[iline] += 1
 
     if ns.keys:
         olines = list(counter.keys())
@@ -1200,10 +2152,17 @@ DIFF_DOC = r"""
     comparable to:
       diff -brpu A B
 
+    quirks:
+      reads each File once, so <(...) Process Substitutions work, unlike with 'diff -brpu'
+      runs inside this Process, except to call on 'diff -brpu' to compare Dirs
+      matches Lines found once in each File first, and only then counts the fewest Edits
+      gives up on the fewest Edits deep inside big Files that share few Lines found once in each
+
     examples:
       d  # diff -brpu a b
       d y  # diff -brpu a y
       d x y  # diff -brpu x y
+      d <(echo a b c |i) <(echo a  b d |i)  # diff -brpu, but works
 
 """
 
@@ -1235,18 +2194,420 @@ def do_diff(argv: list[str]) -> None:
     else:
         (a, b) = (ns.a, ns.b)
 
-    # Do the Diff & exit
+    # Call on Diff to compare Dirs, & exit
 
-    shargv = ["diff", "-brpu", a, b]
-    shline = " ".join(shlex.quote(_) for _ in shargv)
-    eprint("+", shline)
+    if os.path.isdir(a) or os.path.isdir(b):
+        shargv = ["diff", "-brpu", a, b]
+        shline = " ".join(shlex.quote(_) for _ in shargv)
+        eprint("+", shline)
 
-    run = subprocess.run(shargv, stdin=None)
-    returncode = run.returncode
+        run = subprocess.run(shargv, stdin=None)
+        returncode = run.returncode
+
+        alt.stdout.fill_and_drain()  # leaves Pipe and Os Copy/Paste Buffer alone
+        if returncode:
+            sys.exit(returncode)  # silently exits nonzero after Diff exits nonzero
+
+        return
+
+    # Read each File once, even when it's a Pipe
+
+    try:
+        a_header = diff_file_header(a)
+        a_lines = diff_read_lines(a)
+        b_header = diff_file_header(b)
+        b_lines = diff_read_lines(b)
+    except OSError as exc:
+        eprint(f"d: {exc.filename}: {exc.strerror}")
+        sys.exit(2)  # exits 2 for trouble, like Diff does
+
+    # Do the Diff & exit
+
+    olines = diff_unified_lines(a_lines, b_lines, a_header=a_header, b_header=b_header)
+    sys.stdout.write("".join(olines))
+    sys.stdout.flush()
 
     alt.stdout.fill_and_drain()  # leaves Pipe and Os Copy/Paste Buffer alone
-    if returncode:
-        sys.exit(returncode)  # silently exits nonzero after Diff exits nonzero
+    if olines:
+        sys.exit(1)  # silently exits 1 when the Texts differ, like Diff does
+
+
+def diff_file_header(pathname: str) -> str:
+    """Form the Name and Modified Date of a File, as a Unified Diff Header"""
+
+    st = os.stat(pathname)
+    t = dt.datetime.fromtimestamp(st.st_mtime).astimezone()
+    ns = st.st_mtime_ns % 1_000_000_000
+
+    header = pathname + "\t" + t.strftime(f"%Y-%m-%d %H:%M:%S.{ns:09d} %z")
+    return header
+
+    # '2026-10-19 02:09:00.123456789 -0700' much as from 'diff -u' at Linux
+
+
+def diff_read_lines(pathname: str) -> list[str]:
+    """Read the Lines of a File, each with its Line-Break, but not after the last Line"""
+
+    with open(pathname, "rb") as reader:
+        ibytes = reader.read()
+
+    text = ibytes.decode(errors="surrogateescape")
+
+    lines = text.split("\n")
+    last = lines.pop()
+    lines = list((_ + "\n") for _ in lines)
+    if last:
+        lines.append(last)
+
+    return lines
+
+    # splits at "\n" only, like Diff does, not also at "\r" etc like Str.SplitLines
+
+
+DiffBlanksRegex = re.compile(r"\s+")
+DiffFuncRegex = re.compile(r"[A-Za-z_$]")  # like the -p of Diff at ^[[:alpha:]$_]
+
+
+def diff_unified_lines(
+    a: list[str], b: list[str], a_header: str, b_header: str, n: int = 3, offset: int = 0
+) -> list[str]:
+    """Form the Lines of a Diff -brpu of two Lists of Lines, after Offset Lines skipped"""
+
+    # Fold the Blanks of each Line, like the -b of Diff
+
+    keys: dict[str, int] = dict()
+    a_keys = list(keys.setdefault(DiffBlanksRegex.sub(" ", _).rstrip(), len(keys)) for _ in a)
+    b_keys = list(keys.setdefault(DiffBlanksRegex.sub(" ", _).rstrip(), len(keys)) for _ in b)
+
+    # Count the Diff, & succeed early if no Diff
+
+    matches: list[tuple[int, int]] = list()
+    diff_match_patience(a_keys, 0, len(a), b_keys, 0, len(b), matches=matches)
+
+    opcodes = diff_matches_opcodes(matches, a_len=len(a), b_len=len(b))
+    if not any((_[0] != "equal") for _ in opcodes):
+        return list()
+
+    # Form each Hunk
+
+    olines = ["--- " + a_header + "\n", "+++ " + b_header + "\n"]
+
+    func_index = 0
+    func = ""
+
+    for group in diff_opcodes_groups(opcodes, n=n):
+        (_, i1, _, j1, _) = group[0]
+        (_, _, i2, _, j2) = group[-1]
+
+        # Name the latest Func above the Hunk, like the -p of Diff
+
+        for line in a[func_index:i1]:
+            if DiffFuncRegex.match(line):
+                func = line.rstrip()[:40].rstrip()
+        func_index = max(func_index, i1)
+
+        a_range = diff_format_range(offset + i1, offset + i2)
+        b_range = diff_format_range(offset + j1, offset + j2)
+        olines.append(f"@@ -{a_range} +{b_range} @@" + (f" {func}" if func else "") + "\n")
+
+        # Form each Line of the Hunk
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                olines.extend(diff_marked_lines(" ", a[i1:i2]))
+                continue
+
+            olines.extend(diff_marked_lines("-", a[i1:i2]))
+            olines.extend(diff_marked_lines("+", b[j1:j2]))
+
+    return olines
+
+
+def diff_marked_lines(mark: str, lines: list[str]) -> list[str]:
+    """Mark each Line, and mark the last Line if it came without a Line-Break"""
+
+    olines = list((mark + _) for _ in lines)
+    if olines and not olines[-1].endswith("\n"):
+        olines[-1] += "\n" + "\\ No newline at end of file" + "\n"
+
+    return olines
+
+
+def diff_format_range(start: int, stop: int) -> str:
+    """Form the 'START,LENGTH' of a Unified Diff Hunk"""
+
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    if not length:
+        return f"{start},0"
+
+    return f"{start + 1},{length}"
+
+    # much like Python's difflib._format_range_unified
+
+
+def diff_matches_opcodes(
+    matches: list[tuple[int, int]], a_len: int, b_len: int
+) -> list[tuple[str, int, int, int, int]]:
+    """Convert the Matches to Op Codes, much like Python's difflib.SequenceMatcher does"""
+
+    opcodes: list[tuple[str, int, int, int, int]] = list()
+
+    (i, j) = (0, 0)
+    for ai, bj in matches + [(a_len, b_len)]:
+        if (i < ai) or (j < bj):
+            tag = "replace" if ((i < ai) and (j < bj)) else ("delete" if (i < ai) else "insert")
+            opcodes.append((tag, i, ai, j, bj))
+
+        if (ai, bj) != (a_len, b_len):
+            if opcodes and (opcodes[-1][0] == "equal"):
+                (_, i1, _, j1, _) = opcodes.pop()
+                opcodes.append(("equal", i1, ai + 1, j1, bj + 1))
+            else:
+                opcodes.append(("equal", ai, ai + 1, bj, bj + 1))
+
+        (i, j) = (ai + 1, bj + 1)
+
+    return opcodes
+
+
+def diff_opcodes_groups(
+    opcodes: list[tuple[str, int, int, int, int]], n: int
+) -> collections.abc.Iterator[list[tuple[str, int, int, int, int]]]:
+    """Group the Op Codes into Hunks, with N Lines of Context, much like Python's difflib does"""
+
+    codes = list(opcodes)
+
+    # Trim the Context at the Start and End
+
+    if codes and (codes[0][0] == "equal"):
+        (tag, i1, i2, j1, j2) = codes[0]
+        codes[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+
+    if codes and (codes[-1][0] == "equal"):
+        (tag, i1, i2, j1, j2) = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+
+    # Split the Hunks apart at long runs of Context
+
+    group: list[tuple[str, int, int, int, int]] = list()
+    for tag, i1, i2, j1, j2 in codes:
+        if (tag == "equal") and ((i2 - i1) > (2 * n)):
+            group.append((tag, i1, i1 + n, j1, j1 + n))
+            yield group
+
+            group = list()
+            (i1, j1) = (i2 - n, j2 - n)
+
+        group.append((tag, i1, i2, j1, j2))
+
+    if group and not ((len(group) == 1) and (group[0][0] == "equal")):
+        yield group
+
+
+DiffPatienceDepthMax = 32  # nests this deep into the Lines found once in each, and no deeper
+DiffMyersAreaMax = 1 << 24  # counts the fewest Edits only inside a Range this small, past that
+
+
+def diff_match_patience(
+    a: list[int],
+    alo: int,
+    ahi: int,
+    b: list[int],
+    blo: int,
+    bhi: int,
+    matches: list[tuple[int, int]],
+) -> None:
+    """Match the Lines found once in each, in order, then match more Lines between them"""
+
+    todos = [(alo, ahi, blo, bhi, 0)]  # each Range to match, and how deep it nests
+    while todos:
+        (alo, ahi, blo, bhi, depth) = todos.pop()
+        if depth < 0:
+            matches.append((alo, blo))  # takes (ai, -1, bj, -1, -1) as one Match to add
+            continue
+
+        # Match the Lines in common at the Start and End
+
+        while (alo < ahi) and (blo < bhi) and (a[alo] == b[blo]):
+            matches.append((alo, blo))
+            (alo, blo) = (alo + 1, blo + 1)
+
+        while (alo < ahi) and (blo < bhi) and (a[ahi - 1] == b[bhi - 1]):
+            (ahi, bhi) = (ahi - 1, bhi - 1)
+            todos.append((ahi, -1, bhi, -1, -1))  # adds the Tail after the Middle
+
+        if not ((alo < ahi) and (blo < bhi)):
+            continue
+
+        # Past the Max Depth, count the fewest Edits in a small Range, else match nothing more
+
+        if depth >= DiffPatienceDepthMax:
+            if (ahi - alo) * (bhi - blo) <= DiffMyersAreaMax:
+                diff_match_myers(a, alo, ahi, b, blo, bhi, matches=matches)
+            continue
+
+        # Match the Lines found once in each, in order, else count the fewest Edits
+
+        anchors = diff_anchors_find(a, alo, ahi, b, blo, bhi)
+        if not anchors:
+            diff_match_myers(a, alo, ahi, b, blo, bhi, matches=matches)
+            continue
+
+        nexts = list()
+        (ai, bj) = (alo, blo)
+        for ak, bk in anchors:
+            nexts.append((ai, ak, bj, bk, depth + 1))
+            nexts.append((ak, -1, bk, -1, -1))
+            (ai, bj) = (ak + 1, bk + 1)
+        nexts.append((ai, ahi, bj, bhi, depth + 1))
+
+        todos.extend(reversed(nexts))
+
+    # keeps a Stack of Todos, not a Stack of Calls, so as to never raise RecursionError
+    # gives up on the fewest Edits, deep inside big Files that share few Lines found once in each
+
+
+def diff_anchors_find(
+    a: list[int], alo: int, ahi: int, b: list[int], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """Find the longest run of the Lines found once in each, in order"""
+
+    a_counts = collections.Counter(a[alo:ahi])
+    b_counts = collections.Counter(b[blo:bhi])
+
+    b_index_by_key = dict()
+    for bj in range(blo, bhi):
+        key = b[bj]
+        if (b_counts[key] == 1) and (a_counts[key] == 1):
+            b_index_by_key[key] = bj
+
+    ais = list(ai for ai in range(alo, ahi) if a[ai] in b_index_by_key)
+    pairs = list((ai, b_index_by_key[a[ai]]) for ai in ais)
+
+    anchors = diff_longest_increasing(pairs)
+
+    return anchors
+
+
+def diff_longest_increasing(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Pick out the longest run of Pairs whose B Index rises as its A Index rises"""
+
+    tops: list[int] = list()  # the B Index atop each Pile
+    top_pairs: list[int] = list()  # the Index into Pairs atop each Pile
+    backs: list[int] = list()  # the Index into Pairs of the Pair atop the Pile to the left
+
+    for index, (_, bj) in enumerate(pairs):
+        pile = bisect.bisect_left(tops, bj)
+        backs.append(top_pairs[pile - 1] if pile else -1)
+        if pile < len(tops):
+            tops[pile] = bj
+            top_pairs[pile] = index
+        else:
+            tops.append(bj)
+            top_pairs.append(index)
+
+    picks: list[tuple[int, int]] = list()
+    index = top_pairs[-1] if top_pairs else -1
+    while index >= 0:
+        picks.append(pairs[index])
+        index = backs[index]
+
+    picks.reverse()
+
+    return picks
+
+
+def diff_match_myers(
+    a: list[int],
+    alo: int,
+    ahi: int,
+    b: list[int],
+    blo: int,
+    bhi: int,
+    matches: list[tuple[int, int]],
+) -> None:
+    """Match the most Lines, by finding the Middle Snake of the fewest Edits, in linear Space"""
+
+    # Match the Lines in common at the Start and End
+
+    while (alo < ahi) and (blo < bhi) and (a[alo] == b[blo]):
+        matches.append((alo, blo))
+        (alo, blo) = (alo + 1, blo + 1)
+
+    tails: list[tuple[int, int]] = list()
+    while (alo < ahi) and (blo < bhi) and (a[ahi - 1] == b[bhi - 1]):
+        (ahi, bhi) = (ahi - 1, bhi - 1)
+        tails.append((ahi, bhi))
+
+    # Split at the Middle Snake, when need be
+
+    if (alo < ahi) and (blo < bhi):
+        (x, y, u, v) = diff_middle_snake(a, alo, ahi, b, blo, bhi)
+
+        diff_match_myers(a, alo, x, b, blo, y, matches=matches)
+        matches.extend(zip(range(x, u), range(y, v)))
+        diff_match_myers(a, u, ahi, b, v, bhi, matches=matches)
+
+    matches.extend(reversed(tails))
+
+    # splits a Diff of D > 1 Edits into two Diffs of >= 1 Edits each, when Start & End differ
+
+
+def diff_middle_snake(
+    a: list[int], alo: int, ahi: int, b: list[int], blo: int, bhi: int
+) -> tuple[int, int, int, int]:
+    """Find the Diagonal run of Matches at the middle of the fewest Edits, per Myers 1986"""
+
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    odd = delta % 2
+
+    half = (n + m + 1) // 2 + 1
+    fwds = [0] * (2 * half + 2)  # the furthest X found forward along each K Diagonal
+    bwds = [0] * (2 * half + 2)  # the furthest X found backward along each K Diagonal
+
+    for d in range(half):
+
+        # Step forward from the Start
+
+        for k in range(-d, d + 1, 2):
+            if (k == -d) or ((k != d) and (fwds[k - 1] < fwds[k + 1])):
+                x = fwds[k + 1]
+            else:
+                x = fwds[k - 1] + 1
+            y = x - k
+
+            (x0, y0) = (x, y)
+            while (x < n) and (y < m) and (a[alo + x] == b[blo + y]):
+                (x, y) = (x + 1, y + 1)
+
+            fwds[k] = x
+            if odd and ((delta - (d - 1)) <= k <= (delta + (d - 1))):
+                if (fwds[k] + bwds[delta - k]) >= n:
+                    return (alo + x0, blo + y0, alo + x, blo + y)
+
+        # Step backward from the End
+
+        for k in range(-d, d + 1, 2):
+            if (k == -d) or ((k != d) and (bwds[k - 1] < bwds[k + 1])):
+                x = bwds[k + 1]
+            else:
+                x = bwds[k - 1] + 1
+            y = x - k
+
+            (x0, y0) = (x, y)
+            while (x < n) and (y < m) and (a[ahi - 1 - x] == b[bhi - 1 - y]):
+                (x, y) = (x + 1, y + 1)
+
+            bwds[k] = x
+            if (not odd) and (-d <= (delta - k) <= d):
+                if (bwds[k] + fwds[delta - k]) >= n:
+                    return (ahi - x, bhi - y, ahi - x0, bhi - y0)
+
+    assert False, (alo, ahi, blo, bhi)  # unreachable, since D <= N + M
 
 
 #
@@ -1610,25 +2971,48 @@ def dot_wiki(text: str) -> str:
 
 DATETIME_DOC = r"""
 
-    usage: dt|datetime [WORD ...]
+    usage: dt|datetime [-n N] [--warmup N] [--json] [--lines] [-j N] [WORD ...]
 
     do the thing, but show its date/time and pass/fail details
 
     positional arguments:
-      WORD  a word of command: first the shell verb, and then its options and args
+      WORD              a word of command: first the shell verb, and then its options and args
+
+    options:
+      -n N, --repeat N  run N times each Shell Command Line split apart by ':::', and show stats
+      --warmup N        run each Shell Command Line N more times first, but don't time those
+      --json            also show the same details as one Line of Json, for machines to parse
+      --lines           show the elapsed time and the gap before each Line of Stdout and Stderr
+      -j N, --jobs N    run N at a time of the Shell Command Lines split apart by ':::' Words
 
     comparable to:
       date && time ...; echo + exit $?
+      hyperfine --runs N --warmup N ...  # dt -n N --warmup N ...
+      /usr/bin/time -v ...  # Linux
+      /usr/bin/time -l ...  # macOS
 
     quirks:
       shows absolute date/time, elapsed date/time, and process exit status returncode
       shows the whole second in the California Pacific Time Zone, and the microsecond in UTC
       exits nonzero when the Shell Command exits nonzero
+      shows CPU user & sys time, max RSS, blocks in & out, and voluntary & involuntary switches
+      shows the max RSS of the largest Child Process, not a sum, but sums the rest over Runs
+      --repeat shows min, median, mean, p95, and stddev, and counts the slow outliers
+      --repeat drops the Stdout and closes the Stdin of each Run, but shows its Stderr
+      --repeat stops at the first Run to exit nonzero, and compares Medians when given 2+ Lines
+      --lines inserts a Blank Line after each pause of 1s or more
+      --lines holds back a partial Line till its Line-Break arrives, and ends the last Line
+      --jobs marks each Line of Output with '[1] ', '[2] ', etc, to say which Command wrote it
+      --jobs shows start, elapsed, exit, CPU, and max RSS of each Command, when all are done
+      --jobs exits with the exit status of the first Command to exit nonzero, else zero
 
     examples:
       dt  # shows when now is, and says nothing more
       dt sleep 0.123  # show how much slower observed time can be
       dt make requirements.txt  # show how fast a particular thing runs
+      dt -n 20 --warmup 3 -- 'seq 12345 |pq reverse' ::: 'seq 12345 |tac'  # compare two things
+      dt --lines make  # show which Lines of Output came slowly
+      dt -j 2 -- 'seq 12345 |pq reverse' ::: 'seq 12345 |tac'  # run two things at once
 
 """
 
@@ -1642,8 +3026,19 @@ def do_datetime(argv: list[str]) -> None:
 
     doc = DATETIME_DOC
     word_help = "a word of command: first the shell verb, and then its options and args"
+    repeat_help = "run N times each Shell Command Line split apart by ':::', and show stats"
+    warmup_help = "run each Shell Command Line N more times first, but don't time those"
+    json_help = "also show the same details as one Line of Json, for machines to parse"
+    lines_help = "show the elapsed time and the gap before each Line of Stdout and Stderr"
+    jobs_help = "run N at a time of the Shell Command Lines split apart by ':::' Words"
+
     parser = ArgDocParser(doc, add_help=False)
     parser.add_argument(dest="words", metavar="WORD", nargs="*", help=word_help)
+    parser.add_argument("-n", "--repeat", metavar="N", type=int, help=repeat_help)
+    parser.add_argument("--warmup", metavar="N", type=int, default=0, help=warmup_help)
+    parser.add_argument("--json", action="count", help=json_help)
+    parser.add_argument("--lines", action="count", help=lines_help)
+    parser.add_argument("-j", "--jobs", metavar="N", type=int, help=jobs_help)
 
     # Take up Shell Args
 
@@ -1651,11 +3046,35 @@ def do_datetime(argv: list[str]) -> None:
     if not argv[1:]:
         args = ["--", "true"]  # not as precise as '/usr/bin/true'
     else:
-        if not argv[1].startswith("-"):
-            args = ["--"] + argv[1:]
+        index = 1  # takes the leading Options, but quotes the Words after them
+        while (index < len(argv)) and argv[index].startswith("-") and (argv[index] != "--"):
+            index += 2 if (argv[index] in ("-n", "--repeat", "--warmup", "-j", "--jobs")) else 1
+
+        if (index < len(argv)) and (argv[index] != "--"):
+            args = argv[1:index] + ["--"] + argv[index:]
 
     ns = parser.parse_args_if(args)  # often prints help & exits zero
 
+    shlines = list()
+    if ns.repeat is not None:
+        shlines = dt_split_shlines(ns.words)
+        if (ns.repeat < 1) or (ns.warmup < 0) or (not shlines):
+            parser.parser.print_usage()
+            eprint("dt: --repeat needs N >= 1, --warmup needs N >= 0, and both need a WORD")
+            sys.exit(2)  # exits 2 for bad Args
+
+        if ns.lines or (ns.jobs is not None):
+            parser.parser.print_usage()
+            eprint("dt: choose one of --repeat, --lines, or --jobs")
+            sys.exit(2)  # exits 2 for bad Args
+
+    if ns.jobs is not None:
+        shlines = dt_split_shlines(ns.words)
+        if (ns.jobs < 1) or ns.lines or (not shlines):
+            parser.parser.print_usage()
+            eprint("dt: --jobs needs N >= 1, and a WORD, and doesn't mix with --lines")
+            sys.exit(2)  # exits 2 for bad Args
+
     # Do the thing, but show its date/time and pass/fail details
 
     t0 = dt.datetime.now(UTC)  # 2025-06-01 10:26:51 -0700  (2025-06-01 17:26:51.743258)
@@ -1671,13 +3090,26 @@ def do_datetime(argv: list[str]) -> None:
 
     eprint(f"{s0a}  ({s0b})  enter")
 
-    shargv = ns.words
-    shline = " ".join(shlex.quote(_) for _ in shargv)
-    eprint("+", shline)
+    ru0 = resource.getrusage(resource.RUSAGE_CHILDREN)
 
-    run = subprocess.run(shargv, shell=True, stdin=None)
-    returncode = run.returncode
-    eprint(f"+ exit {returncode}")  # printed even when zero
+    if ns.repeat is not None:
+        returncode = dt_repeat_shlines(shlines, repeat=ns.repeat, warmup=ns.warmup)
+    elif ns.jobs is not None:
+        returncode = dt_run_jobs(shlines, jobs=ns.jobs)
+    else:
+        shargv = ns.words
+        shline = " ".join(shlex.quote(_) for _ in shargv)
+        eprint("+", shline)
+
+        if ns.lines:
+            returncode = dt_run_lines(shargv)
+        else:
+            run = subprocess.run(shargv, shell=True, stdin=None)
+            returncode = run.returncode
+
+        eprint(f"+ exit {returncode}")  # printed even when zero
+
+    ru1 = resource.getrusage(resource.RUSAGE_CHILDREN)
 
     t1 = dt.datetime.now(UTC)
     s1a = t1.astimezone(Pacific).strftime("%Y-%m-%d %H:%M:%S %z")
@@ -1687,17 +3119,324 @@ def do_datetime(argv: list[str]) -> None:
     t1t0 = t1 - t0
     eprint(dt_timedelta_strftime(t1t0))  # '9ms331us' to mean 9ms 331us <= t < 9ms 333us
 
-    sys.exit(returncode)  # exits after Dating & Timing 1 Shell Command Line
+    # Show how the Child Processes spent their time
 
+    usage = dt_rusage_diff(ru0, ru1)
+    eprint(dt_rusage_strftime(usage))
 
-#
-# Call up Emacs inside the Terminal with no Menu Bar and no Splash
-#
+    if ns.json:
+        usage = dict(returncode=returncode, elapsed=t1t0.total_seconds()) | usage
+        eprint(json.dumps(usage))
 
+    sys.exit(returncode)  # exits after Dating & Timing 1 Shell Command Line
 
-EMACS_DOC = r"""
 
-    usage: e|em|emacs [WORD ...]
+def dt_rusage_diff(ru0: resource.struct_rusage, ru1: resource.struct_rusage) -> dict[str, float]:
+    """Say how much more Resource the Child Processes took, between two Get RUsage's"""
+
+    maxrss_scale = 1 if (sys.platform == "darwin") else 1024  # Bytes at macOS, else KiB
+
+    usage = dict(
+        user=round(ru1.ru_utime - ru0.ru_utime, 6),  # drops the Float noise below Microseconds
+        sys=round(ru1.ru_stime - ru0.ru_stime, 6),
+        maxrss=ru1.ru_maxrss * maxrss_scale,  # the max over all Children, not a difference
+        inblock=ru1.ru_inblock - ru0.ru_inblock,
+        oublock=ru1.ru_oublock - ru0.ru_oublock,
+        nvcsw=ru1.ru_nvcsw - ru0.ru_nvcsw,
+        nivcsw=ru1.ru_nivcsw - ru0.ru_nivcsw,
+    )
+
+    return usage
+
+
+def dt_seconds_strftime(seconds: float) -> str:
+    """Give '9ms331us' to mean 9ms 331us <= t < 9ms 333us"""
+
+    td = dt.timedelta(seconds=seconds)
+    chars = dt_timedelta_strftime(td)
+
+    return chars
+
+
+def dt_bytes_strftime(count: int) -> str:
+    """Give '12MiB' to mean 12MiB <= count < 13MiB, else 'KiB', else 'B'"""
+
+    if count >= (1 << 20):
+        return f"{count >> 20}MiB"
+    if count >= (1 << 10):
+        return f"{count >> 10}KiB"
+
+    return f"{count}B"
+
+
+def dt_rusage_strftime(usage: dict[str, float]) -> str:
+    """Give 'user 9ms sys 3ms  maxrss 12MiB  blocks in 0 out 8  switches 5 vol 2 invol'"""
+
+    user = dt_seconds_strftime(usage["user"])
+    sys_ = dt_seconds_strftime(usage["sys"])
+    rss = dt_bytes_strftime(int(usage["maxrss"]))
+
+    chars = f"user {user} sys {sys_}  maxrss {rss}"
+    chars += f"  blocks in {usage['inblock']} out {usage['oublock']}"
+    chars += f"  switches {usage['nvcsw']} vol {usage['nivcsw']} invol"
+
+    return chars
+
+    # much CPU User Time says CPU-Bound, much Blocks In/ Out says I/O-Bound,
+    # and much Elapsed Time with little of either says Waiting
+
+
+def dt_run_lines(shargv: list[str], pause: float = 1.0) -> int:
+    """Run a Shell Command, and show the elapsed time and the gap before each Line of Output"""
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    t0 = time.perf_counter()
+    t_prev = t0
+
+    pipe = subprocess.PIPE
+    proc = subprocess.Popen(shargv, shell=True, stdin=None, stdout=pipe, stderr=pipe)
+
+    # Mark each Line with the elapsed time, and the gap since the Line before
+
+    for writer, lines in dt_proc_iter_lines(proc):
+        t = time.perf_counter()
+
+        gap = t - t_prev
+        elapsed_chars = dt_seconds_strftime(t - t0)
+        gap_chars = "+" + dt_seconds_strftime(gap)
+
+        mark = f"{elapsed_chars:>10} {gap_chars:>10}  ".encode()
+        dent = f"{elapsed_chars:>10} {'+0s':>10}  ".encode()  # for Lines arriving together
+
+        obytes = b"\n" if ((gap >= pause) and (t_prev != t0)) else b""
+        obytes += mark + dent.join(lines)
+
+        writer.write(obytes)
+        writer.flush()
+
+        t_prev = t
+
+    returncode = proc.wait()
+
+    return returncode
+
+    # writes each Chunk at once, rather than one Line at a time, to keep up with chatty Output
+
+
+def dt_proc_iter_lines(
+    proc: subprocess.Popen[bytes],
+) -> collections.abc.Iterator[tuple[typing.BinaryIO, list[bytes]]]:
+    """Yield the whole Lines of each Chunk of Stdout & Stderr, with the Writer to copy them to"""
+
+    assert proc.stdout and proc.stderr, (proc.stdout, proc.stderr)
+
+    # Read whatever Chunk arrives next, from Stdout or from Stderr
+
+    selector = selectors.DefaultSelector()
+    selector.register(proc.stdout, selectors.EVENT_READ, data=sys.stdout.buffer)
+    selector.register(proc.stderr, selectors.EVENT_READ, data=sys.stderr.buffer)
+
+    partials: dict[int, bytes] = dict()
+    while selector.get_map():
+        for key, _ in selector.select():
+            fd = key.fd
+            writer = key.data
+
+            chunk = os.read(fd, 0x10000)
+
+            # Hold back a partial Line till its Line-Break arrives, or till End-of-Input
+
+            data = partials.pop(fd, b"") + chunk
+            if not chunk:
+                selector.unregister(fd)
+                lines = [data + b"\n"] if data else []  # ends the last Line with a Line-Break
+            else:
+                lines = data.split(b"\n")
+                partial = lines.pop()
+                if partial:
+                    partials[fd] = partial
+                lines = list((_ + b"\n") for _ in lines)
+
+            if lines:
+                yield (writer, lines)
+
+    selector.close()
+
+    proc.stdout.close()
+    proc.stderr.close()
+
+
+def dt_split_shlines(words: list[str]) -> list[str]:
+    """Split the Words apart at each ':::' Word, and join each run of Words into a Shell Line"""
+
+    shlines = list()
+
+    run: list[str] = list()
+    for word in words + [":::"]:
+        if word != ":::":
+            run.append(word)
+        elif run:
+            shlines.append(" ".join(run))
+            run = list()
+
+    return shlines
+
+    # joins the Words with Blanks, doesn't quote them, so they can speak |, <, >, etc
+
+
+def dt_run_jobs(shlines: list[str], jobs: int) -> int:
+    """Run N at a time of the Shell Command Lines, and show how each went, else a Returncode"""
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    for index, shline in enumerate(shlines):
+        eprint(f"+ [{index + 1}] {shline}")
+
+    t0 = time.perf_counter()
+
+    tags = list(f"[{_ + 1}] " for _ in range(len(shlines)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(dt_run_tagged, shlines, tags, itertools.repeat(t0)))
+
+    # Show how each went
+
+    rows = [["", "start", "elapsed", "exit", "user", "sys", "maxrss"]]
+    for tag, (start, elapsed, returncode, usage) in zip(tags, results):
+        row = [tag.strip(), "+" + dt_seconds_strftime(start), dt_seconds_strftime(elapsed)]
+        row.append(str(returncode))
+        row.extend([dt_seconds_strftime(usage["user"]), dt_seconds_strftime(usage["sys"])])
+        row.append(dt_bytes_strftime(int(usage["maxrss"])))
+        rows.append(row)
+
+    widths = list(max(len(_) for _ in column) for column in zip(*rows))
+    for row in rows:
+        eprint("  ".join(_.rjust(w) for _, w in zip(row, widths)))
+
+    returncodes = list(_[2] for _ in results)
+    returncode = next((_ for _ in returncodes if _), 0)
+
+    return returncode
+
+
+def dt_run_tagged(shline: str, tag: str, t0: float) -> tuple[float, float, int, dict[str, float]]:
+    """Run a Shell Command Line, mark each Line of its Output, and say how it went"""
+
+    t1 = time.perf_counter()
+
+    pipe = subprocess.PIPE
+    proc = subprocess.Popen(shline, shell=True, stdin=subprocess.DEVNULL, stdout=pipe, stderr=pipe)
+
+    mark = tag.encode()
+    for writer, lines in dt_proc_iter_lines(proc):
+        writer.write(mark + mark.join(lines))  # one Write per Chunk, to not mix with other Jobs
+        writer.flush()
+
+    (_, status, ru) = os.wait4(proc.pid, 0)  # takes the RUsage of just this Child
+    returncode = os.waitstatus_to_exitcode(status)
+    proc.returncode = returncode
+
+    t2 = time.perf_counter()
+
+    zeroes = resource.struct_rusage([0] * resource.struct_rusage.n_fields)
+    usage = dt_rusage_diff(zeroes, ru)
+
+    return (t1 - t0, t2 - t1, returncode, usage)
+
+
+def dt_repeat_shlines(shlines: list[str], repeat: int, warmup: int) -> int:
+    """Run each Shell Command Line again and again, and show Statistics, else a Returncode"""
+
+    medians: list[float] = list()
+    for shline in shlines:
+        eprint("+", shline)
+
+        # Run it, but time only the Runs after the Warmups
+
+        seconds_list: list[float] = list()
+        for index in range(warmup + repeat):
+            t0 = time.perf_counter()
+            run = subprocess.run(
+                shline, shell=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL
+            )
+            t1 = time.perf_counter()
+
+            returncode = run.returncode
+            if returncode:
+                eprint(f"+ exit {returncode}  # at Run {index + 1} of {warmup} + {repeat}")
+                return returncode
+
+            if index >= warmup:
+                seconds_list.append(t1 - t0)
+
+        # Show its Statistics
+
+        for line in dt_seconds_list_stats_lines(seconds_list, warmup=warmup):
+            eprint(line)
+
+        medians.append(statistics.median(seconds_list))
+
+    # Compare Medians, when given 2+ Shell Command Lines
+
+    if len(shlines) > 1:
+        fastest = min(range(len(shlines)), key=lambda _: medians[_])
+        eprint(f"fastest median: {shlines[fastest]}")
+
+        for shline, median in zip(shlines, medians):
+            if shline != shlines[fastest]:
+                ratio = median / medians[fastest] if medians[fastest] else math.inf
+                eprint(f"  {ratio:.2f}x slower: {shline}")
+
+    return 0
+
+
+def dt_seconds_list_stats_lines(seconds_list: list[float], warmup: int) -> list[str]:
+    """Show the Min, Median, Mean, P95, StdDev, and slow Outliers, of timed Runs"""
+
+    n = len(seconds_list)
+    sorts = sorted(seconds_list)
+
+    median = statistics.median(sorts)
+    mean = statistics.mean(sorts)
+    p95 = sorts[math.ceil(0.95 * n) - 1]  # the nearest rank, not interpolated
+    stdev = statistics.stdev(sorts) if (n > 1) else 0.0
+
+    def strf(seconds: float) -> str:
+        td = dt.timedelta(seconds=seconds)
+        return dt_timedelta_strftime(td)
+
+    lines = list()
+    lines.append(f"{n} runs after {warmup} warmups")
+    lines.append(
+        f"min {strf(sorts[0])}  median {strf(median)}  mean {strf(mean)}"
+        + f"  p95 {strf(p95)}  stddev {strf(stdev)}"
+    )
+
+    # Count the slow Outliers, by how far from the Median, per Iglewicz & Hoaglin 1993
+
+    mad = statistics.median(abs(_ - median) for _ in sorts)
+    if mad:
+        slow = median + 3.5 * mad / 0.6745  # a Modified Z-Score of 3.5
+        outliers = list(_ for _ in sorts if _ > slow)
+        if outliers:
+            lines.append(
+                f"{len(outliers)} outliers slower than {strf(slow)}, as slow as {strf(sorts[-1])}"
+                + " (try more --warmup, or a quieter machine)"
+            )
+
+    return lines
+
+
+#
+# Call up Emacs inside the Terminal with no Menu Bar and no Splash
+#
+
+
+EMACS_DOC = r"""
+
+    usage: e|em|emacs [WORD ...]
 
     call up Emacs inside the Terminal with no Menu Bar and no Splash
 
@@ -1755,7 +3494,7 @@ def _do_edit(argv: list[str], shverb: str, starts: list[str]) -> None:
     if (not argv_tails) or all(_.startswith("-") for _ in argv_tails):
         alt.stdin.fill_if()
         if not sys.stdout.isatty():
-            drain_path = alt.stdin.write_to_path_etc(iobytes=alt.stdin.iobytes)
+            drain_path = alt.stdin.write_to_path_etc(iobytes=alt.stdin.read_bytes())
         else:
             drain_path = alt.stdin.drain()
 
@@ -1846,34 +3585,16 @@ def do_expand(argv: list[str]) -> None:  # do_expandtabs
 def str_expand_plus(text: str) -> str:
     """Drop the enclosing Blanks, and replace other troublesome character encodings"""
 
-    ud = unicodedata
-
-    d = {
-        "\f": "<hr>",  # U+000C \f
-        ud.lookup("No-Break Space"): "&nbsp;",  # U+00A0 \xA0  # vs Apple ⌥Space
-        ud.lookup("Left-Pointing Double Angle Quotation Mark"): "<<",  # U+00AB «  # vs Microsoft
-        ud.lookup("Right-Pointing Double Angle Quotation Mark"): "<<",  # U+00BB »  # vs Microsoft
-        ud.lookup("Zero Width Space"): "'",  # U+200B &ZeroWidthSpace;
-        ud.lookup("En Dash"): "--",  # U+2013 –  # vs Microsoft
-        ud.lookup("Em Dash"): "---",  # U+2014 —  # vs Microsoft
-        ud.lookup("Left Single Quotation Mark"): "'",  # U+2018 ‘  # vs Microsoft
-        ud.lookup("Right Single Quotation Mark"): "'",  # U+2019 ’  # vs Microsoft
-        ud.lookup("Left Double Quotation Mark"): '"',  # U+201C “  # vs Microsoft
-        ud.lookup("Right Double Quotation Mark"): '"',  # U+201D ”  # vs Microsoft
-        ud.lookup("Horizontal Ellipsis"): "...",  # U+2026 …  # vs Microsoft
-        ud.lookup("Prime"): "'",  # U+2032 ′
-        ud.lookup("Double Prime"): "''",  # U+2032 ″
-        ud.lookup("Triple Prime"): "'''",  # U+2034 ‴
-    }
-
     otext = text
-    otext = otext.expandtabs(tabsize=8)
+    if "\t" in otext:
+        otext = otext.expandtabs(tabsize=8)
     otext = str_textify(otext)
-    for k, v in d.items():
-        otext = otext.replace(k, v)
+    otext = otext.translate(ExpandTranslateTable)  # replaces every Char in one Pass
 
     return otext
 
+    # expands Tabs before replacing Chars, because replacing Chars moves the Tab Stops
+
     # todo: |expand of Control Chars
 
     # todo: are we happy leaving « » Angle Quotation Marks in place as U+00AB U+00BB
@@ -1882,6 +3603,27 @@ def str_expand_plus(text: str) -> str:
     # todo: more conformity to PyPi·Org Black fuzz-the-eyes lowercase Hex
 
 
+ExpandCharsByChar = {
+    "\f": "<hr>",  # U+000C \f
+    unicodedata.lookup("No-Break Space"): "&nbsp;",  # U+00A0 \xA0  # vs Apple ⌥Space
+    unicodedata.lookup("Left-Pointing Double Angle Quotation Mark"): "<<",  # U+00AB «
+    unicodedata.lookup("Right-Pointing Double Angle Quotation Mark"): "<<",  # U+00BB »
+    unicodedata.lookup("Zero Width Space"): "'",  # U+200B &ZeroWidthSpace;
+    unicodedata.lookup("En Dash"): "--",  # U+2013 –  # vs Microsoft
+    unicodedata.lookup("Em Dash"): "---",  # U+2014 —  # vs Microsoft
+    unicodedata.lookup("Left Single Quotation Mark"): "'",  # U+2018 ‘  # vs Microsoft
+    unicodedata.lookup("Right Single Quotation Mark"): "'",  # U+2019 ’  # vs Microsoft
+    unicodedata.lookup("Left Double Quotation Mark"): '"',  # U+201C “  # vs Microsoft
+    unicodedata.lookup("Right Double Quotation Mark"): '"',  # U+201D ”  # vs Microsoft
+    unicodedata.lookup("Horizontal Ellipsis"): "...",  # U+2026 …  # vs Microsoft
+    unicodedata.lookup("Prime"): "'",  # U+2032 ′
+    unicodedata.lookup("Double Prime"): "''",  # U+2032 ″
+    unicodedata.lookup("Triple Prime"): "'''",  # U+2034 ‴
+}
+
+ExpandTranslateTable = str.maketrans(ExpandCharsByChar)
+
+
 #
 # Take Lines that match a Pattern
 #
@@ -2116,25 +3858,37 @@ def do_ht(argv: list[str]) -> None:
 
 JQ_DOC = r"""
 
-    usage: j|jq
+    usage: j|jq [--lines] [PATH]
 
     drop the Style out of Json Data
 
+    positional arguments:
+      PATH     pick out the Json Values found at a Path, such as .items[].id (default: .)
+
+    options:
+      --lines  read one Json Document per Line, and print each soon after it arrives
+
     comparable to:
       |jq .  # available by default in macOS nowadays
       |python3 -m json.tool --indent=2 --no-ensure-ascii
+      |python3 -m json.tool --json-lines --indent=2 --no-ensure-ascii  # |j --lines
+      |jq .items[].id  # |j .items[].id
 
     quirks:
       promotes the --indent=2 of Json, not the --indent=4 of Python
+      --lines skips Blank Lines, and spreads large Input across Processes, but keeps the Order
+      PATH reads one Json Document after another, and holds only the Values it picks out
+      PATH speaks only .KEY ."KEY" .["KEY"] .[INDEX] .[], not the rest of the Jq Language
 
     examples:
       python3 -c 'import json; print(json.dumps(dict(e=101, é=233)))' >j.json
       cat j.json |j  c
+      printf '{"a": 1}\n\n{"b": [2, 3]}\n' |j --lines  c
+      echo '{"items": [{"id": 1}, {"id": 2}]}' |j .items[].id  c
+      echo '[[1, 2], [3, 4]]' |j '.[][-1]'  c
 
 """
 
-# todo: usage: |j .
-
 
 def do_jq(argv: list[str]) -> None:
     """Drop the Style out of Json Data"""
@@ -2142,17 +3896,58 @@ def do_jq(argv: list[str]) -> None:
     # Form Shell Args Parser
 
     doc = JQ_DOC
+    path_help = "pick out the Json Values found at a Path, such as .items[].id (default: .)"
+    lines_help = "read one Json Document per Line, and print each soon after it arrives"
+
     parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument(dest="path", metavar="PATH", nargs="?", help=path_help)
+    parser.add_argument("--lines", action="store_true", help=lines_help)
 
     # Take up Shell Args
 
     args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
-    parser.parse_args_if(args)  # often prints help & exits zero
+    ns = parser.parse_args_if(args)  # often prints help & exits zero
+
+    steps = list()
+    if ns.path is not None:
+        try:
+            steps = json_path_split(ns.path)
+        except ValueError as exc:
+            parser.parser.print_usage()
+            eprint(f"|jq: {exc}")
+            sys.exit(2)  # exits 2 for bad Path
+
+    # Pick out the Json Values found at a Path, one Json Document after another
+
+    if ns.path is not None:
+        ichunks = alt.stdin.read_iterchunks()
+        reader = JsonChunksReader(ichunks)
+        ojsons = reader.iter_picks(steps)
+        dumps = (json.dumps(_, indent=2, ensure_ascii=False) for _ in ojsons)
+        otexts = jq_iter_else_exit(dumps, what=f"|jq {ns.path}")
+        alt.stdout.write_iterlines(otexts)  # |jq PATH textified by .json.dumps, we trust
+
+        return
+
+    # Drop the Style out of each Json Document of a Json Lines Stream
+
+    if ns.lines:
+        ilines = alt.stdin.read_iterlines()
+        olines = jq_iter_else_exit(jq_iter_lines(ilines), what="|jq --lines")
+        alt.stdout.write_iterlines(olines)  # |jq --lines textified by .json.dumps, we trust
+
+        return
 
     # Drop the Style out of Json Data
 
     itext = alt.stdin.read_text()
-    j = json.loads(itext)
+    mem_budget_exit_if(8 * len(itext), what="|jq loading the whole Json (try |jq PATH)")
+    try:
+        j = json.loads(itext)  # often takes 5x to 10x more Bytes than the Text
+    except ValueError as exc:
+        eprint(f"|jq: {exc}")
+        sys.exit(1)  # exits 1 for bad Json
+
     otext = json.dumps(j, indent=2, ensure_ascii=False) + "\n"
 
     otext_ = str_textify(otext)  # never need textify to |jq
@@ -2161,183 +3956,592 @@ def do_jq(argv: list[str]) -> None:
     alt.stdout.write_text(otext)  # |jq textified by .json.dumps, we trust and verify
 
 
-#
-# Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
-#
+def jq_iter_else_exit(
+    otexts: collections.abc.Iterable[str], what: str
+) -> collections.abc.Iterator[str]:
+    """Yield each Text, else exit 1 when the Json or the Path goes wrong"""
 
+    try:
+        yield from otexts
+    except ValueError as exc:  # such as json.JSONDecodeError
+        eprint(f"{what}: {exc}")
+        sys.exit(1)  # exits 1 for bad Json, or for a Path that doesn't fit the Json
 
-LESS_DOC = r"""
+    # catches the Errors late, while draining, because the Texts arrive only then
 
-    usage: k|less [WORD ...]
 
-    call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
+def jq_iter_lines(ilines: collections.abc.Iterable[str]) -> collections.abc.Iterator[str]:
+    """Drop the Style out of each Json Document, one Line per Document, and keep the Order"""
 
-    positional arguments:
-      WORD  a word of command: options and args of Less
+    it = iter(ilines)
+    batches = iter(lambda: list(itertools.islice(it, BatchSize)), list())
 
-    comparable to:
-      less -FIRX
+    # Work the first Batch in this Process, and quit there if the Input was small
 
-    quirks:
-      tells Less to show the Shell Pipe or Os Copy/Paste Buffer only when you give no Pos Args
-      do make people press ⌃R to search for strings as strings, not as regular expressions
-      do make people learn and spell out \< \> to search for whole words
+    lineno = 1  # counts the Lines, to say which Line holds bad Json
 
-    examples:
-      k  # shows the Os Copy/Paste Buffer
-      seq 123 |k  # shows a Pipe
+    batch = next(batches, list())
+    yield from jq_dumps_lines(batch, lineno=lineno)
+    lineno += len(batch)
 
-"""
+    workers = os.cpu_count() or 1
+    if (len(batch) < BatchSize) or (workers < 2):
+        for batch in batches:
+            yield from jq_dumps_lines(batch, lineno=lineno)
+            lineno += len(batch)
 
+        return
 
-def do_less(argv: list[str]) -> None:
-    """Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen"""
+    # Else work each next Batch in a Pool of Processes, but yield their Results in order
 
-    assert argparse.ZERO_OR_MORE == "*"
+    futures: collections.deque[concurrent.futures.Future[list[str]]]
+    futures = collections.deque()
 
-    # Form Shell Args Parser
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in batches:
+            future = executor.submit(jq_dumps_lines, batch, lineno)
+            lineno += len(batch)
+            futures.append(future)
+            if len(futures) >= (2 * workers):  # limits how much Input we hold
+                yield from futures.popleft().result()
 
-    doc = LESS_DOC
-    word_help = "a word of command: options and args of Less"
-    parser = ArgDocParser(doc, add_help=False)
-    parser.add_argument(dest="words", metavar="WORD", nargs="*", help=word_help)
+        while futures:
+            yield from futures.popleft().result()
 
-    # Take up Shell Args
 
-    args = ["--"] + argv[1:]  # quotes them all, to forward onto Emacs unchanged
-    parser.parse_args_if(args)  # often prints help & exits zero
+def jq_dumps_lines(ilines: list[str], lineno: int) -> list[str]:
+    """Drop the Style out of each Json Document of a Batch of Lines, but skip Blank Lines"""
 
-    # Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
+    otexts = list()
+    for index, iline in enumerate(ilines):
+        if iline.strip():
+            try:
+                j = json.loads(iline)
+            except json.JSONDecodeError as exc:
+                n = lineno + index
+                raise ValueError(f"line {n} column {exc.colno}: {exc.msg}") from None
 
-    shverb = "less"
-    starts = shlex.split("-FIRX")
+            otext = json.dumps(j, indent=2, ensure_ascii=False)
+            otexts.append(otext)
 
-    _do_edit(argv, shverb=shverb, starts=starts)
+    return otexts
 
+    # counts the Lines from 1 at the first Line of the first Batch, not at each Batch
 
-#
-# Lower the Case of each Word in each Line
-#
 
+JsonPathRegex = re.compile(
+    r"[.](?P<key>[A-Za-z_][A-Za-z_0-9]*)"
+    r'|[.]?(?P<quoted>"[^"\\]*(?:\\.[^"\\]*)*")'
+    r'|[.]?\[(?P<bracketed>"[^"\\]*(?:\\.[^"\\]*)*")\]'
+    r"|[.]?\[(?P<index>-?[0-9]+)\]"
+    r"|[.]?\[(?P<each>)\]"
+)
 
-LOWER_DOC = r"""
+JsonPathStep = tuple[str, typing.Any]  # ("key", str) or ("index", int) or ("each", None)
 
-    usage: lower
 
-    lower the Case of each Word in each Line
+def json_path_split(path: str) -> list[JsonPathStep]:
+    """Split a Path such as .items[].id into its Steps, else raise ValueError"""
 
-    examples:
-      ls -l |pq lower |cat -
+    if path == ".":
+        return list()
 
-"""
+    steps: list[JsonPathStep] = list()
 
+    index = 0
+    while index < len(path):
+        m = JsonPathRegex.match(path, pos=index)
+        if (not m) or ((index == 0) and not path.startswith(".")):
+            raise ValueError(f"can't split Path {path!r} at {path[index:]!r}")
 
-def do_lower(argv: list[str]) -> None:
-    """Lower the Case of each Word in each Line"""
+        index = m.end()
+        if m.group("key") is not None:
+            steps.append(("key", m.group("key")))
+        elif m.group("quoted") is not None:
+            steps.append(("key", json.loads(m.group("quoted"))))
+        elif m.group("bracketed") is not None:
+            steps.append(("key", json.loads(m.group("bracketed"))))
+        elif m.group("index") is not None:
+            steps.append(("index", int(m.group("index"))))
+        else:
+            steps.append(("each", None))
 
-    # Form Shell Args Parser
+    if not steps:
+        raise ValueError(f"can't split Path {path!r}")
 
-    doc = LOWER_DOC
+    return steps
 
-    parser = ArgDocParser(doc, add_help=False)
 
-    # Take up Shell Args
+def json_iter_picks(j: object, steps: list[JsonPathStep]) -> collections.abc.Iterator[object]:
+    """Pick out the Json Values found at a Path, inside a Json Value already in Memory"""
 
-    args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
-    parser.parse_args_if(args)  # often prints help & exits zero
+    if not steps:
+        yield j
+        return
 
-    # Lower the Case of each Word in each Line
+    (kind, arg) = steps[0]
+    more_steps = steps[1:]
 
-    itext = alt.stdin.read_text()
-    otext = itext.lower()
-    alt.stdout.write_text(otext)
+    if j is None:
+        if kind == "each":
+            raise ValueError("can't iterate over Json null")
+        yield from json_iter_picks(None, steps=more_steps)
 
+    elif kind == "key":
+        if not isinstance(j, dict):
+            raise ValueError(f"can't index Json {type(j).__name__} with {arg!r}")
+        yield from json_iter_picks(j.get(arg), steps=more_steps)
 
-#
-# Drop leading Blanks in each Line, or leading Chars of some other Set
-#
+    elif kind == "index":
+        if not isinstance(j, list):
+            raise ValueError(f"can't index Json {type(j).__name__} with {arg!r}")
+        value = j[arg] if (-len(j) <= arg < len(j)) else None
+        yield from json_iter_picks(value, steps=more_steps)
 
+    else:
+        assert kind == "each", (kind,)
+        if isinstance(j, dict):
+            for value in j.values():
+                yield from json_iter_picks(value, steps=more_steps)
+        elif isinstance(j, list):
+            for value in j:
+                yield from json_iter_picks(value, steps=more_steps)
+        else:
+            raise ValueError(f"can't iterate over Json {type(j).__name__}")
 
-LSTRIP_DOC = r"""
 
-    usage: lstrip [--charset CHARSET]
+JsonBlanksRegex = re.compile(r"[ \t\n\r]*")
+JsonScalarRegex = re.compile(r"[-+.0-9A-Za-z]+")
+JsonStringRegex = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', flags=re.DOTALL)
 
-    drop leading Blanks in each Line, or leading Chars of some other Set
+JsonDecoder = json.JSONDecoder()
 
-    options:
-      --charset CHARSET  list the Chars to drop if found, preferably in sorted order
 
-    comparable to:
-      |sed 's,^  *,,'
+class JsonChunksReader:
+    """Read Json Values one at a time out of Chunks of Text, holding only the Values picked"""
 
-    quirks:
-      doesn't drop leading Blank Lines
+    chunks: collections.abc.Iterator[str]
+    text: str = ""  # the Chunks read but not yet consumed
+    index: int = 0  # the next Char to consume
+    mark: int | None = None  # the first Char to keep, while copying out a Value
 
-    examples:
-      printf '\n\n      a3 a4 a5 \n   b2 b3       \n\n\n' |pq lstrip  |cat -etv  # left stripped
+    def __init__(self, chunks: collections.abc.Iterable[str]) -> None:
+        self.chunks = iter(chunks)
 
-"""
+    def fill(self) -> bool:
+        """Read one more Chunk, and drop the Text consumed, else return False at End-of-Input"""
 
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            return False
 
-def do_lstrip(argv: list[str]) -> None:
-    """Drop leading Blanks in each Line, or leading Chars of some other Set"""
+        # Read as much again as we keep, while inside a large Value, to copy less often
 
-    # Form Shell Args Parser
+        start = self.index if (self.mark is None) else self.mark
+        keep = len(self.text) - start
 
-    doc = LSTRIP_DOC
-    charset_help = "list the Chars to drop if found, preferably in sorted order"
+        chunks = [chunk]
+        size = len(chunk)
+        while size < keep:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
 
-    parser = ArgDocParser(doc, add_help=False)
-    parser.add_argument("--charset", metavar="CHARSET", help=charset_help)
+        # Drop the Text consumed
 
-    # Take up Shell Args
+        self.text = self.text[start:] + "".join(chunks)
+        self.index -= start
+        if self.mark is not None:
+            self.mark = 0
 
-    args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
-    ns = parser.parse_args_if(args)  # often prints help & exits zero
+        return True
 
-    charset = None if (ns.charset is None) else ns.charset  # maybe empty
+    def peek(self) -> str:
+        """Skip Blanks, and return the next Char, else return "" at End-of-Input"""
 
-    # Drop leading Blanks in each Line, or leading Chars of some other Set
+        while True:
+            m = JsonBlanksRegex.match(self.text, pos=self.index)
+            assert m, (m, self.index)
 
-    ilines = alt.stdin.read_splitlines()
-    olines = list(_.lstrip(charset) for _ in ilines)
-    alt.stdout.write_splitlines(olines)
+            self.index = m.end()
+            if self.index < len(self.text):
+                return self.text[self.index]
 
+            if not self.fill():
+                return ""
 
-#
-# Number the Lines
-#
+    def take(self, char: str) -> None:
+        """Consume the next Char, else raise ValueError"""
 
+        peek = self.peek()
+        if peek != char:
+            raise ValueError(f"expected {char!r} in Json, found {peek!r}")
 
-NL_DOC = """
+        self.index += 1
 
-    usage: n|nl [+N]
+    def decode_if(self) -> tuple[bool, object]:
+        """Consume the next Json Value, if the Text read so far holds all of it"""
 
-    number the Lines, up from one, or up from zero
+        peek = self.peek()
+        if peek not in '"[{':
+            return (False, None)  # Numbers & such might go on past the end of the Text
 
-    positional arguments:
-      +N  up from what (default: +1)
+        try:
+            (j, end) = JsonDecoder.raw_decode(self.text, self.index)
+        except json.JSONDecodeError:
+            return (False, None)  # falls back to walking the Value, when not whole in Memory
 
-    comparable to:
-      |nl -v0
-      |nl -v1
+        self.index = end
 
-    examples:
-      ls -l |n  c  # number as if by |cat -n |expand
-      ls -l |n +0  c  # number as if by |nl -v0 |expand
+        return (True, j)
 
-"""
+    def skip_string(self) -> str:
+        """Consume a Json String, and return its Source Text, else raise ValueError"""
 
+        while True:
+            m = JsonStringRegex.match(self.text, pos=self.index)
+            if m:
+                self.index = m.end()
+                return m.group()
 
-def do_nl(argv: list[str]) -> None:
-    """Number the Lines, up from one, or up from zero"""
+            if not self.fill():
+                raise ValueError("expected '\"' to close Json String, found End-of-Input")
 
-    assert argparse.OPTIONAL == "?"
+    def skip_scalar(self) -> None:
+        """Consume a Json Number, true, false, or null, else raise ValueError"""
 
-    # Form Shell Args Parser
+        while True:
+            m = JsonScalarRegex.match(self.text, pos=self.index)
+            if not m:
+                peek = self.text[self.index : self.index + 1]
+                raise ValueError(f"expected Json Value, found {peek!r}")
 
-    doc = NL_DOC
-    n_help = "up from what (default: +1)"
+            if m.end() < len(self.text):
+                self.index = m.end()
+                return
+
+            if not self.fill():
+                self.index = m.end()
+                return
+
+    def skip_value(self) -> None:
+        """Consume a Json Value, else raise ValueError"""
+
+        peek = self.peek()
+        if not peek:
+            raise ValueError("expected Json Value, found End-of-Input")
+
+        (ok, _) = self.decode_if()
+        if ok:
+            return
+
+        if peek == '"':
+            self.skip_string()
+        elif peek == "{":
+            for _ in self.iter_keys():
+                self.skip_value()
+        elif peek == "[":
+            for _ in self.iter_indices():
+                self.skip_value()
+        else:
+            self.skip_scalar()
+
+    def read_value(self) -> object:
+        """Consume a Json Value, and return it as Python Data, else raise ValueError"""
+
+        (ok, j) = self.decode_if()
+        if ok:
+            return j
+
+        self.mark = self.index
+        try:
+            self.skip_value()
+            text = self.text[self.mark : self.index]
+        finally:
+            self.mark = None
+
+        j = json.loads(text)
+        return j
+
+    def iter_keys(self) -> collections.abc.Iterator[str]:
+        """Consume a Json Object, yielding each Key, while the Caller consumes each Value"""
+
+        self.take("{")
+        if self.peek() == "}":
+            self.index += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise ValueError(f"expected '\"' to open Json Key, found {self.peek()!r}")
+
+            key = json.loads(self.skip_string())
+            self.take(":")
+            yield key
+
+            peek = self.peek()
+            self.index += 1
+            if peek == "}":
+                return
+            if peek != ",":
+                raise ValueError(f"expected ',' or '}}' in Json Object, found {peek!r}")
+
+    def iter_indices(self) -> collections.abc.Iterator[int]:
+        """Consume a Json Array, yielding each Index, while the Caller consumes each Value"""
+
+        self.take("[")
+        if self.peek() == "]":
+            self.index += 1
+            return
+
+        index = 0
+        while True:
+            yield index
+            index += 1
+
+            peek = self.peek()
+            self.index += 1
+            if peek == "]":
+                return
+            if peek != ",":
+                raise ValueError(f"expected ',' or ']' in Json Array, found {peek!r}")
+
+    def iter_picks(self, steps: list[JsonPathStep]) -> collections.abc.Iterator[object]:
+        """Pick out the Json Values found at a Path, one Json Document after another"""
+
+        while self.peek():
+            yield from self.iter_value_picks(steps)
+
+    def iter_value_picks(self, steps: list[JsonPathStep]) -> collections.abc.Iterator[object]:
+        """Pick out the Json Values found at a Path, inside the next Json Value"""
+
+        if not steps:
+            yield self.read_value()
+            return
+
+        (kind, arg) = steps[0]
+        more_steps = steps[1:]
+        peek = self.peek()
+
+        # Walk into the Json Object or Array, but skip past the Values not picked
+
+        walking = (kind == "key") and (peek == "{")
+        walking = walking or ((kind == "index") and (peek == "[") and (arg >= 0))
+
+        if walking:
+            found = False
+            places = self.iter_keys() if (peek == "{") else self.iter_indices()
+            for place in places:
+                if place != arg:
+                    self.skip_value()
+                else:
+                    found = True
+                    yield from self.iter_value_picks(more_steps)
+
+            if not found:
+                yield from json_iter_picks(None, steps=more_steps)
+
+        elif (kind == "each") and (peek in ("{", "[")):
+            places = self.iter_keys() if (peek == "{") else self.iter_indices()
+            for _ in places:
+                yield from self.iter_value_picks(more_steps)
+
+        # Count back from the end of a Json Array, while holding only the last few Values
+
+        elif (kind == "index") and (peek == "["):
+            tail: collections.deque[object] = collections.deque(maxlen=-arg)
+            for _ in self.iter_indices():
+                tail.append(self.read_value())
+
+            value = tail[0] if (len(tail) == -arg) else None
+            yield from json_iter_picks(value, steps=more_steps)
+
+        # Else read the whole Value into Memory, such as to raise the ValueError of a bad Step
+
+        else:
+            j = self.read_value()
+            yield from json_iter_picks(j, steps=steps)
+
+
+#
+# Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
+#
+
+
+LESS_DOC = r"""
+
+    usage: k|less [WORD ...]
+
+    call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
+
+    positional arguments:
+      WORD  a word of command: options and args of Less
+
+    comparable to:
+      less -FIRX
+
+    quirks:
+      tells Less to show the Shell Pipe or Os Copy/Paste Buffer only when you give no Pos Args
+      do make people press ⌃R to search for strings as strings, not as regular expressions
+      do make people learn and spell out \< \> to search for whole words
+
+    examples:
+      k  # shows the Os Copy/Paste Buffer
+      seq 123 |k  # shows a Pipe
+
+"""
+
+
+def do_less(argv: list[str]) -> None:
+    """Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen"""
+
+    assert argparse.ZERO_OR_MORE == "*"
+
+    # Form Shell Args Parser
+
+    doc = LESS_DOC
+    word_help = "a word of command: options and args of Less"
+    parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument(dest="words", metavar="WORD", nargs="*", help=word_help)
+
+    # Take up Shell Args
+
+    args = ["--"] + argv[1:]  # quotes them all, to forward onto Emacs unchanged
+    parser.parse_args_if(args)  # often prints help & exits zero
+
+    # Call up Less inside the Terminal, only if larger than Screen, and don't clear the Screen
+
+    shverb = "less"
+    starts = shlex.split("-FIRX")
+
+    _do_edit(argv, shverb=shverb, starts=starts)
+
+
+#
+# Lower the Case of each Word in each Line
+#
+
+
+LOWER_DOC = r"""
+
+    usage: lower
+
+    lower the Case of each Word in each Line
+
+    examples:
+      ls -l |pq lower |cat -
+
+"""
+
+
+def do_lower(argv: list[str]) -> None:
+    """Lower the Case of each Word in each Line"""
+
+    # Form Shell Args Parser
+
+    doc = LOWER_DOC
+
+    parser = ArgDocParser(doc, add_help=False)
+
+    # Take up Shell Args
+
+    args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
+    parser.parse_args_if(args)  # often prints help & exits zero
+
+    # Lower the Case of each Word in each Line
+
+    itext = alt.stdin.read_text()
+    otext = itext.lower()
+    alt.stdout.write_text(otext)
+
+
+#
+# Drop leading Blanks in each Line, or leading Chars of some other Set
+#
+
+
+LSTRIP_DOC = r"""
+
+    usage: lstrip [--charset CHARSET]
+
+    drop leading Blanks in each Line, or leading Chars of some other Set
+
+    options:
+      --charset CHARSET  list the Chars to drop if found, preferably in sorted order
+
+    comparable to:
+      |sed 's,^  *,,'
+
+    quirks:
+      doesn't drop leading Blank Lines
+
+    examples:
+      printf '\n\n      a3 a4 a5 \n   b2 b3       \n\n\n' |pq lstrip  |cat -etv  # left stripped
+
+"""
+
+
+def do_lstrip(argv: list[str]) -> None:
+    """Drop leading Blanks in each Line, or leading Chars of some other Set"""
+
+    # Form Shell Args Parser
+
+    doc = LSTRIP_DOC
+    charset_help = "list the Chars to drop if found, preferably in sorted order"
+
+    parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument("--charset", metavar="CHARSET", help=charset_help)
+
+    # Take up Shell Args
+
+    args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
+    ns = parser.parse_args_if(args)  # often prints help & exits zero
+
+    charset = None if (ns.charset is None) else ns.charset  # maybe empty
+
+    # Drop leading Blanks in each Line, or leading Chars of some other Set
+
+    ilines = alt.stdin.read_splitlines()
+    olines = list(_.lstrip(charset) for _ in ilines)
+    alt.stdout.write_splitlines(olines)
+
+
+#
+# Number the Lines
+#
+
+
+NL_DOC = """
+
+    usage: n|nl [+N]
+
+    number the Lines, up from one, or up from zero
+
+    positional arguments:
+      +N  up from what (default: +1)
+
+    comparable to:
+      |nl -v0
+      |nl -v1
+
+    examples:
+      ls -l |n  c  # number as if by |cat -n |expand
+      ls -l |n +0  c  # number as if by |nl -v0 |expand
+
+"""
+
+
+def do_nl(argv: list[str]) -> None:
+    """Number the Lines, up from one, or up from zero"""
+
+    assert argparse.OPTIONAL == "?"
+
+    # Form Shell Args Parser
+
+    doc = NL_DOC
+    n_help = "up from what (default: +1)"
 
     parser = ArgDocParser(doc, add_help=False)
     parser.add_argument(dest="n", metavar="+N", nargs="?", help=n_help)
@@ -2566,6 +4770,9 @@ REVERSE_DOC = """
       |tac  # at Linux
       |tail -r  # at macOS
 
+    quirks:
+      reads Blocks back from the end of a File, or of a Temp File spilled from a Pipe, to save Memory
+
     examples:
       ls -1 |r  c  # reverses the Sort-by-Name chosen by Ls
 
@@ -2585,14 +4792,11 @@ def do_reverse(argv: list[str]) -> None:
     args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
     parser.parse_args_if(args)  # often prints help & exits zero
 
-    # Reverse the order of Lines
-
-    ilines = alt.stdin.read_splitlines()
-
-    olines = list(ilines)  # todo: aka:  olines = list(reversed(ilines))
-    olines.reverse()
+    # Reverse the order of Lines, reading Blocks back from the end of a seekable File
 
-    alt.stdout.write_splitlines(olines)
+    ifile = alt.stdin.read_seekable()  # may spill a Pipe into a Temp File
+    olines = binary_file_iter_reversed_splitlines(ifile, blocksize=BlockSize)
+    alt.stdout.write_iterlines(olines)  # holds about one Block in memory, not all the Lines
 
 
 #
@@ -2782,47 +4986,110 @@ def do_sort(argv: list[str]) -> None:
             except ValueError:
                 pass
 
+            if math.isnan(float_):
+                float_ = -math.inf if descending else math.inf  # 'nan' comes last too
+
         return (float_, line)
 
         # todo: stop losing '|sort -n' precision by converting large Int's to Float
 
-    # Change the order of Lines
+    # Change the order of Lines, in Memory, or else by merging sorted Runs spilled to Disk
 
-    ilines = alt.stdin.read_splitlines()
+    ilines = alt.stdin.read_iterlines()  # takes each Line as it arrives
 
-    if not numeric:
-        olines = sorted(ilines)
-    else:
-        olines = sorted(ilines, key=keyfunc)
+    key = keyfunc if numeric else None
+    if alt.mem_budget:
+        runsize = alt.mem_budget // 4  # leaves room for the Keys, the Merge, and the Drain
+        imerge = lines_iter_sort_spilled(ilines, key=key, reverse=descending, runsize=runsize)
+        alt.stdout.write_iterlines(imerge)
+
+        return
 
+    olines = sorted(ilines, key=key)
     if descending:
         olines.reverse()
 
     alt.stdout.write_splitlines(olines)
 
 
-#
-# Break Lines apart into Words
-#
+def lines_iter_sort_spilled(
+    lines: collections.abc.Iterable[str],
+    key: collections.abc.Callable[[str], typing.Any] | None,
+    reverse: bool,
+    runsize: int,
+) -> collections.abc.Iterator[str]:
+    """Sort Lines in Runs that fit in Memory, spill each Run to Disk, and then merge the Runs"""
 
+    spills: list[typing.TextIO] = list()
 
-SPLIT_DOC = r"""
+    run: list[str] = list()
+    size = 0
+    for line in lines:
+        run.append(line)
+        size += sys.getsizeof(line) + 8  # counts the List Entry too
+        if size >= runsize:
+            spills.append(lines_spill_sorted(run, key=key, reverse=reverse))
+            run = list()
+            size = 0
 
-    usage: i|split [--sep SEP]
+    # Sort in Memory, if all the Lines fit
 
-    break Lines apart into Words
+    run.sort(key=key, reverse=reverse)
+    if not spills:
+        yield from run
+        return
 
-    options:
-      --sep SEP  split at each SEP, no matter if empty (default: split by Blanks & drop empty Words)
+    # Else merge the Runs, reading each Run back one Line at a time
 
-    comparable to:
-      |tr ' \t' '\n' |grep .
-      |tr + '\n'
+    readers = list((_.rstrip("\n") for _ in spill) for spill in spills)
+    yield from heapq.merge(*readers, run, key=key, reverse=reverse)
 
-    examples:
-      ls -l |i  c
-      ls -l |i --sep=' '  c
-      echo a+b++d |i --sep=+  c
+    for spill in spills:
+        spill.close()
+
+    # sorts equal Lines the same as .sort then .reverse, since the Key includes the whole Line
+
+
+def lines_spill_sorted(
+    lines: list[str], key: collections.abc.Callable[[str], typing.Any] | None, reverse: bool
+) -> typing.TextIO:
+    """Sort the Lines, write them to a Temp File, and hand back the File, rewound"""
+
+    lines.sort(key=key, reverse=reverse)
+
+    errors = "surrogateescape"
+    spill = tempfile.TemporaryFile("w+", encoding="utf-8", errors=errors, newline="\n")
+    for line in lines:
+        spill.write(line + "\n")
+    spill.seek(0)
+
+    return spill
+
+    # splits back at "\n" only, while the Lines of .read_iterlines hold no other Line-Break's
+
+
+#
+# Break Lines apart into Words
+#
+
+
+SPLIT_DOC = r"""
+
+    usage: i|split [--sep SEP]
+
+    break Lines apart into Words
+
+    options:
+      --sep SEP  split at each SEP, no matter if empty (default: split by Blanks & drop empty Words)
+
+    comparable to:
+      |tr ' \t' '\n' |grep .
+      |tr + '\n'
+
+    examples:
+      ls -l |i  c
+      ls -l |i --sep=' '  c
+      echo a+b++d |i --sep=+  c
 
 """
 
@@ -2847,9 +5114,11 @@ def do_split(argv: list[str]) -> None:
 
     # Break Lines apart into Words
 
-    itext = alt.stdin.read_text()
-    olines = itext.split(sep)  # raises ValueError("empty separator") when Sep is empty
-    alt.stdout.write_splitlines(olines)  # may write enclosing Blanks when not split by Blanks
+    "".split(sep)  # raises ValueError("empty separator") when Sep is empty
+
+    ichunks = alt.stdin.read_iterchunks()
+    olines = chunks_iter_split(ichunks, sep=sep)  # yields each Word as it arrives
+    alt.stdout.write_iterlines(olines)  # may write enclosing Blanks when not split by Blanks
 
 
 #
@@ -5438,6 +7707,255 @@ def do_vi(argv: list[str]) -> None:
     _do_edit(argv, shverb=shverb, starts=starts)
 
 
+#
+# Show a Date/Time-Stamp'ed Log of Changes
+#
+
+
+WATCH_DOC = r"""
+
+    usage: watch [-n SECONDS] [--count N] [WORD ...]
+
+    show a date/time-stamp'ed log of the changes to a file, or to the output of a command
+
+    positional arguments:
+      WORD        a File to watch, else a word of command to run again and again
+
+    options:
+      -n SECONDS  wait this long between Runs of the Command, or Polls of the File (default: 2)
+      --count N   quit after showing N Changes (default: run till ⌃C)
+
+    comparable to:
+      watch -d -n 2 ...  # Linux
+      inotifywait -m FILE  # Linux
+
+    quirks:
+      waits for Linux Inotify to say the File changed, else polls its Size and Modified Date/Time
+      skips the Snapshots that hash the same, and skips past the Lines in common at Start and End
+      shows each Change as a Diff -brpu, dated by the '---' and '+++' Lines of its Header
+      runs the Words as a Shell Command Line, like 'sh -c', and watches its Stdout and Stderr
+
+    examples:
+      pq watch  # shows these examples, and quits
+      pq watch /var/log/syslog  # shows each Change to a File
+      pq watch -n 1 ls -lA  # shows each Change to the Files of a Dir, once per second
+
+"""
+
+
+def do_watch(argv: list[str]) -> None:
+    """Show a date/time-stamp'ed log of the changes to a file, or to the output of a command"""
+
+    # Form Shell Args Parser
+
+    doc = WATCH_DOC
+    word_help = "a File to watch, else a word of command to run again and again"
+    n_help = "wait this long between Runs of the Command, or Polls of the File (default: 2)"
+    count_help = "quit after showing N Changes (default: run till ⌃C)"
+
+    parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument(dest="words", metavar="WORD", nargs="*", help=word_help)
+    parser.add_argument("-n", metavar="SECONDS", type=float, default=2.0, help=n_help)
+    parser.add_argument("--count", metavar="N", type=int, help=count_help)
+
+    # Take up Shell Args
+
+    args = argv[1:]  # sends [] to ask to print Closing
+    if argv[1:]:
+        index = 1  # takes the leading Options, but quotes the Words after them
+        while (index < len(argv)) and argv[index].startswith("-") and (argv[index] != "--"):
+            index += 2 if (argv[index] in ("-n", "--count")) else 1
+
+        if (index < len(argv)) and (argv[index] != "--"):
+            args = argv[1:index] + ["--"] + argv[index:]
+
+    ns = parser.parse_args_if(args)  # often prints help & exits zero
+
+    if (not ns.words) or (ns.n <= 0) or ((ns.count is not None) and (ns.count < 1)):
+        parser.parser.print_usage()
+        eprint("watch: needs a WORD, and -n SECONDS > 0, and --count N >= 1")
+        sys.exit(2)  # exits 2 for bad Args
+
+    # Watch a File, else the Output of a Command
+
+    words = ns.words
+    pathname = words[0] if (len(words) == 1) and os.path.isfile(words[0]) else ""
+    shline = " ".join(words)
+
+    alt.stdout.fill_and_drain()  # leaves Pipe and Os Copy/Paste Buffer alone
+
+    if pathname:
+        snapshots = watch_file_iter_snapshots(pathname, seconds=ns.n)
+    else:
+        snapshots = watch_shline_iter_snapshots(shline, seconds=ns.n)
+
+    watch_snapshots_show_changes(snapshots, label=(pathname or shline), count=ns.count)
+
+
+def watch_snapshots_show_changes(
+    snapshots: collections.abc.Iterator[bytes], label: str, count: int | None
+) -> None:
+    """Show each Change between Snapshots as a Diff, dated by its Header"""
+
+    t = dt.datetime.now().astimezone()
+    was_digest = b""
+    was_lines: list[str] = list()
+    was_header = ""
+
+    changes = 0
+    for data in snapshots:
+        t = dt.datetime.now().astimezone()
+        header = label + "\t" + t.strftime("%Y-%m-%d %H:%M:%S.%f %z")
+
+        # Skip the Snapshots that hash the same
+
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == was_digest:
+            continue
+
+        lines = data.decode(errors="surrogateescape").splitlines(keepends=True)
+
+        if not was_digest:
+            eprint(f"+ {header.replace(chr(9), '  ')}  # {len(lines)} Lines")
+        else:
+            olines = watch_diff_lines(was_lines, lines, a_header=was_header, b_header=header)
+            if olines:
+                sys.stdout.write("".join(olines))
+                sys.stdout.flush()
+
+                changes += 1
+                if (count is not None) and (changes >= count):
+                    break
+
+        was_digest = digest
+        was_lines = lines
+        was_header = header
+
+
+def watch_diff_lines(a: list[str], b: list[str], a_header: str, b_header: str) -> list[str]:
+    """Diff two Snapshots, but skip past the Lines in common at the Start and End"""
+
+    n = 3  # Lines of Context
+    block = 0x400  # compares this many Lines at a time, with no Python Loop per Line
+
+    size = min(len(a), len(b))
+
+    lo = 0
+    while ((lo + block) <= size) and (a[lo : (lo + block)] == b[lo : (lo + block)]):
+        lo += block
+    while (lo < size) and (a[lo] == b[lo]):
+        lo += 1
+
+    tail = 0
+    while (tail + block) <= (size - lo):
+        (a_stop, b_stop) = (len(a) - tail, len(b) - tail)
+        if a[(a_stop - block) : a_stop] != b[(b_stop - block) : b_stop]:
+            break
+        tail += block
+    while (tail < (size - lo)) and (a[-1 - tail] == b[-1 - tail]):
+        tail += 1
+
+    # Diff only the Lines that changed, and their Lines of Context
+
+    start = max(0, lo - n)
+    stop = max(0, tail - n)
+
+    a_mid = a[start : (len(a) - stop)]
+    b_mid = b[start : (len(b) - stop)]
+
+    olines = diff_unified_lines(a_mid, b_mid, a_header=a_header, b_header=b_header, offset=start)
+
+    return olines
+
+    # takes time in proportion to the Lines changed, plus a quick pass over the Lines in common
+
+
+def watch_file_iter_snapshots(pathname: str, seconds: float) -> collections.abc.Iterator[bytes]:
+    """Yield the Bytes of a File, and again each time it changes"""
+
+    path = pathname.encode()
+    fd = watch_inotify_open_if(pathname)
+
+    was_st = None
+    while True:
+
+        # Read the File again, when its Size or Modified Date/Time changes
+
+        try:
+            st = os.stat(path)
+            st_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            st_key = None
+
+        if st_key != was_st:
+            was_st = st_key
+            try:
+                with open(path, "rb") as reader:
+                    yield reader.read()
+            except FileNotFoundError:
+                yield b""
+
+        # Wait for Linux Inotify to speak, else wait to poll again
+
+        if fd is None:
+            time.sleep(seconds)
+        else:
+            select.select([fd], [], [])
+            time.sleep(0.050)  # waits for the Writes to settle, after the first Event
+            while select.select([fd], [], [], 0)[0]:
+                os.read(fd, 0x10000)  # drops the Events, and stats the File again
+
+
+def watch_inotify_open_if(pathname: str) -> int | None:
+    """Ask Linux Inotify to speak when the File or its Dir changes, else return None"""
+
+    libc_pathname = ctypes.util.find_library("c")
+    try:
+        libc = ctypes.CDLL(libc_pathname, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (AttributeError, OSError):
+        return None  # such as at macOS
+
+    in_modify = 0x2
+    in_attrib = 0x4
+    in_close_write = 0x8
+    in_moved_to = 0x80
+    in_create = 0x100
+    in_delete = 0x200
+    mask = in_modify | in_attrib | in_close_write | in_moved_to | in_create | in_delete
+
+    fd = inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        return None
+
+    dirname = os.path.dirname(os.path.abspath(pathname))
+    wd = inotify_add_watch(fd, dirname.encode(), ctypes.c_uint32(mask))
+    if wd < 0:
+        os.close(fd)
+        return None
+
+    return int(fd)
+
+    # watches the Dir, to see Editors that write a new File and then rename it over the old
+
+
+def watch_shline_iter_snapshots(shline: str, seconds: float) -> collections.abc.Iterator[bytes]:
+    """Yield the Stdout and Stderr of a Shell Command Line, again and again"""
+
+    while True:
+        run = subprocess.run(
+            shline,
+            shell=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+
+        yield run.stdout
+        time.sleep(seconds)
+
+
 #
 # Count the Lines
 #
@@ -5494,38 +8012,90 @@ def do_wcl(argv: list[str]) -> None:
 
 XARGS_DOC = r"""
 
-    usage: x|xargs [--sep SEP]
+    usage: x|xargs [--sep SEP] [-P N] [-n N] [--unordered] [WORD ...]
+
+    join the Lines into a single Line, or run a Command for each Line
 
-    join the Lines into a single Line
+    positional arguments:
+      WORD         a word of command, to run once per Line, with '{}' replaced by the Line
 
     options:
-      --sep SEP  the Char or Chars to place between each two Lines
+      --sep SEP    the Char or Chars to place between each two Lines
+      -P N         run N at a time of the Commands (default: 1)
+      -n N         pass N Lines at a time as the last Args of each Command (default: 1)
+      --unordered  write the Output of each Command as it exits, not in the Order of the Lines
 
     comparable to:
       |xargs
+      |xargs -P N -n N ...
+      |xargs -P N -I {} ... {} ...
+
+    quirks:
+      takes every Hint after '--' as a Word of the Command, not as a next Shell Pipe Filter
+      runs the Words as a Command, not as a Shell Line, so wrap '|', '<', '>', etc in 'sh -c'
+      passes each Line as the last Arg, unless some Word holds '{}' to replace, and skips Blank Lines
+      writes the Stdout of each Command into the Pipe, and its Stderr to Stderr
+      exits with the exit status of the first Command to exit nonzero, in the Order of the Lines
 
     examples:
       ls -l |i  x  c
+      cat hosts.txt |x -P 8 -- ssh {} uptime  # asks 8 Hosts at once, and writes in Order
+      seq 3 |x -P 3 --unordered -- sh -c 'sleep $((4 - $0)); echo $0'  # writes 3 2 1
 
 """
 
 
 def do_xargs(argv: list[str]) -> None:
-    """Join the Lines into a single Line"""
+    """Join the Lines into a single Line, or run a Command for each Line"""
 
     # Form Shell Args Parser
 
     doc = XARGS_DOC
+    word_help = "a word of command, to run once per Line, with '{}' replaced by the Line"
     sep_help = "the Char or Chars to place between each two Lines"
+    p_help = "run N at a time of the Commands (default: 1)"
+    n_help = "pass N Lines at a time as the last Args of each Command (default: 1)"
+    unordered_help = "write the Output of each Command as it exits, not in the Order of the Lines"
 
     parser = ArgDocParser(doc, add_help=False)
+    parser.add_argument(dest="words", metavar="WORD", nargs="*", help=word_help)
     parser.add_argument("--sep", metavar="SEP", help=sep_help)
+    parser.add_argument("-P", metavar="N", type=int, default=1, help=p_help)
+    parser.add_argument("-n", metavar="N", type=int, default=1, help=n_help)
+    parser.add_argument("--unordered", action="count", help=unordered_help)
 
     # Take up Shell Args
 
     args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
     ns = parser.parse_args_if(args)  # often prints help & exits zero
 
+    words = ns.words
+    if words:
+        if (ns.P < 1) or (ns.n < 1) or (ns.sep is not None):
+            parser.parser.print_usage()
+            eprint("|xargs: -P and -n need N >= 1, and --sep doesn't mix with a WORD")
+            sys.exit(2)  # exits 2 for bad Args
+
+        if (ns.n != 1) and any(("{}" in _) for _ in words):
+            parser.parser.print_usage()
+            eprint("|xargs: -n doesn't mix with '{}'")
+            sys.exit(2)  # exits 2 for bad Args
+
+        # Run a Command for each Line, or for each N Lines
+
+        iter_ilines = alt.stdin.read_iterlines()
+        iter_olines = xargs_run_iter_lines(
+            words, ilines=iter_ilines, jobs=ns.P, n=ns.n, unordered=bool(ns.unordered)
+        )
+        alt.stdout.write_iterlines(iter_olines)
+
+        return
+
+    if (ns.P != 1) or (ns.n != 1) or ns.unordered:
+        parser.parser.print_usage()
+        eprint("|xargs: -P, -n, and --unordered need a WORD")
+        sys.exit(2)  # exits 2 for bad Args
+
     sep = " " if (ns.sep is None) else ns.sep  # maybe empty
 
     # Join the Lines into a single Line
@@ -5539,6 +8109,87 @@ def do_xargs(argv: list[str]) -> None:
     # |xargs can start or end its 1 Output Line with Blanks when Sep is Blank
 
 
+def xargs_run_iter_lines(
+    words: list[str],
+    ilines: collections.abc.Iterable[str],
+    jobs: int,
+    n: int,
+    unordered: bool,
+) -> collections.abc.Iterator[str]:
+    """Run N at a time of the Commands, and yield each Line of their Stdout"""
+
+    # Form one Command for each Line, or for each N Lines, but skip Blank Lines
+
+    it = iter(_ for _ in ilines if _.strip())
+    batches = iter(lambda: list(itertools.islice(it, n)), list())
+
+    replacing = any(("{}" in _) for _ in words)
+    argvs = (
+        (list(_.replace("{}", batch[0]) for _ in words) if replacing else (words + batch))
+        for batch in batches
+    )
+
+    # Run N at a time, and yield their Lines in Order, else as each Command exits
+
+    futures: collections.deque[concurrent.futures.Future[subprocess.CompletedProcess[bytes]]]
+    futures = collections.deque()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        for shargv in argvs:
+            future = executor.submit(xargs_run, shargv)
+            futures.append(future)
+
+            if unordered:
+                if len(futures) >= jobs:
+                    (done, _) = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in list(done):
+                        futures.remove(future)
+                        yield from xargs_run_lines(future.result())
+
+            elif len(futures) >= (2 * jobs):  # limits how much Output we hold
+                yield from xargs_run_lines(futures.popleft().result())
+
+        if unordered:
+            for future in concurrent.futures.as_completed(list(futures)):
+                yield from xargs_run_lines(future.result())
+        else:
+            while futures:
+                yield from xargs_run_lines(futures.popleft().result())
+
+
+def xargs_run(shargv: list[str]) -> subprocess.CompletedProcess[bytes]:
+    """Run one Command, and keep its Stdout & Stderr"""
+
+    pipe = subprocess.PIPE
+    try:
+        run = subprocess.run(shargv, stdin=subprocess.DEVNULL, stdout=pipe, stderr=pipe)
+    except OSError as exc:  # such as FileNotFoundError
+        stderr = f"|xargs: {shargv[0]}: {exc.strerror}\n".encode()
+        run = subprocess.CompletedProcess(shargv, returncode=127, stdout=b"", stderr=stderr)
+
+    return run
+
+    # exits 127 when the Command isn't found, as Shells do
+
+
+def xargs_run_lines(run: subprocess.CompletedProcess[bytes]) -> list[str]:
+    """Write the Stderr of one Command, note how it exited, and give back its Stdout Lines"""
+
+    if run.stderr:
+        sys.stderr.buffer.write(run.stderr)
+        sys.stderr.buffer.flush()
+
+    if run.returncode and not alt.returncode:
+        alt.returncode = run.returncode
+
+    decode = run.stdout.decode(errors="surrogateescape")
+    lines = decode.splitlines()
+
+    return lines
+
+
 #
 # Mess about inside the Os/Copy Paste Buffer
 #
@@ -5546,17 +8197,32 @@ def do_xargs(argv: list[str]) -> None:
 
 XSHVERB_DOC = r"""
 
-    usage: pq [HINT ...]
+    usage: pq [--files GLOB] [--out-gz] [-e EXPR] [--batch] [-j N] [HINT ...]
 
     mess about inside the Os/Copy Paste Buffer
 
     positional arguments:
-      HINT  hint of which Shell Pipe Filter you mean
+      HINT          hint of which Shell Pipe Filter you mean, else a Python Expression of 'line'
+
+    options:
+      --files GLOB  read the Files that match, not Stdin, and pump each in parallel, while we can
+      --out-gz      compress the Output with Gzip, when draining to a Pipe or File, and its Copies
+      -e EXPR       a Python Expression to evaluate for each 'line', such as:  line.split()[2]
+      --batch       evaluate the Expression once per Chunk of 'lines', not once per 'line'
+      -j N          spread the Chunks of Lines across N Processes (default: 1)
 
     quirks:
       defaults to decode the Bytes as UTF-8, replacing decoding Errors with U+003F '?' Question-Mark's
       defaults to dedent the Lines, strip trailing Blanks from each Line, and end with 1 Line-Break
       defaults to drop leading and trailing Blank Lines, but not the Dent of the first Line
+      evaluates with the Names of 'p' defined, and imports the Modules named, such as 're' or 'np'
+      writes the 'line' for True, drops it for None or False, else writes the Str of what came back
+      takes a Hint as a Python Expression, if it's not a Shell Verb, and compiles, and names no Typos
+      takes Dotted Names as Python Funcs to call in order on each Line, such as:  str.casefold
+      passes in one Arg after a ':' Colon, ahead of the Line, or after it for Methods like str.split
+      pumps each File of --files through the Filters that work Line by Line, such as |a |g |pq -e
+      merges the Files in Sorted Order of Pathname, ahead of the first Filter that needs every Line
+      decompresses Stdin and the --files, when they start like BZip2, Gzip, or Xz, as if zcat
       more help at:  xshverb.py --help
 
     examples:
@@ -5565,6 +8231,12 @@ XSHVERB_DOC = r"""
       pq v  # dedents and strips the Os/Copy Paste Buffer, and then calls Vi to edit it
       printf '\n\n      a3 a4 a5 \n   b2 b3       \n\n\n' |pq  |cat -etv  # much stripped
       echo $'\xC0\x80' |pq |sort  # doesn't deny service to shout up "illegal byte sequence"
+      ls -l |pq 'line.split()[-1].upper()'  # takes the last Word of each Line, in upper case
+      cat bin/xshverb.py |pq -e 'len(line) > 99'  # takes the Lines longer than 99 Chars
+      seq 10 |pq --batch -e 'np.array(lines, dtype=int).cumsum()'  # sums up, with NumPy
+      pq str.casefold unicodedata.normalize:NFC str.strip  # calls these in order on each Line
+      pq --files '/var/log/*.log' a 1 u s -nr h  # counts the first Words of many Files at once
+      cat app.log.gz |pq --out-gz g ERROR >errors.log.gz  # keeps the Errors, still compressed
 
 """
 
@@ -5581,20 +8253,59 @@ def do_xshverb(argv: list[str]) -> None:  # def do_pq  # def do_p
     # Form Shell Args Parser
 
     doc = XSHVERB_DOC
-    hint_help = "hint of which Shell Pipe Filter you mean"
+    hint_help = "hint of which Shell Pipe Filter you mean, else a Python Expression of 'line'"
+    files_help = "read the Files that match, not Stdin, and pump each in parallel, while we can"
+    out_gz_help = "compress the Output with Gzip, when draining to a Pipe or File, and its Copies"
+    e_help = "a Python Expression to evaluate for each 'line', such as:  line.split()[2]"
+    batch_help = "evaluate the Expression once per Chunk of 'lines', not once per 'line'"
+    j_help = "spread the Chunks of Lines across N Processes (default: 1)"
 
     parser = ArgDocParser(doc, add_help=False)
     parser.add_argument(dest="hints", metavar="HINT", nargs="*", help=hint_help)
+    parser.add_argument("--files", metavar="GLOB", help=files_help)
+    parser.add_argument("--out-gz", action="store_true", help=out_gz_help)
+    parser.add_argument("-e", metavar="EXPR", help=e_help)
+    parser.add_argument("--batch", action="store_true", help=batch_help)
+    parser.add_argument("-j", metavar="N", type=int, default=1, help=j_help)
 
     # Take up Shell Args
 
     args = argv[1:] if argv[1:] else ["--"]  # ducks sending [] to ask to print Closing
     ns = parser.parse_args_if(args)  # often prints help & exits zero
 
+    if ns.j < 1:
+        parser.parser.print_usage()
+        eprint(f"|pq: -j {ns.j}: needs N >= 1")
+        sys.exit(2)  # exits 2 for bad Args
+
+    if (ns.files is not None) or ns.out_gz:  # as when taken by a Shell Pump later than the first
+        parser.parser.print_usage()
+        eprint("|pq: --files and --out-gz: work only at the start of the Pipe")
+        sys.exit(2)  # exits 2 for bad Args
+
+    if ns.e is not None:
+        if ns.hints:
+            hint = ns.hints[0]
+            eprint(f"xshverb: command not found: |pq {hint}")
+            sys.exit(2)  # exits 2 for bad Args
+
+        try:
+            python_code_compile(ns.e, names=(), batch=ns.batch)
+        except (ImportError, NameError, SyntaxError) as exc:
+            parser.parser.print_usage()
+            eprint(f"|pq -e: {type(exc).__name__}: {exc}")
+            sys.exit(2)  # exits 2 for bad Args
+
+        python_write_lines(ns.e, names=(), batch=ns.batch, jobs=ns.j)
+        return
+
     if ns.hints:
-        hint = ns.hints[0]  # todo: report more than first meaningless undefined Verb
-        # parser.parser.print_usage()
-        eprint(f"xshverb: command not found: |pq {hint}")
+        python_hints_write_lines(ns.hints, batch=ns.batch, jobs=ns.j)  # exits 2 for bad Hints
+        return
+
+    if ns.batch or (ns.j != 1):
+        parser.parser.print_usage()
+        eprint("|pq: --batch and -j: need a Python Expression, or Python Names")
         sys.exit(2)  # exits 2 for bad Args
 
     # Dedent and strip
@@ -5614,90 +8325,588 @@ def do_xshverb(argv: list[str]) -> None:  # def do_pq  # def do_p
             sys.stdout.write(otext)
 
 
-#
-# Amp up Import ArgParse
-#
+def python_hints_write_lines(hints: list[str], batch: bool, jobs: int) -> None:
+    """Evaluate the Hints as a Python Expression, or as a Chain of Python Names, else exit 2"""
 
+    hint = hints[0]  # todo: report more than first meaningless undefined Verb
 
-class ArgDocParser:
-    """Pick out Prog & Description & Epilog well enough to form an Argument Parser"""
+    expr = ""
+    names: tuple[str, ...] = tuple()
+    if all(str_is_python_name_ish(_) for _ in hints):
+        names = tuple(hints)
+    elif len(hints) == 1:
+        expr = hint
 
-    text: str  # something like the __main__.__doc__, but dedented and stripped
-    parser: argparse.ArgumentParser  # the inner standard ArgumentParser
-    closing: str  # the last Graf of the Epilog, minus its Top Line
+    try:
+        if not (expr or names):
+            raise NameError(hint)
+        python_code_compile(expr, names=names, batch=batch)
+    except (AttributeError, ImportError, NameError, SyntaxError, TypeError) as exc:
+        # parser.parser.print_usage()
+        eprint(f"xshverb: command not found: |pq {hint}")
+        if names:
+            eprint(f"|pq {' '.join(names)}: {type(exc).__name__}: {exc}")
+        sys.exit(2)  # exits 2 for bad Args
 
-    #
-    # Pick apart a Help Doc of Prog & Description & Epilog well enough to form a Parser
-    #
+    python_write_lines(expr, names=names, batch=batch, jobs=jobs)
 
-    def __init__(self, doc: str, add_help: bool) -> None:
-        """Pick out Prog & Description & Epilog well enough to form an Argument Parser"""
 
-        assert doc, (doc,)
+@functools.lru_cache(maxsize=None)
+def python_code_compile(
+    expr: str, names: tuple[str, ...], batch: bool
+) -> tuple[types.CodeType, dict[str, object]]:
+    """Compile a Python Expression, or a Chain of Python Names, to run over a Chunk of Lines"""
 
-        text = textwrap.dedent(doc).strip()
-        lines = text.splitlines()
+    globals_add_do_python_names()
+    namespace = dict(globals())
 
-        prog = self.scrape_prog(lines)
-        description = self.scrape_description(lines)
-        epilog = self.scrape_epilog(lines, description=description)
+    # Call each Python Name in order, else evaluate the Python Expression
 
-        closing = self.scrape_closing(epilog=epilog)
-        assert closing, (epilog, description, lines)
+    if names:
+        body = python_names_chain(names, namespace=namespace)
+    else:
+        body = python_expr_parse(expr, namespace=namespace)
 
-        parser = argparse.ArgumentParser(  # doesn't distinguish Closing from Epilog
-            prog=prog,
-            description=description,
-            add_help=add_help,
-            formatter_class=argparse.RawTextHelpFormatter,  # lets Lines be wide
-            epilog=epilog,
+    # Evaluate once per Chunk, not once per Line
+
+    if not batch:
+        target = ast.Name(id="line", ctx=ast.Store())
+        generator = ast.comprehension(
+            target=target, iter=ast.Name(id="lines", ctx=ast.Load()), ifs=[], is_async=0
         )
+        body = ast.ListComp(elt=body, generators=[generator])
 
-        self.text = text
-        self.parser = parser
-        self.closing = closing
+    expression = ast.Expression(body=body)
+    ast.fix_missing_locations(expression)
 
-        self.add_argument = parser.add_argument  # helps the Caller say '.parser.parser.' less often
+    expr_code = compile(expression, filename="<pq -e>", mode="eval")
 
-        # 'doc=' is the kind of Help Doc that comes from ArgumentParser.format_help
-        # 'add_help=False' for 'cal -h', 'df -h', 'du -h', 'ls -h', etc
+    return (expr_code, namespace)
 
-        # callers who want Options & Positional Arguments in the Parser have to add them
+    # compiles once per Process, so as to evaluate millions of Lines per second, not thousands
 
-    def scrape_prog(self, lines: list[str]) -> str:
-        """Pick the Prog out of the Usage Graf that starts the Doc"""
 
-        prog = lines[0].split()[1]  # second Word of first Line  # 'prog' from 'usage: prog'
+def python_expr_parse(expr: str, namespace: dict[str, object]) -> ast.expr:
+    """Parse a Python Expression, and refuse Names that aren't Builtins, nor Globals, nor Imports"""
 
-        return prog
+    tree = ast.parse(expr, filename="<pq -e>", mode="eval")  # raises SyntaxError
 
-    def scrape_description(self, lines: list[str]) -> str:
-        """Take the first Line of the Graf after the Usage Graf as the Description"""
+    bound = {"line", "lines"} | set(dir(builtins))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound.add(node.id)  # such as the 'x' of '[x for x in line.split()]'
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)  # such as the 'x' of 'lambda x: x'
 
-        firstlines: list[str] = list(_ for _ in lines if _ and (_ == _.lstrip()))
-        alt_description = firstlines[1]  # first Line of second Graf
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            name = node.id
+            if (name not in bound) and (name not in namespace.keys()):
+                raise NameError(f"name {name!r} is not defined")
 
-        description = alt_description
-        if self.docline_is_skippable(alt_description):
-            description = "just do it"
+            # Import the Modules named, rather than calling through a LazyImport per Line
 
-        return description
+            value = namespace.get(name)
+            if type(value) is LazyImport:
+                namespace[name] = importlib.import_module(value.import_)
 
-    def docline_is_skippable(self, docline: str) -> bool:
-        """Guess when a Doc Line can't be the first Line of the Epilog"""
+    return tree.body
 
-        strip = docline.rstrip()
 
-        skippable = not strip
-        skippable = skippable or strip.startswith(" ")  # includes .startswith("  ")
-        skippable = skippable or strip.startswith("usage")
-        skippable = skippable or strip.startswith("positional arguments")
-        skippable = skippable or strip.startswith("options")  # excludes "optional arguments"
+def python_names_chain(names: tuple[str, ...], namespace: dict[str, object]) -> ast.expr:
+    """Form one Python Expression to call each Python Name in order on each Line"""
 
-        return skippable
+    body: ast.expr = ast.Name(id="line", ctx=ast.Load())
+    for index, hint in enumerate(names):
+        (name, colon, arg_text) = hint.partition(":")
 
-    def scrape_epilog(self, lines: list[str], description: str) -> str | None:
-        """Take up the Lines past Usage, Positional Arguments, & Options, as the Epilog"""
+        (func, method) = python_name_resolve(name, namespace=namespace)
+
+        func_key = f"_pq_func_{index}_"
+        namespace[func_key] = func
+        func_node = ast.Name(id=func_key, ctx=ast.Load())
+
+        if not colon:
+            body = ast.Call(func=func_node, args=[body], keywords=[])
+            continue
+
+        # Pass in one Arg, ahead of the Line for Funcs, but after the Line for Methods
+
+        try:
+            arg = ast.literal_eval(arg_text)  # such as the 5 of 'str.zfill:5'
+        except (SyntaxError, ValueError):
+            arg = arg_text  # such as the 'NFC' of 'unicodedata.normalize:NFC'
+
+        arg_key = f"_pq_arg_{index}_"
+        namespace[arg_key] = arg
+        arg_node = ast.Name(id=arg_key, ctx=ast.Load())
+
+        args = [body, arg_node] if method else [arg_node, body]
+        body = ast.Call(func=func_node, args=args, keywords=[])
+
+    return body
+
+    # composes the Calls into one Expression, with no Encode/ Decode between them
+
+
+def python_name_resolve(name: str, namespace: dict[str, object]) -> tuple[object, bool]:
+    """Find the Func of a Dotted Python Name, and say if it's a Method of a Class"""
+
+    splits = name.split(".")
+
+    # Find the first Name as a Global or a Builtin, and import it, if need be
+
+    head = splits[0]
+    if head in namespace.keys():
+        value = namespace[head]
+    elif hasattr(builtins, head):
+        value = getattr(builtins, head)
+    else:
+        raise NameError(f"name {head!r} is not defined")
+
+    if type(value) is LazyImport:
+        value = importlib.import_module(value.import_)
+
+    # Find each next Name as an Attribute, else as a Module to import
+
+    parent: object = None
+    for index, split in enumerate(splits[1:], start=1):
+        parent = value
+        if hasattr(value, split):
+            value = getattr(value, split)
+        elif isinstance(value, types.ModuleType):
+            value = importlib.import_module(".".join(splits[: (index + 1)]))
+        else:
+            raise AttributeError(f"{'.'.join(splits[:index])!r} has no attribute {split!r}")
+
+    if not callable(value):
+        raise TypeError(f"{name!r} is not callable")
+
+    method = isinstance(parent, type)
+
+    return (value, method)
+
+
+def python_eval_lines(expr: str, names: tuple[str, ...], batch: bool, lines: list[str]) -> list[str]:
+    """Evaluate a Python Expression, or a Chain of Python Names, over one Chunk of Lines"""
+
+    (expr_code, namespace) = python_code_compile(expr, names=names, batch=batch)
+
+    namespace["lines"] = lines
+    results = eval(expr_code, namespace)
+
+    olines: list[str] = list()
+
+    # Write each Line of what came back for the Chunk
+
+    if batch:
+        if isinstance(results, str):
+            olines.extend(results.splitlines())
+        elif not isinstance(results, collections.abc.Iterable):
+            olines.append(str(results))
+        else:
+            olines.extend(str(_) for _ in results if _ is not None)
+
+        return olines
+
+    # Write the Line for True, drop it for None or False, else write the Str of what came back
+
+    for line, result in zip(lines, results):
+        if result is True:
+            olines.append(line)
+        elif (result is None) or (result is False):
+            continue
+        elif isinstance(result, str):
+            olines.append(result)
+        else:
+            olines.append(str(result))
+
+    return olines
+
+
+def python_write_lines(expr: str, names: tuple[str, ...], batch: bool, jobs: int) -> None:
+    """Evaluate a Python Expression, or a Chain of Python Names, and write what comes back"""
+
+    ichunks = alt.stdin.read_iterchunks()
+    ilists = _chunks_iter_splitlines_lists(ichunks)
+
+    olists = python_eval_iter_lists(ilists, expr=expr, names=names, batch=batch, jobs=jobs)
+    olines = itertools.chain.from_iterable(olists)
+
+    alt.stdout.write_iterlines(olines)
+
+    # streams a Chunk at a time, and so works with |head of a bottomless Stdin
+
+
+def python_eval_iter_lists(
+    ilists: collections.abc.Iterable[list[str]],
+    expr: str,
+    names: tuple[str, ...],
+    batch: bool,
+    jobs: int,
+) -> collections.abc.Iterator[list[str]]:
+    """Evaluate each Chunk of Lines in this Process, else in a Pool of Processes, in order"""
+
+    lineno = 1  # counts the Lines, to say which Line raised an Exception
+
+    if jobs < 2:
+        for ilines in ilists:
+            try:
+                olines = python_eval_lines(expr, names=names, batch=batch, lines=ilines)
+            except Exception as exc:
+                python_eval_exit(exc, expr, names=names, batch=batch, lines=ilines, lineno=lineno)
+
+            yield olines
+            lineno += len(ilines)
+
+        return
+
+    # Send each Chunk to the Pool, but yield their Results in order
+
+    pendings: collections.deque[tuple[list[str], concurrent.futures.Future[list[str]]]]
+    pendings = collections.deque()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        for ilines in ilists:
+            future = executor.submit(python_eval_lines, expr, names, batch, ilines)
+            pendings.append((ilines, future))
+            if len(pendings) >= (2 * jobs):  # limits how much Input we hold
+                (ilines_, future_) = pendings.popleft()
+                try:
+                    yield future_.result()
+                except Exception as exc:
+                    python_eval_exit(
+                        exc, expr, names=names, batch=batch, lines=ilines_, lineno=lineno
+                    )
+                lineno += len(ilines_)
+
+        while pendings:
+            (ilines_, future_) = pendings.popleft()
+            try:
+                yield future_.result()
+            except Exception as exc:
+                python_eval_exit(exc, expr, names=names, batch=batch, lines=ilines_, lineno=lineno)
+            lineno += len(ilines_)
+
+    # sends the Source of the Python, not its Code, and each Process compiles it once
+
+
+def python_eval_exit(
+    exc: Exception, expr: str, names: tuple[str, ...], batch: bool, lines: list[str], lineno: int
+) -> typing.NoReturn:
+    """Say which Line raised an Exception, and exit 1"""
+
+    where = f"lines {lineno}..{lineno + len(lines) - 1}"
+
+    # Evaluate the Lines one at a time, to find the first Line that raises an Exception
+
+    if not batch:
+        for index, line in enumerate(lines):
+            try:
+                python_eval_lines(expr, names=names, batch=batch, lines=[line])
+            except Exception as exc_:
+                exc = exc_
+                where = f"line {lineno + index}"
+                break
+
+    eprint(f"|pq: {where}: {type(exc).__name__}: {exc}")
+    sys.exit(1)  # exits 1 for a Python Exception raised while evaluating the Lines
+
+    # names the first Line only when evaluating each Line apart, not at |pq --batch
+
+
+def str_is_python_name_ish(text: str) -> bool:
+    """Guess when a Str is a Dotted Python Name, maybe with a ':' Colon and one Arg after it"""
+
+    name = text.partition(":")[0]
+    if ("." not in name) or (name == "."):
+        return False
+
+    return str_is_identifier_ish(name)
+
+
+#
+# Read many Files at once, pumping each File in parallel, while the Filters work Line by Line
+#
+
+
+LineLocalVerbs = ("awk", "dent", "grep", "lower", "lstrip", "rstrip", "strip", "title", "upper")
+
+
+def out_gz_shell_pumps_take_if(shpumps: list[ShellPump]) -> None:
+    """Take a leading 'pq --out-gz', to compress the Drain and the Shadow Copies"""
+
+    shpump = shpumps[0]
+    argv = shpump.argv
+    if shpump.verb != "xshverb":
+        return
+
+    options = argv[: argv.index("--")] if ("--" in argv) else argv
+    if "--out-gz" not in options:
+        return
+
+    argv.remove("--out-gz")
+    alt.out_gz = True
+
+    if (argv == ["pq"]) and shpumps[1:]:
+        del shpumps[0]  # drops the plain |pq, when the Pipe does more than dedent and strip
+
+
+def files_shell_pumps_take_if(shpumps: list[ShellPump]) -> None:
+    """Replace a leading 'pq --files GLOB', and the Line-Local Shell Pumps after it"""
+
+    shpump = shpumps[0]
+    argv = shpump.argv
+    if shpump.verb != "xshverb":
+        return
+
+    # Take the GLOB out of the Args of the first Shell Pump
+
+    pattern = None
+    for index, arg in enumerate(argv):
+        if arg == "--":
+            break
+
+        if arg.startswith("--files="):
+            pattern = arg.partition("=")[-1]
+            del argv[index]
+            break
+
+        if (arg == "--files") and argv[index + 1 :]:
+            pattern = argv[index + 1]
+            del argv[index : index + 2]
+            break
+
+    if pattern is None:
+        return
+
+    pathnames = sorted(glob.glob(os.path.expanduser(pattern), recursive=True))
+    pathnames = list(_ for _ in pathnames if os.path.isfile(_))
+    if not pathnames:
+        eprint(f"|pq: --files {pattern}: no Files match")
+        sys.exit(2)  # exits 2 for bad Args
+
+    # Take the Shell Pumps that work Line by Line, to pump in parallel, File by File
+
+    count = 1
+    verb_argvs: list[tuple[str, list[str]]] = list()
+    if argv[1:]:
+        count = 0  # doesn't drop a first Shell Pump that still has work to do
+
+    for shpump in shpumps[count:]:
+        if not shell_pump_is_line_local(shpump):
+            break
+
+        verb_argvs.append((shpump.verb, shpump.argv))
+        count += 1
+
+    files_shpump = ShellPump()
+    files_shpump.vb = "pq"
+    files_shpump.verb = "xshverb"
+    files_shpump.doc = XSHVERB_DOC
+    files_shpump.func = lambda argv: files_write_lines(pathnames, verb_argvs=verb_argvs)
+    files_shpump.argv = ["pq", "--files", pattern]
+
+    shpumps[:count] = [files_shpump]
+
+
+def shell_pump_is_line_local(shpump: ShellPump) -> bool:
+    """Say if a Shell Pump works on each Line alone, so working File by File changes nothing"""
+
+    verb = shpump.verb
+    args = shpump.argv[1:]
+
+    if verb in LineLocalVerbs:
+        return True
+
+    if verb == "split":
+        return not args  # splits at Blanks, not across Line-Breaks at a --sep
+
+    if verb == "xshverb":
+        return bool(args) and not any(_ in ("--batch", "-j", "--files") for _ in args)
+
+    return False
+
+    # says False for |pq dedent, |pq expand, and plain |pq, which look at all the Lines at once
+
+
+def files_write_lines(pathnames: list[str], verb_argvs: list[tuple[str, list[str]]]) -> None:
+    """Pump each File in a Pool of Processes, and write what comes back, in order"""
+
+    olists = files_pump_iter_lists(pathnames, verb_argvs=verb_argvs)
+    olines = itertools.chain.from_iterable(olists)
+
+    alt.stdout.write_iterlines(olines)
+
+    # streams a File at a time, and so holds only a few Files in Memory
+
+
+def files_pump_iter_lists(
+    pathnames: list[str], verb_argvs: list[tuple[str, list[str]]]
+) -> collections.abc.Iterator[list[str]]:
+    """Pump each File in a Pool of Processes, but yield their Lines in order"""
+
+    jobs = min(len(pathnames), os.cpu_count() or 1)
+
+    pendings: collections.deque[tuple[str, concurrent.futures.Future[tuple[bytes, str]]]]
+    pendings = collections.deque()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        for pathname in pathnames:
+            future = executor.submit(files_pump_one, pathname, verb_argvs)
+            pendings.append((pathname, future))
+            if len(pendings) >= (2 * jobs):  # limits how much Output we hold
+                yield files_future_splitlines(*pendings.popleft())
+
+        while pendings:
+            yield files_future_splitlines(*pendings.popleft())
+
+    # merges in the Sorted Order of the Pathnames, not in the order that the Files finish
+
+
+def files_future_splitlines(
+    pathname: str, future: concurrent.futures.Future[tuple[bytes, str]]
+) -> list[str]:
+    """Wait for one File to finish, and split its Lines, but first report its Errors if any"""
+
+    try:
+        (obytes, stderr) = future.result()
+    except Exception as exc:  # such as a BrokenProcessPool
+        (obytes, stderr) = (b"", f"|pq --files: {pathname}: {type(exc).__name__}: {exc}")
+
+    if stderr:
+        eprint(stderr)
+        alt.returncode = 1
+
+    splitlines = obytes.decode(errors="surrogateescape").splitlines()
+
+    return splitlines
+
+
+def files_pump_one(pathname: str, verb_argvs: list[tuple[str, list[str]]]) -> tuple[bytes, str]:
+    """Pump one File through the Line-Local Shell Pumps, inside this Process"""
+
+    try:
+        ibytes = bytes_decompress_if(pathlib.Path(pathname).read_bytes())
+    except OSError as exc:
+        return (b"", f"|pq --files: {pathname}: {exc.strerror}")
+
+    alt.stdout = ShellFile()  # replaces, inside this Process
+    alt.stdout.write_bytes(ibytes)
+
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            for index, (verb, argv) in enumerate(verb_argvs, start=1):
+                alt.index = index  # never 0, because the File came before
+                alt.rindex = index - len(verb_argvs) - 2  # never -1, as the Merge comes after
+
+                alt.stdin = alt.stdout
+                alt.stdout = ShellFile()
+
+                func = FUNC_BY_VERB[verb]
+                func(argv)
+
+            obytes = alt.stdout.read_bytes()  # runs the lazy Pumps, such as |pq 'EXPR'
+    except Exception as exc:
+        return (b"", f"|pq --files: {pathname}: {type(exc).__name__}: {exc}")
+    except SystemExit as exc:  # as when a Pump has already said why
+        said = stderr.getvalue().rstrip() or f"exit {exc.code}"
+        return (b"", f"|pq --files: {pathname}: {said.removeprefix('|pq: ')}")
+
+    if stderr.getvalue():
+        eprint(stderr.getvalue(), end="")  # passes on what was said, when no Pump failed
+
+    return (obytes, "")
+
+    # sends back Bytes, not Lines, to pickle one Object per File, not one per Line
+    # sends back each Error as a Str, to report it with its Pathname, and go on to the next File
+
+
+#
+# Amp up Import ArgParse
+#
+
+
+class ArgDocParser:
+    """Pick out Prog & Description & Epilog well enough to form an Argument Parser"""
+
+    text: str  # something like the __main__.__doc__, but dedented and stripped
+    parser: argparse.ArgumentParser  # the inner standard ArgumentParser
+    closing: str  # the last Graf of the Epilog, minus its Top Line
+
+    #
+    # Pick apart a Help Doc of Prog & Description & Epilog well enough to form a Parser
+    #
+
+    def __init__(self, doc: str, add_help: bool) -> None:
+        """Pick out Prog & Description & Epilog well enough to form an Argument Parser"""
+
+        assert doc, (doc,)
+
+        text = textwrap.dedent(doc).strip()
+        lines = text.splitlines()
+
+        prog = self.scrape_prog(lines)
+        description = self.scrape_description(lines)
+        epilog = self.scrape_epilog(lines, description=description)
+
+        closing = self.scrape_closing(epilog=epilog)
+        assert closing, (epilog, description, lines)
+
+        parser = argparse.ArgumentParser(  # doesn't distinguish Closing from Epilog
+            prog=prog,
+            description=description,
+            add_help=add_help,
+            formatter_class=argparse.RawTextHelpFormatter,  # lets Lines be wide
+            epilog=epilog,
+        )
+
+        self.text = text
+        self.parser = parser
+        self.closing = closing
+
+        self.add_argument = parser.add_argument  # helps the Caller say '.parser.parser.' less often
+
+        # 'doc=' is the kind of Help Doc that comes from ArgumentParser.format_help
+        # 'add_help=False' for 'cal -h', 'df -h', 'du -h', 'ls -h', etc
+
+        # callers who want Options & Positional Arguments in the Parser have to add them
+
+    def scrape_prog(self, lines: list[str]) -> str:
+        """Pick the Prog out of the Usage Graf that starts the Doc"""
+
+        prog = lines[0].split()[1]  # second Word of first Line  # 'prog' from 'usage: prog'
+
+        return prog
+
+    def scrape_description(self, lines: list[str]) -> str:
+        """Take the first Line of the Graf after the Usage Graf as the Description"""
+
+        firstlines: list[str] = list(_ for _ in lines if _ and (_ == _.lstrip()))
+        alt_description = firstlines[1]  # first Line of second Graf
+
+        description = alt_description
+        if self.docline_is_skippable(alt_description):
+            description = "just do it"
+
+        return description
+
+    def docline_is_skippable(self, docline: str) -> bool:
+        """Guess when a Doc Line can't be the first Line of the Epilog"""
+
+        strip = docline.rstrip()
+
+        skippable = not strip
+        skippable = skippable or strip.startswith(" ")  # includes .startswith("  ")
+        skippable = skippable or strip.startswith("usage")
+        skippable = skippable or strip.startswith("positional arguments")
+        skippable = skippable or strip.startswith("options")  # excludes "optional arguments"
+
+        return skippable
+
+    def scrape_epilog(self, lines: list[str], description: str) -> str | None:
+        """Take up the Lines past Usage, Positional Arguments, & Options, as the Epilog"""
 
         epilog = None
         for index, line in enumerate(lines):
@@ -5835,6 +9044,17 @@ class ArgDocParser:
 def bytes_textify(bytes_: bytes) -> bytes:
     """Keep the Text, but replace the Errors with '?' and drop the enclosing Blanks"""
 
+    size = 3 * len(bytes_) + 100 * bytes_.count(b"\n")  # counts the Split, RStrip, and Join
+    mem_budget_exit_if(size, what="textifying all the Lines")
+
+    # Stay in Bytes when we can
+
+    if bytes_.isascii() and (bytes_.count(b"\r") == bytes_.count(b"\r\n")):
+        if not any((_ in bytes_) for _ in TextifyBytesBreaks):
+            return lines_textify(bytes_.split(b"\n"), newline=b"\n", margin_chars=b" \t")
+
+    # Else decode, textify, and encode
+
     assert unicodedata.lookup("Replacement Character") == "\ufffd"
     decode = bytes_.decode(errors="replace")  # not errors="surrogateescape"
     text = decode.replace("\ufffd", "?")  # U+003F Question-Mark
@@ -5845,6 +9065,196 @@ def bytes_textify(bytes_: bytes) -> bytes:
     return encode
 
 
+#
+# Amp up Import BuiltsIns Iterable[Str]
+#
+
+
+def lines_iter_encode_chunks(
+    lines: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[bytes]:
+    """Encode Lines as if by .write_splitlines, but yield a Chunk of Bytes at a time"""
+
+    for chunk in lines_iter_join_chunks(lines):
+        yield chunk.encode(errors="surrogateescape")
+
+
+def lines_iter_join_chunks(
+    lines: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[str]:
+    """Join Lines as if by .write_splitlines, but yield a Chunk of Chars at a time"""
+
+    batchsize = BatchSize
+
+    it = iter(lines)
+    some = False
+
+    index = 0
+    while True:
+        batch = list(itertools.islice(it, batchsize))
+        if not batch:
+            break
+
+        join = "\n".join(batch)
+        chunk = ("\n" + join) if index else join
+        index += 1
+
+        if chunk:
+            some = True
+            yield chunk
+
+    if some:
+        yield "\n"
+
+    # closes the last Line, but writes no Bytes when the Join is empty, like .write_splitlines
+
+
+LineBreakChars = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"  # as Str.SplitLines
+
+
+def chunks_iter_splitlines(chunks: collections.abc.Iterable[str]) -> collections.abc.Iterator[str]:
+    """Split Chunks of Chars into Lines, as if joined and then split by Str.SplitLines"""
+
+    lists = _chunks_iter_splitlines_lists(chunks)
+    chain = itertools.chain.from_iterable(lists)  # yields each Line without a Python Call per Line
+
+    return chain
+
+
+def _chunks_iter_splitlines_lists(
+    chunks: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[list[str]]:
+    """Split Chunks of Chars into Lists of Lines"""
+
+    line_break_chars = LineBreakChars
+
+    parts: list[str] = list()  # the Chars of the last Line, while not yet closed
+    after_cr = False  # the last Line closed with "\r", which may yet join a "\n"
+
+    for chunk in chunks:
+        if after_cr and chunk:
+            after_cr = False
+            if chunk.startswith("\n"):
+                chunk = chunk[1:]
+
+        if not chunk:
+            continue
+
+        # Hold back the Chars of a Line when not yet closed, else join them once, when closed
+
+        lines = chunk.splitlines()
+
+        last_char = chunk[-1]
+        closed = last_char in line_break_chars
+        if (len(lines) == 1) and not closed:
+            parts.append(chunk)
+            continue
+
+        if parts:
+            lines[0] = "".join(parts) + lines[0]
+
+        parts = list()
+        if closed:
+            after_cr = last_char == "\r"
+        else:
+            parts.append(lines.pop())
+
+        yield lines
+
+    if parts:
+        yield ["".join(parts)]
+
+    # splits only the new Chunk, so a Line across K Chunks costs O(K), not O(K * K)
+
+
+def chunks_iter_split(
+    chunks: collections.abc.Iterable[str], sep: str | None
+) -> collections.abc.Iterator[str]:
+    """Split Chunks of Chars into Words, as if joined and then split by Str.Split"""
+
+    assert sep != "", (sep,)  # Str.Split raises ValueError("empty separator")
+
+    lists = _chunks_iter_split_lists(chunks, sep=sep)
+    chain = itertools.chain.from_iterable(lists)  # yields each Word without a Python Call per Word
+
+    return chain
+
+
+def _chunks_iter_split_lists(
+    chunks: collections.abc.Iterable[str], sep: str | None
+) -> collections.abc.Iterator[list[str]]:
+    """Split Chunks of Chars into Lists of Words"""
+
+    if sep is None:
+        yield from _chunks_iter_split_blanks_lists(chunks)
+        return
+
+    n = len(sep) - 1  # counts the Chars that may start a Sep, at the end of a Chunk
+
+    parts: list[str] = list()  # the Chars of the last Word, while it may yet grow
+    tail = ""  # the last few Chars of the last Word
+
+    for chunk in chunks:
+        text = tail + chunk
+        words = text.split(sep)
+        if len(words) == 1:
+            parts.append(chunk)
+            tail = text[-n:] if n else ""
+            continue
+
+        # Join the Chars of the last Word once, when a Sep closes it
+
+        head = "".join(parts)
+        words[0] = head[: len(head) - len(tail)] + words[0]
+
+        last_word = words.pop()
+        parts = [last_word]
+        tail = last_word[-n:] if n else ""
+
+        yield words
+
+    yield ["".join(parts)]  # may be empty, like the Str.Split of an empty Str by a Sep
+
+    # splits only the new Chunk, so a Word across K Chunks costs O(K), not O(K * K)
+
+
+def _chunks_iter_split_blanks_lists(
+    chunks: collections.abc.Iterable[str],
+) -> collections.abc.Iterator[list[str]]:
+    """Split Chunks of Chars into Lists of Words, between runs of Blanks"""
+
+    parts: list[str] = list()  # the Chars of the last Word, while it may yet grow
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        words = chunk.split()
+        opened = not chunk[0].isspace()  # continues the last Word, if any
+        closed = chunk[-1].isspace()
+
+        # Hold back the Chars of a Word when it may yet grow, else join them once, when closed
+
+        if parts:
+            if opened and (len(words) == 1) and not closed:
+                parts.append(chunk)
+                continue
+
+            head = "".join(parts)
+            if opened:
+                words[0] = head + words[0]
+            else:
+                words.insert(0, head)
+
+        parts = list()
+        if not closed:
+            parts.append(words.pop())
+
+        yield words
+
+    if parts:
+        yield ["".join(parts)]
+
+
 #
 # Amp up Import BuiltsIns List[Object] and List[Str]
 #
@@ -5884,19 +9294,21 @@ def list_str_diffs(a: list[str], b: list[str]) -> list[str]:
 def str_textify(text: str) -> str:
     """Keep the Text, but drop the enclosing Blanks"""
 
-    dedent = textwrap.dedent(text)
-    splitlines = dedent.splitlines()
-    rstrips = list(_.rstrip() for _ in splitlines)
+    # Fall back to the slow Textify, when Line-Breaks other than "\n" and "\r\n" show up
 
-    while rstrips and not rstrips[0]:
-        rstrips.pop(0)
-    while rstrips and not rstrips[-1]:
-        rstrips.pop()
+    if text.count("\r") != text.count("\r\n"):
+        return str_textify_splitlines(text)
+    if any((_ in text) for _ in TextifyStrBreaks):
+        return str_textify_splitlines(text)
 
-    join = "\n".join(rstrips)
-    join_plus = (join + "\n") if join else ""
+    # Else textify in one Pass to read, and one Pass to write
 
-    return join_plus
+    size = 3 * len(text) + 100 * text.count("\n")  # counts the Split, RStrip, and Join
+    mem_budget_exit_if(size, what="textifying all the Lines")
+
+    textify = lines_textify(text.split("\n"), newline="\n", margin_chars=" \t")
+
+    return textify
 
     # doesn't start with Blank Columns, doesn't end any Lines with Blank Chars
     # doesn't start with Empty Lines, doesn't end with Empty Lines
@@ -5917,6 +9329,84 @@ def str_textify(text: str) -> str:
     #
 
 
+TextifyBytesBreaks = b"\x0B\x0C\x1C\x1D\x1E\x1F"  # Str.RStrip drops \x1F, Bytes.RStrip doesn't
+TextifyStrBreaks = "\x0B\x0C\x1C\x1D\x1E\x85\u2028\u2029"  # Str.SplitLines splits at these
+
+
+def str_textify_splitlines(text: str) -> str:
+    """Keep the Text, but drop the enclosing Blanks, and split at every kind of Line-Break"""
+
+    dedent = textwrap.dedent(text)
+    splitlines = dedent.splitlines()
+    rstrips = list(_.rstrip() for _ in splitlines)
+
+    while rstrips and not rstrips[-1]:
+        rstrips.pop()
+    rstrips.reverse()
+    while rstrips and not rstrips[-1]:
+        rstrips.pop()
+    rstrips.reverse()
+
+    join = "\n".join(rstrips)
+    join_plus = (join + "\n") if join else ""
+
+    return join_plus
+
+
+def lines_textify(
+    lines: list[typing.AnyStr], newline: typing.AnyStr, margin_chars: typing.AnyStr
+) -> typing.AnyStr:
+    """Dedent, RStrip, and drop the leading & trailing Blank Lines, of Lines split at Newline"""
+
+    blank = newline[:0]
+
+    # Find the first & last Lines that aren't Blank
+
+    first = 0
+    while (first < len(lines)) and ((not lines[first]) or lines[first].isspace()):
+        first += 1
+
+    last = len(lines) - 1
+    while (last >= first) and ((not lines[last]) or lines[last].isspace()):
+        last -= 1
+
+    if last < first:
+        return blank
+
+    # Find the Margin of Blanks that starts every Line, except the Lines of only Margin Chars
+
+    margin: typing.AnyStr | None = None
+    for line in lines:
+        if margin is None:
+            lstrip = line.lstrip(margin_chars)
+            if lstrip:
+                margin = line[: len(line) - len(lstrip)]
+        elif line and not line.startswith(margin):
+            if line.lstrip(margin_chars):
+                index = 0
+                while line[index : index + 1] == margin[index : index + 1]:
+                    index += 1
+                margin = margin[:index]
+
+        if (margin is not None) and not margin:
+            break
+
+    # Write each Line once, and close with a Line-Break
+
+    texts: collections.abc.Iterable[typing.AnyStr] = lines[first : (last + 1)]
+    if margin:
+        texts = map(operator.itemgetter(slice(len(margin), None)), texts)
+
+    rstrips = list(map(type(newline).rstrip, texts))  # maps without a Python Loop
+    rstrips.append(blank)
+
+    join = newline.join(rstrips)
+
+    return join
+
+    # matches .textwrap.dedent of Python 3.11, at Lines of " \t" Blanks vs other Blanks
+
+
 #
 # Amp up Import DateTime as DT
 #
@@ -5965,6 +9455,67 @@ def dt_timedelta_strftime(td: dt.timedelta, depth: int = 2, str_zero: str = "0s"
     return chars  # '9ms331us' to mean 9ms 331us <= t < 9ms 333us
 
 
+#
+# Amp up Import IO
+#
+
+
+# LineBreakBytesRegex splits Bytes at the same Line-Break's as Str.SplitLines splits Chars
+LineBreakBytesRegex = rb"\r\n|[\n\r\x0B\x0C\x1C\x1D\x1E]|\xC2\x85|\xE2\x80[\xA8\xA9]"
+
+LineBreakBytesPattern = re.compile(LineBreakBytesRegex)
+
+
+def binary_file_iter_reversed_splitlines(
+    file: typing.BinaryIO, blocksize: int
+) -> collections.abc.Iterator[str]:
+    """Yield the Lines of a seekable File in reverse order, reading Blocks back from the end"""
+
+    pattern = LineBreakBytesPattern
+
+    start = file.tell()
+    pos = file.seek(0, os.SEEK_END)
+
+    data = b""
+    while True:
+
+        # Prepend one more Block, till none left
+
+        if pos > start:
+            n = min(blocksize, pos - start)
+            pos -= n
+            file.seek(pos)
+            data = file.read(n) + data
+
+        # Find the Line-Breaks, but not the first few that could yet join with Bytes before them
+
+        matches = list(pattern.finditer(data))
+        if pos > start:
+            matches = list(_ for _ in matches if _.start() >= 3)
+
+        # Yield each Line that follows a Line-Break, from last to first
+
+        stop = len(data)
+        for m in reversed(matches):
+            obytes = data[m.end() : stop]
+            if obytes or (stop < len(data)):  # drops the empty Line after the last Line-Break
+                yield obytes.decode(errors="surrogateescape")
+            stop = m.start()
+
+        # Yield the first Line at the start of the File, else keep it to join the next Block
+
+        if pos <= start:
+            if data:
+                yield data[:stop].decode(errors="surrogateescape")
+            break
+
+        if matches:
+            data = data[: matches[0].end()]
+
+    # yields the same Lines as .decode(errors="surrogateescape").splitlines(), but reversed
+    # holds about one Block in memory, except to hold a whole Line longer than a Block
+
+
 #
 # Amp up Import PathLib
 #
@@ -5974,7 +9525,11 @@ def pathlib_path_read_version(pathname: str) -> str:
     """Hash the Bytes of a File down to a purely Decimal $Major.$Minor.$Micro Version Str"""
 
     path = pathlib.Path(pathname)
-    path_bytes = path.read_bytes()
+    if path.exists():
+        path_bytes = path.read_bytes()
+    else:  # reads the Source kept beside the Bytecode inside a Zip App, such as bin/xshverb.pyz
+        assert __spec__ and isinstance(__spec__.loader, zipimport.zipimporter), (__spec__,)
+        path_bytes = __spec__.loader.get_data(pathname.removesuffix("c"))
 
     hasher = hashlib.md5()
     hasher.update(path_bytes)
@@ -5993,6 +9548,187 @@ def pathlib_path_read_version(pathname: str) -> str:
     # 0.15.255
 
 
+#
+# Amp up Import Sys Stdin
+#
+
+
+def binary_file_iter_chunks(file: typing.BinaryIO, blocksize: int) -> collections.abc.Iterator[str]:
+    """Read Chars from a Binary File, one Chunk at a time, and leave the File open"""
+
+    errors = "surrogateescape"
+    reader = io.TextIOWrapper(file, encoding="utf-8", errors=errors, newline="")
+    try:
+        while True:
+            chunk = reader.read(blocksize)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        reader.detach()  # leaves the File open, to seek and read again
+
+    # decodes as UTF-8 with errors="surrogateescape", like .read_text, without changing Line-Breaks
+
+
+def stdin_iter_chunks(blocksize: int) -> collections.abc.Iterator[str]:
+    """Read Chars from Stdin, one Chunk at a time"""
+
+    with stdin_open_decompressed() as reader:
+        yield from binary_file_iter_chunks(reader, blocksize=blocksize)
+
+    # decodes as UTF-8 with errors="surrogateescape", like .read_text, without changing Line-Breaks
+
+
+#
+# Amp up Import BZ2, Import GZip, and Import LZMA
+#
+
+
+BZip2Magic = b"BZh"  # then b"1" .. b"9" for the Block Size, then a Block or the End
+BZip2BlockMagic = b"1AY&SY"  # the Digits of Pi, as Binary-Coded Decimal
+BZip2EndMagic = b"\x17rE8P\x90"  # the Digits of the Square Root of Pi
+GzipMagic = b"\x1f\x8b\x08"  # then Flags
+XzMagic = b"\xfd7zXZ\x00"
+
+MagicSize = len(BZip2Magic) + 1 + len(BZip2BlockMagic)  # the most Bytes we sniff
+
+DecompressErrors = (EOFError, OSError, lzma.LZMAError, zlib.error)
+
+
+class BytesThenFileRawReader(io.RawIOBase):
+    """Read some Bytes first, and then the rest of a File, as one Raw Stream"""
+
+    def __init__(self, head: bytes, file: io.BufferedReader) -> None:
+        self.head = head
+        self.file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: typing.Any) -> int:
+        view = memoryview(b).cast("B")
+
+        data = self.head[: len(view)]
+        self.head = self.head[len(data) :]
+        if not data:
+            data = self.file.read1(len(view))
+
+        view[: len(data)] = data
+
+        return len(data)
+
+
+def stdin_open_decompressed() -> typing.BinaryIO:
+    """Open Stdin to read Bytes, and decompress them if need be"""
+
+    fd = sys.stdin.fileno()
+    reader = open(fd, "rb", closefd=False)
+    ireader = binary_file_decompress_if(reader)
+
+    return ireader
+
+    # the Caller may close the File, and doesn't close Stdin by closing it
+
+
+def binary_file_decompress_if(file: io.BufferedReader) -> typing.BinaryIO:
+    """Decompress the Bytes of a File, if they start like BZip2, Gzip, or Xz, else don't"""
+
+    # Peek at the first few Bytes, but read a Pipe till we have enough of them
+
+    head = file.peek(MagicSize)
+    if len(head) < MagicSize:
+        head = file.read(MagicSize)  # blocks till enough Bytes, or till End-of-Input
+        file = io.BufferedReader(BytesThenFileRawReader(head, file=file), buffer_size=BlockSize)
+        head = file.peek(MagicSize)
+
+    # Decompress, when the Bytes start like a compressed Stream, and the Decompressor agrees
+
+    compression = bytes_compression_if(head)
+
+    ifile: typing.BinaryIO = file
+    if compression == "gzip":
+        ifile = typing.cast(typing.BinaryIO, gzip.GzipFile(fileobj=file, mode="rb"))
+    elif compression == "bz2":
+        ifile = typing.cast(typing.BinaryIO, bz2.BZ2File(file, mode="rb"))
+    elif compression == "xz":
+        ifile = typing.cast(typing.BinaryIO, lzma.LZMAFile(file, mode="rb"))
+
+    return ifile
+
+    # peeks without reading, so nothing is lost when the Bytes aren't compressed
+    # streams a Block at a time, so never holds all the compressed Bytes in Memory
+
+
+def binary_file_is_compressed(file: io.BufferedReader) -> bool:
+    """Say if the Bytes of a File start like BZip2, Gzip, or Xz"""
+
+    head = file.peek(MagicSize)  # comes up short at a Pipe, but not at a File
+    compressed = bool(bytes_compression_if(head))
+
+    return compressed
+
+
+def bytes_compression_if(head: bytes) -> str:
+    """Say 'bz2', 'gzip', or 'xz', when the Bytes start so, and begin to decompress, else ''"""
+
+    compression = ""
+    if head.startswith(GzipMagic):
+        compression = "gzip"
+    elif head.startswith(XzMagic):
+        compression = "xz"
+    elif head.startswith(BZip2Magic) and head[3:4] and (head[3:4] in b"123456789"):
+        if head[4:MagicSize] in (BZip2BlockMagic, BZip2EndMagic):
+            compression = "bz2"
+
+    if not compression:
+        return ""
+
+    # Require the Decompressor to take the first Bytes, else take them as not compressed
+
+    try:
+        if compression == "gzip":
+            zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, BlockSize)
+        elif compression == "bz2":
+            bz2.BZ2Decompressor().decompress(head, max_length=BlockSize)
+        else:
+            lzma.LZMADecompressor().decompress(head, max_length=BlockSize)
+    except DecompressErrors:
+        return ""
+
+    return compression
+
+    # tries only the Bytes peeked, and decompresses at most one Block of them
+
+
+def bytes_decompress_if(data: bytes) -> bytes:
+    """Decompress Bytes, if they start like BZip2, Gzip, or Xz, else don't"""
+
+    if not bytes_compression_if(data[:BlockSize]):
+        return data
+
+    try:
+        with binary_file_decompress_if(io.BufferedReader(io.BytesIO(data))) as ifile:
+            idata = ifile.read()
+    except DecompressErrors:
+        return data  # falls back to the Bytes, when they only began like compressed Bytes
+
+    return idata
+
+
+def chunks_iter_gzip(chunks: collections.abc.Iterable[bytes]) -> collections.abc.Iterator[bytes]:
+    """Compress Chunks of Bytes into Chunks of one Gzip Stream"""
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # as 'gzip -6'
+    for chunk in chunks:
+        ochunk = compressor.compress(chunk)
+        if ochunk:
+            yield ochunk
+
+    yield compressor.flush()
+
+    # 16 + zlib.MAX_WBITS asks for a Gzip Header and Trailer, not a Zlib Header and Trailer
+
+
 #
 # Amp up Import Select, or Import Termios, or Import Tty
 #
@@ -6181,6 +9917,7 @@ assert __doc__, (__doc__,)
 DOC_BY_VERB = dict(
     awk=AWK_DOC,
     cat=CAT_DOC,
+    column=COLUMN_DOC,
     counter=COUNTER_DOC,
     dedent=DEDENT_DOC,
     dent=DENT_DOC,
@@ -6210,6 +9947,7 @@ DOC_BY_VERB = dict(
     upper=UPPER_DOC,
     urllib=URLLIB_DOC,
     vi=VI_DOC,
+    watch=WATCH_DOC,
     wcl=WCL_DOC,
     xargs=XARGS_DOC,
     xshverb=XSHVERB_DOC,
@@ -6224,6 +9962,7 @@ for _K_ in DOC_BY_VERB.keys():
 FUNC_BY_VERB = dict(
     awk=do_awk,
     cat=do_cat,
+    column=do_column,
     counter=do_counter,
     dedent=do_dedent,
     dent=do_dent,
@@ -6253,6 +9992,7 @@ FUNC_BY_VERB = dict(
     upper=do_upper,
     urllib=do_urllib,
     vi=do_vi,
+    watch=do_watch,
     wcl=do_wcl,
     xargs=do_xargs,
     xshverb=do_xshverb,
@@ -6286,6 +10026,7 @@ VERB_BY_VB = {  # lists the abbreviated or unabbreviated Aliases of each Shell V
     "w": "wcl",
     "x": "xargs",
     "xshverb.py": "xshverb",
+    "xshverb.pyz": "xshverb",  # as built by:  make pyz
     "|": "xshverb",
 }
 